@@ -16,6 +16,7 @@ Public API (for use as a library):
 
 from leap.core import (
     aggregate_results,
+    append_results,
     detect_language,
     discover_files,
     filter_changed_files,
@@ -42,6 +43,7 @@ __all__ = [
     "filter_changed_files",
     "detect_language",
     "aggregate_results",
+    "append_results",
     "load_raw_logs",
     "merge_results",
 ]
@@ -4,9 +4,12 @@ import hashlib
 import json
 import logging
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
+
+import orjson
 
 from .batch_processor import process_batch
+from .checkpoint import AnalysisCheckpoint
 from .config import AnalyzerConfig
 from .providers import TokenUsage, get_provider
 from .validators import is_fallback_response, validate_llm_response
@@ -14,6 +17,11 @@ from .validators import is_fallback_response, validate_llm_response
 logger = logging.getLogger(__name__)
 
 
+def _source_file(entry: dict[str, Any]) -> str:
+    """Build the "path:line" source reference for a log entry."""
+    return f"{entry.get('file_path', '')}:{entry.get('line_number', 0)}"
+
+
 class TokenAccumulator:
     """Accumulates token usage statistics across multiple API calls."""
 
@@ -66,7 +74,7 @@ class AnalysisCache:
         self._hits = 0
         self._misses = 0
 
-    def _compute_key(self, entry: dict[str, Any]) -> str:
+    def key(self, entry: dict[str, Any]) -> str:
         """Compute cache key from log entry.
 
         Args:
@@ -97,7 +105,7 @@ class AnalysisCache:
         if not self.enabled:
             return None
 
-        key = self._compute_key(entry)
+        key = self.key(entry)
         result = self._cache.get(key)
 
         if result:
@@ -118,7 +126,7 @@ class AnalysisCache:
         if not self.enabled:
             return
 
-        key = self._compute_key(entry)
+        key = self.key(entry)
         self._cache[key] = result
 
     def stats(self) -> dict[str, int | float]:
@@ -166,7 +174,6 @@ class LogAnalyzer:
         self.cache = AnalysisCache(enabled=config.enable_cache)
         self.token_usage = TokenAccumulator()
         self.prompts = self._load_prompts()
-        self._analyzed_sources: set[str] = set()  # Track analyzed source_file for resume
 
     def _load_prompts(self) -> dict[str, str]:
         """Load prompt templates from files.
@@ -233,7 +240,8 @@ class LogAnalyzer:
         # Check cache first
         cached = self.cache.get(entry)
         if cached:
-            return cached
+            # Same template elsewhere: reuse the analysis, keep this entry's location
+            return {**cached, "source_file": _source_file(entry)}
 
         try:
             # Build prompt
@@ -266,7 +274,7 @@ class LogAnalyzer:
                 "severity": validated.severity,
                 "suggested_action": validated.suggested_action,
                 "language": entry.get("language", ""),
-                "source_file": f"{entry.get('file_path', '')}:{entry.get('line_number', 0)}"
+                "source_file": _source_file(entry)
             }
 
             # Cache if not a fallback response
@@ -287,26 +295,69 @@ class LogAnalyzer:
                 "severity": "UNKNOWN",
                 "suggested_action": None,
                 "language": entry.get("language", ""),
-                "source_file": f"{entry.get('file_path', '')}:{entry.get('line_number', 0)}"
+                "source_file": _source_file(entry)
             }
 
-    async def analyze_batch(self, entries: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+    async def analyze_batch(
+        self,
+        entries: list[dict[str, Any]],
+        checkpoint: AnalysisCheckpoint | None = None,
+        indices: list[int] | None = None
+    ) -> list[dict[str, Any] | None]:
         """Analyze multiple entries in parallel.
 
+        When caching is enabled, identical entries (same cache key) are sent to
+        the provider once and the result is copied to every duplicate. Otherwise
+        concurrent duplicates would all miss the cache.
+
         Args:
             entries: List of log entries
+            checkpoint: Optional checkpoint log; each result is appended as soon
+                as it completes
+            indices: Checkpoint keys for entries (their positions in the input
+                file). Defaults to range(len(entries))
 
         Returns:
             List of analyzed entries (same order as input)
         """
         logger.info(f"Analyzing {len(entries)} log entries with concurrency={self.config.concurrency}")
 
-        results: list[dict[str, Any] | None] = await process_batch(
-            entries,
-            self.analyze_entry,
+        keys = indices if indices is not None else list(range(len(entries)))
+
+        # Group positions of identical entries
+        groups: list[list[int]]
+        if self.cache.enabled:
+            by_key: dict[str, list[int]] = {}
+            for pos, entry in enumerate(entries):
+                by_key.setdefault(self.cache.key(entry), []).append(pos)
+            groups = list(by_key.values())
+            if len(groups) < len(entries):
+                logger.info(f"Deduplicated {len(entries)} entries to {len(groups)} unique requests")
+        else:
+            groups = [[pos] for pos in range(len(entries))]
+
+        results: list[dict[str, Any] | None] = [None] * len(entries)
+
+        async def analyze_group(group: list[int]) -> None:
+            first = group[0]
+            result = await self.analyze_entry(entries[first])
+            for pos in group:
+                entry_result = (
+                    result if pos == first
+                    else {**result, "source_file": _source_file(entries[pos])}
+                )
+                results[pos] = entry_result
+                if checkpoint is not None:
+                    checkpoint.append(keys[pos], entry_result, self.token_usage.to_dict())
+
+        # Failed groups keep None results
+        await process_batch(
+            groups,
+            analyze_group,
             concurrency=self.config.concurrency,
             show_progress=True,
-            on_error="continue"  # Continue on errors, return None for failed items
+            on_error="continue",  # Continue on errors, return None for failed items
+            weights=[len(group) for group in groups]  # Progress counts entries, not requests
         )
 
         # Log cache statistics
@@ -318,74 +369,57 @@ class LogAnalyzer:
 
         return results
 
-    def _get_partial_path(self, output_path: str) -> Path:
-        """Get path for partial results file.
+    async def close(self) -> None:
+        """Release provider connections (HTTP pools) held by the analyzer."""
+        await self.provider.close()
+
+    def _get_checkpoint_path(self, output_path: str) -> Path:
+        """Get path for the checkpoint log.
 
         Args:
             output_path: Final output path
 
         Returns:
-            Path to partial results file
+            Path to checkpoint file (NDJSON, next to the output)
         """
         output = Path(output_path)
-        return output.parent / f"{output.stem}.partial{output.suffix}"
-
-    def _load_partial_results(self, partial_path: Path) -> tuple[list[dict[str, Any]], dict[str, Any]] | None:
-        """Load partial results from previous run.
-
-        Args:
-            partial_path: Path to partial results file
-
-        Returns:
-            Tuple of (results, metadata) if partial file exists, None otherwise
-        """
-        if not partial_path.exists():
-            return None
-
-        try:
-            with open(partial_path, encoding="utf-8") as f:
-                data = json.load(f)
+        return output.parent / f"{output.stem}.partial.ndjson"
 
-            results = data.get("analyzed_logs", [])
-            metadata = data.get("metadata", {})
-
-            # Track which sources were already analyzed
-            for result in results:
-                source = result.get("source_file", "")
-                if source:
-                    self._analyzed_sources.add(source)
-
-            logger.info(f"Loaded {len(results)} partial results from {partial_path}")
-            return (results, metadata)
-
-        except Exception as e:
-            logger.warning(f"Failed to load partial results: {e}. Starting fresh.")
-            return None
-
-    def _save_partial_results(
+    def _load_checkpoint(
         self,
-        partial_path: Path,
-        results: list[dict[str, Any]],
-        metadata: dict[str, Any]
+        checkpoint: AnalysisCheckpoint,
+        entries: list[dict[str, Any]]
     ) -> None:
-        """Save partial results to file.
+        """Load checkpointed results and check they belong to this input.
 
         Args:
-            partial_path: Path to save partial results
-            results: List of analyzed log entries
-            metadata: Analysis metadata
+            checkpoint: Checkpoint to load into
+            entries: Log entries of the current input file
         """
         try:
-            output_data = {
-                "analyzed_logs": results,
-                "metadata": metadata
-            }
+            checkpoint.load()
+        except Exception as e:
+            logger.warning(f"Failed to load checkpoint: {e}. Starting fresh.")
+            checkpoint.clear()
+            return
 
-            with open(partial_path, "w", encoding="utf-8") as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # The input may have changed since the checkpoint was written
+        for idx, result in checkpoint.results.items():
+            source = _source_file(entries[idx]) if 0 <= idx < len(entries) else None
+            if result.get("source_file") != source:
+                logger.warning(
+                    f"Checkpoint {checkpoint.path} does not match {len(entries)} input "
+                    f"entries. Starting fresh."
+                )
+                checkpoint.clear()
+                checkpoint.path.unlink(missing_ok=True)
+                return
 
-        except Exception as e:
-            logger.warning(f"Failed to save partial results: {e}")
+        # Restore token usage accumulated by the previous run
+        usage_data = checkpoint.token_usage
+        self.token_usage.input_tokens = usage_data.get("input_tokens", 0)
+        self.token_usage.output_tokens = usage_data.get("output_tokens", 0)
+        self.token_usage.total_tokens = usage_data.get("total_tokens", 0)
 
     async def analyze_file(
         self,
@@ -395,6 +429,10 @@ class LogAnalyzer:
     ) -> dict[str, Any]:
         """Main entry point: analyze raw_logs.json → analyzed_logs.json.
 
+        Completed results are appended to a checkpoint log
+        (``<output>.partial.ndjson``) while the run is in progress, so an
+        interrupted run can be continued with resume=True.
+
         Args:
             input_path: Path to raw_logs.json
             output_path: Path to output analyzed_logs.json
@@ -412,8 +450,12 @@ class LogAnalyzer:
         if not input_file.exists():
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
-        with open(input_file) as f:
-            data = json.load(f)
+        raw = input_file.read_bytes()
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Newline-delimited JSON (leap extract --ndjson)
+            data = [orjson.loads(line) for line in raw.splitlines() if line.strip()]
 
         # Handle both formats: list directly or {"logs": [...]}
         if isinstance(data, list):
@@ -428,36 +470,23 @@ class LogAnalyzer:
 
         logger.info(f"Loaded {len(entries)} log entries from {input_path}")
 
-        # 2. Try to resume from partial results
-        partial_path = self._get_partial_path(output_path)
-        partial_results: list[dict[str, Any]] = []
+        # 2. Try to resume from the checkpoint log
+        checkpoint = AnalysisCheckpoint(self._get_checkpoint_path(output_path), len(entries))
 
         if resume:
-            partial_data = self._load_partial_results(partial_path)
-            if partial_data:
-                partial_results, partial_metadata = partial_data
-                # Restore token usage from partial metadata
-                if "token_usage" in partial_metadata:
-                    usage_data = partial_metadata["token_usage"]
-                    self.token_usage.input_tokens = usage_data.get("input_tokens", 0)
-                    self.token_usage.output_tokens = usage_data.get("output_tokens", 0)
-                    self.token_usage.total_tokens = usage_data.get("total_tokens", 0)
-
-                # Filter entries to only process unanalyzed ones
-                entries_to_process = [
-                    e for e in entries
-                    if f"{e.get('file_path', '')}:{e.get('line_number', 0)}" not in self._analyzed_sources
-                ]
-
-                if len(entries_to_process) < len(entries):
-                    logger.info(
-                        f"Resuming: {len(partial_results)} already analyzed, "
-                        f"{len(entries_to_process)} remaining"
-                    )
-                    entries = entries_to_process
+            self._load_checkpoint(checkpoint, entries)
+        else:
+            checkpoint.path.unlink(missing_ok=True)
+
+        pending = [i for i in range(len(entries)) if i not in checkpoint]
+        if checkpoint:
+            logger.info(
+                f"Resuming: {len(checkpoint)} already analyzed, "
+                f"{len(pending)} remaining"
+            )
 
         # 3. Health check (only if there are entries to process)
-        if entries:
+        if pending:
             logger.info(f"Performing health check for provider: {self.config.provider}")
             if not await self.provider.health_check():
                 raise RuntimeError(
@@ -466,33 +495,27 @@ class LogAnalyzer:
                 )
             logger.info("Health check passed")
 
-            # 4. Process batch (save partial results on error)
+            # 4. Process batch; every completed result is already on disk
+            checkpoint.open()
             try:
-                new_results = await self.analyze_batch(entries)
-                # 5. Merge with partial results
-                # Cast partial_results to allow concatenation with new_results
-                results: list[dict[str, Any] | None] = (
-                    cast(list[dict[str, Any] | None], partial_results) + new_results
+                await self.analyze_batch(
+                    [entries[i] for i in pending],
+                    checkpoint=checkpoint,
+                    indices=pending
                 )
             except Exception as e:
-                # Save partial results before re-raising
                 logger.error(f"Analysis interrupted: {e}")
-                if partial_results:
-                    # Build temporary metadata
-                    temp_metadata: dict[str, Any] = {
-                        "provider": self.config.provider,
-                        "model": self.config.model,
-                        "language": self.config.language,
-                        "total_entries": len(partial_results),
-                        "token_usage": self.token_usage.to_dict(),
-                        "status": "interrupted"
-                    }
-                    self._save_partial_results(partial_path, partial_results, temp_metadata)
-                    logger.info(f"Saved {len(partial_results)} partial results before exit")
+                logger.info(f"Saved {len(checkpoint)} partial results before exit")
                 raise
+            finally:
+                checkpoint.close()
         else:
             logger.info("All entries already analyzed, using partial results")
-            results = cast(list[dict[str, Any] | None], partial_results)
+
+        # Keep the original input order
+        results: list[dict[str, Any] | None] = [
+            checkpoint.results.get(i) for i in range(len(entries))
+        ]
 
         # 4. Count successes and failures
         successful = sum(1 for r in results if r and not r["analysis"].startswith("[Analysis failed:"))
@@ -519,13 +542,8 @@ class LogAnalyzer:
         with open(output_file, "w", encoding="utf-8") as f:
             json.dump(output_data, f, indent=2, ensure_ascii=False)
 
-        # Clean up partial results file on successful completion
-        if partial_path.exists():
-            try:
-                partial_path.unlink()
-                logger.info(f"Removed partial results file: {partial_path}")
-            except Exception as e:
-                logger.warning(f"Failed to remove partial results file: {e}")
+        # Clean up the checkpoint log on successful completion
+        checkpoint.remove()
 
         logger.info(f"Analysis complete: {output_path}")
         logger.info(f"Success: {successful}/{len(results)} ({successful/len(results)*100:.1f}%)")
@@ -2,7 +2,6 @@
 
 import asyncio
 import logging
-from asyncio import Semaphore
 from collections.abc import Callable
 from typing import Any, TypeVar
 
@@ -16,6 +15,8 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 
+from leap.utils import semaphore_gather
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -59,21 +60,22 @@ class ProgressTracker:
                 failed=0
             )
 
-    async def increment(self, success: bool = True) -> None:
+    async def increment(self, success: bool = True, advance: int = 1) -> None:
         """Increment progress counter.
 
         Args:
             success: Whether the item was processed successfully
+            advance: Progress units the item counts for
         """
         async with self._lock:
-            self.completed += 1
+            self.completed += advance
             if not success:
-                self.failed += 1
+                self.failed += advance
 
             if self.show_progress and self.progress and self.task_id is not None:
                 self.progress.update(
                     self.task_id,
-                    advance=1,
+                    advance=advance,
                     failed=self.failed
                 )
 
@@ -88,7 +90,8 @@ async def process_batch(
     processor: Callable[[T], Any],
     concurrency: int = 10,
     show_progress: bool = True,
-    on_error: str = "continue"
+    on_error: str = "continue",
+    weights: list[int] | None = None
 ) -> list[R | None]:
     """Process items in parallel with concurrency limit.
 
@@ -104,6 +107,8 @@ async def process_batch(
         on_error: How to handle errors ("continue" or "raise")
             - "continue": Log error and continue with next items
             - "raise": Stop processing and raise the first error
+        weights: Progress units per item, e.g. the number of entries an item
+            stands for (default: 1 each)
 
     Returns:
         List of results (same order as input items)
@@ -130,40 +135,36 @@ async def process_batch(
         return []
 
     total = len(items)
-    semaphore = Semaphore(concurrency)
-    progress = ProgressTracker(total, show_progress)
+    progress = ProgressTracker(sum(weights) if weights is not None else total, show_progress)
     results: list[R | None] = [None] * total  # Pre-allocate results list
 
-    async def process_with_limit(index: int, item: T) -> None:
-        """Process single item with semaphore limit and progress tracking."""
-        async with semaphore:
-            try:
-                result = await processor(item)
-                results[index] = result
-                await progress.increment(success=True)
+    async def process_one(index: int, item: T) -> None:
+        """Process single item with progress tracking."""
+        advance = weights[index] if weights is not None else 1
+        try:
+            result = await processor(item)
+            results[index] = result
+            await progress.increment(success=True, advance=advance)
 
-            except Exception as e:
-                logger.error(
-                    f"Error processing item {index + 1}/{total}: {e}",
-                    exc_info=True
-                )
-                await progress.increment(success=False)
-
-                if on_error == "raise":
-                    raise
-                else:
-                    # on_error == "continue": keep None in results
-                    results[index] = None
+        except Exception as e:
+            logger.error(
+                f"Error processing item {index + 1}/{total}: {e}",
+                exc_info=True
+            )
+            await progress.increment(success=False, advance=advance)
 
-    # Create tasks for all items with their indices
-    tasks = [
-        process_with_limit(i, item)
-        for i, item in enumerate(items)
-    ]
+            if on_error == "raise":
+                raise
+            else:
+                # on_error == "continue": keep None in results
+                results[index] = None
 
-    # Execute all tasks
+    # Execute all items, at most `concurrency` at a time
     try:
-        await asyncio.gather(*tasks)
+        await semaphore_gather(
+            concurrency,
+            *(process_one(i, item) for i, item in enumerate(items))
+        )
     finally:
         progress.finish()
 
@@ -211,50 +212,45 @@ async def process_batch_with_retry(
         return [], []
 
     total = len(items)
-    semaphore = Semaphore(concurrency)
     progress = ProgressTracker(total, show_progress)
     results: list[R | None] = [None] * total
     failed_items: list[tuple[int, T, Exception | None]] = []
 
     async def process_with_retry(index: int, item: T) -> None:
         """Process item with retry logic."""
-        async with semaphore:
-            last_error = None
-
-            for attempt in range(max_retries):
-                try:
-                    result = await processor(item)
-                    results[index] = result
-                    await progress.increment(success=True)
-                    return  # Success
-
-                except Exception as e:
-                    last_error = e
-                    logger.warning(
-                        f"Item {index + 1}/{total} failed "
-                        f"(attempt {attempt + 1}/{max_retries}): {e}"
-                    )
-
-                    if attempt < max_retries - 1:
-                        # Wait before retry (exponential backoff)
-                        await asyncio.sleep(2 ** attempt)
-
-            # All retries exhausted
-            logger.error(
-                f"Item {index + 1}/{total} failed after {max_retries} attempts"
-            )
-            failed_items.append((index, item, last_error))
-            await progress.increment(success=False)
+        last_error = None
+
+        for attempt in range(max_retries):
+            try:
+                result = await processor(item)
+                results[index] = result
+                await progress.increment(success=True)
+                return  # Success
 
-    # Create tasks
-    tasks = [
-        process_with_retry(i, item)
-        for i, item in enumerate(items)
-    ]
+            except Exception as e:
+                last_error = e
+                logger.warning(
+                    f"Item {index + 1}/{total} failed "
+                    f"(attempt {attempt + 1}/{max_retries}): {e}"
+                )
+
+                if attempt < max_retries - 1:
+                    # Wait before retry (exponential backoff)
+                    await asyncio.sleep(2 ** attempt)
 
-    # Execute
+        # All retries exhausted
+        logger.error(
+            f"Item {index + 1}/{total} failed after {max_retries} attempts"
+        )
+        failed_items.append((index, item, last_error))
+        await progress.increment(success=False)
+
+    # Execute (retries keep their concurrency slot, as before)
     try:
-        await asyncio.gather(*tasks)
+        await semaphore_gather(
+            concurrency,
+            *(process_with_retry(i, item) for i, item in enumerate(items))
+        )
     finally:
         progress.finish()
 
@@ -0,0 +1,124 @@
+"""Append-only checkpoint log for resumable analysis runs.
+
+Every completed entry is appended as one NDJSON record
+``{"idx": i, "result": {...}, "token_usage": {...}}`` and fsync'ed, so the
+per-result I/O cost stays constant no matter how many entries were already
+analyzed. On resume the log is read once to rebuild the completed results.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisCheckpoint:
+    """Write-ahead log of analysis results, keyed by input entry index."""
+
+    def __init__(self, path: Path, size: int):
+        """Initialize checkpoint.
+
+        Args:
+            path: Path to the NDJSON checkpoint file
+            size: Number of entries in the input file
+        """
+        self.path = path
+        self.size = size
+        self.results: dict[int, dict[str, Any]] = {}
+        # Completed indices as a bitset: 1 bit per entry instead of a set of ints
+        self._done = bytearray((size + 7) >> 3)
+        self.token_usage: dict[str, int] = {}
+        self._fd: int | None = None
+
+    def __contains__(self, idx: int) -> bool:
+        """Check whether the entry at the given index is already analyzed."""
+        return 0 <= idx < self.size and bool(self._done[idx >> 3] & (1 << (idx & 7)))
+
+    def __len__(self) -> int:
+        """Return the number of completed entries."""
+        return len(self.results)
+
+    def load(self) -> None:
+        """Read completed results from an existing checkpoint file.
+
+        NOTE: A truncated last line (crash mid-write) is skipped.
+        """
+        if not self.path.exists():
+            return
+
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt checkpoint record in {self.path}")
+                    continue
+
+                self._mark(record["idx"])
+                self.results[record["idx"]] = record["result"]
+                if "token_usage" in record:
+                    self.token_usage = record["token_usage"]
+
+        logger.info(f"Loaded {len(self.results)} checkpointed results from {self.path}")
+
+    def _mark(self, idx: int) -> None:
+        """Set the completion bit for an index (out-of-range indices are ignored)."""
+        if 0 <= idx < self.size:
+            self._done[idx >> 3] |= 1 << (idx & 7)
+
+    def clear(self) -> None:
+        """Forget all completed results."""
+        self.results.clear()
+        self.token_usage = {}
+        self._done = bytearray(len(self._done))
+
+    def open(self) -> None:
+        """Open the checkpoint file for appending."""
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def append(
+        self,
+        idx: int,
+        result: dict[str, Any],
+        token_usage: dict[str, int] | None = None
+    ) -> None:
+        """Durably record one completed result.
+
+        Args:
+            idx: Index of the entry in the input file
+            result: Analysis result for the entry
+            token_usage: Cumulative token usage at the time of the write
+        """
+        self._mark(idx)
+        self.results[idx] = result
+        if self._fd is None:
+            return
+
+        record: dict[str, Any] = {"idx": idx, "result": result}
+        if token_usage is not None:
+            record["token_usage"] = token_usage
+
+        os.write(self._fd, orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        os.fsync(self._fd)
+
+    def close(self) -> None:
+        """Close the checkpoint file (the file itself is kept)."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def remove(self) -> None:
+        """Close and delete the checkpoint file after a clean run."""
+        self.close()
+        try:
+            self.path.unlink(missing_ok=True)
+            logger.info(f"Removed checkpoint file: {self.path}")
+        except OSError as e:
+            logger.warning(f"Failed to remove checkpoint file: {e}")
@@ -51,13 +51,15 @@ def get_provider(config: "AnalyzerConfig") -> LLMProvider:
     elif provider_name == "ollama":
         return OllamaProvider(
             api_base=config.api_base or "http://localhost:11434",
-            timeout=config.timeout
+            timeout=config.timeout,
+            max_connections=config.concurrency
         )
 
     elif provider_name == "lmstudio":
         return LMStudioProvider(
             api_base=config.api_base or "http://localhost:1234",
-            timeout=config.timeout
+            timeout=config.timeout,
+            max_connections=config.concurrency
         )
 
     else:
@@ -156,3 +156,9 @@ class AnthropicProvider(LLMProvider):
         except Exception as e:
             logger.error(f"Anthropic health check failed: {e}")
             return False
+
+    async def close(self) -> None:
+        """Close the Anthropic client and its connection pool."""
+        if self._client:
+            await self._client.close()
+            self._client = None
@@ -154,6 +154,22 @@ class LLMProvider(ABC):
             f"Failed after {max_retries} attempts. Last error: {last_error}"
         )
 
+    async def close(self) -> None:
+        """Release resources held by the provider (e.g., HTTP connection pools).
+
+        The default implementation does nothing; providers holding network
+        clients override it.
+        """
+        return None
+
+    async def __aenter__(self) -> "LLMProvider":
+        """Enter an async context; the provider is closed on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the provider when leaving an async context."""
+        await self.close()
+
     def __repr__(self) -> str:
         """String representation of the provider."""
         return f"<{self.__class__.__name__}>"
@@ -231,3 +231,9 @@ class BedrockProvider(LLMProvider):
         except Exception as e:
             logger.error(f"Bedrock health check failed: {e}")
             return False
+
+    async def close(self) -> None:
+        """Close the boto3 client and its connection pool."""
+        if self._client:
+            self._client.close()
+            self._client = None
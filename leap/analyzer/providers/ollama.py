@@ -33,17 +33,25 @@ class OllamaProvider(LLMProvider):
     def __init__(
         self,
         api_base: str = "http://localhost:11434",
-        timeout: int = 60
+        timeout: int = 60,
+        max_connections: int = 10,
+        client: Any = None
     ):
         """Initialize Ollama provider.
 
         Args:
             api_base: Base URL for Ollama server
             timeout: Request timeout in seconds
+            max_connections: Size of the connection pool (match the analyzer
+                concurrency so every in-flight request keeps a warm connection)
+            client: Optional shared httpx.AsyncClient. It must be configured with
+                this provider's base URL and is not closed by close()
         """
         self.api_base = api_base.rstrip("/")
         self.timeout = timeout
-        self._client: Any = None
+        self.max_connections = max_connections
+        self._client: Any = client
+        self._owns_client = client is None
 
     def _get_client(self) -> Any:
         """Lazy initialization of httpx client."""
@@ -56,10 +64,17 @@ class OllamaProvider(LLMProvider):
                     "Install with: pip install httpx"
                 ) from exc
 
+            # httpx keeps only 20 idle connections by default; with higher
+            # concurrency the surplus would be re-opened on every request
             self._client = httpx.AsyncClient(
                 timeout=self.timeout,
-                base_url=self.api_base
+                base_url=self.api_base,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
             )
+            self._owns_client = True
 
         return self._client
 
@@ -181,7 +196,7 @@ class OllamaProvider(LLMProvider):
             raise ProviderError(f"Failed to list Ollama models: {e}") from e
 
     async def close(self) -> None:
-        """Close the httpx client."""
-        if self._client:
+        """Close the httpx client (unless it was passed in by the caller)."""
+        if self._client and self._owns_client:
             await self._client.aclose()
-            self._client = None
+        self._client = None
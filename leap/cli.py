@@ -5,19 +5,22 @@ This module provides the command-line interface for the leap-cli tool.
 """
 
 import asyncio
+import functools
+import itertools
+from collections.abc import Callable, Coroutine
 from pathlib import Path
-from typing import Annotated, Any, Literal, cast
+from typing import Annotated, Any, Literal, TypeVar, cast, get_args
 
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from leap.analyzer import AnalyzerConfig, LogAnalyzer
-from leap.core import aggregate_results, discover_files, filter_changed_files
-from leap.indexer import IndexerConfig, LogIndexer, VectorStoreType
+from leap.core import aggregate_results, append_results, discover_files, filter_changed_files
+from leap.core.discovery import LanguageType
 from leap.parsers import BaseParser, GoParser, JSParser, PythonParser, RubyParser
+from leap.parsers.cache import default_cache_dir
 from leap.schemas import RawLogEntry
-from leap.search_server import SearchServerConfig, create_app
 from leap.utils.logger import get_logger
 
 app = typer.Typer(
@@ -29,6 +32,11 @@ app = typer.Typer(
 console = Console()
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Language names accepted by --languages
+_VALID_LANGUAGES: frozenset[str] = frozenset(get_args(LanguageType))
+
 
 @app.command()
 def extract(
@@ -74,6 +82,36 @@ def extract(
             help="Merge results with existing output file",
         ),
     ] = False,
+    ndjson: Annotated[
+        bool,
+        typer.Option(
+            "--ndjson",
+            help="Write newline-delimited JSON (one entry per line) instead of a JSON array",
+        ),
+    ] = False,
+    strict: Annotated[
+        bool,
+        typer.Option(
+            "--strict",
+            help="Fail on extracted entries that do not match the schema (useful in CI)",
+        ),
+    ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Disable the on-disk cache of parser output (reparse every file)",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Number of files parsed in parallel (default: CPU count)",
+        ),
+    ] = None,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -102,6 +140,9 @@ def extract(
 
         # Merge with existing results
         leap extract /path/to/repo --merge --output existing_logs.json
+
+        # Stream output as NDJSON (lower memory for very large repositories)
+        leap extract /path/to/repo --ndjson --output raw_logs.ndjson
     """
     try:
         # Convert path to absolute
@@ -111,75 +152,64 @@ def extract(
         console.print(f"Scanning: {root_path}")
 
         # Step 1: Discover files
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _spinner() as progress:
             task = progress.add_task("Discovering source files...", total=None)
 
             # Filter by languages if specified
-            language_filter: set[Literal["python", "go", "ruby", "javascript", "typescript"]] | None = None
+            language_filter: set[LanguageType] | None = None
             if languages:
                 # Validate and convert language names
-                valid_languages = {"python", "go", "ruby", "javascript", "typescript"}
-                temp_filter = set()
-                for lang in languages:
-                    if lang.lower() not in valid_languages:
-                        console.print(
-                            f"[bold red]Error:[/bold red] Invalid language '{lang}'. "
-                            f"Valid options: {', '.join(sorted(valid_languages))}"
-                        )
-                        raise typer.Exit(1)
-                    temp_filter.add(lang.lower())
+                wanted = {lang.lower() for lang in languages}
+                invalid = wanted - _VALID_LANGUAGES
+                if invalid:
+                    console.print(
+                        f"[bold red]Error:[/bold red] Invalid language(s): {', '.join(sorted(invalid))}. "
+                        f"Valid options: {', '.join(sorted(_VALID_LANGUAGES))}"
+                    )
+                    raise typer.Exit(1)
                 # Cast is safe because we've validated all values
-                language_filter = cast(set[Literal["python", "go", "ruby", "javascript", "typescript"]], temp_filter)
+                language_filter = cast(set[LanguageType], wanted)
 
             discovered = discover_files(root_path, languages=language_filter)
 
             # Filter by specific files if provided
             if files:
-                # Convert file paths to absolute
-                file_paths = [f.resolve() for f in files]
-                discovered = filter_changed_files(discovered, file_paths)
+                discovered = filter_changed_files(discovered, files)
 
             progress.update(task, completed=True)
 
         # Check if any files were found
-        total_files = sum(len(file_list) for file_list in discovered.values())
+        counts = {lang: len(file_list) for lang, file_list in discovered.items()}
+        total_files = sum(counts.values())
         if total_files == 0:
             console.print("[yellow]No source files found.[/yellow]")
             raise typer.Exit(0)
 
         console.print(f"Found {total_files} source file(s)")
-        for lang, file_list in discovered.items():
-            console.print(f"  - {lang}: {len(file_list)} file(s)")
+        for lang, count in counts.items():
+            console.print(f"  - {lang}: {count} file(s)")
 
-        # Step 2: Parse files
-        all_log_entries: list[RawLogEntry] = []
+        # Step 2: Parse files (per-language results are flattened once at the end)
+        parsed: list[list[RawLogEntry]] = []
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _spinner() as progress:
             # Parse Python files
             if "python" in discovered:
                 task = progress.add_task(
-                    f"Parsing {len(discovered['python'])} Python file(s)...", total=None
+                    f"Parsing {counts['python']} Python file(s)...", total=None
                 )
-                python_entries = _parse_files(discovered["python"], PythonParser(), "Python")
-                all_log_entries.extend(python_entries)
+                python_entries = _get_parser("python", strict, not no_cache).parse_files(discovered["python"], jobs)
+                parsed.append(python_entries)
                 progress.update(task, completed=True)
 
             # Parse Go files
             if "go" in discovered:
                 task = progress.add_task(
-                    f"Parsing {len(discovered['go'])} Go file(s)...", total=None
+                    f"Parsing {counts['go']} Go file(s)...", total=None
                 )
                 try:
-                    go_entries = _parse_files(discovered["go"], GoParser(), "Go")
-                    all_log_entries.extend(go_entries)
+                    go_entries = _get_parser("go", strict, not no_cache).parse_files(discovered["go"], jobs)
+                    parsed.append(go_entries)
                     progress.update(task, completed=True)
                 except RuntimeError as e:
                     progress.update(task, completed=True)
@@ -188,11 +218,11 @@ def extract(
             # Parse Ruby files
             if "ruby" in discovered:
                 task = progress.add_task(
-                    f"Parsing {len(discovered['ruby'])} Ruby file(s)...", total=None
+                    f"Parsing {counts['ruby']} Ruby file(s)...", total=None
                 )
                 try:
-                    ruby_entries = _parse_files(discovered["ruby"], RubyParser(), "Ruby")
-                    all_log_entries.extend(ruby_entries)
+                    ruby_entries = _get_parser("ruby", strict, not no_cache).parse_files(discovered["ruby"], jobs)
+                    parsed.append(ruby_entries)
                     progress.update(task, completed=True)
                 except RuntimeError as e:
                     progress.update(task, completed=True)
@@ -208,30 +238,31 @@ def extract(
                     f"Parsing {len(all_js_files)} JS/TS file(s)...", total=None
                 )
                 try:
-                    js_entries = _parse_files(all_js_files, JSParser(), "JavaScript/TypeScript")
-                    all_log_entries.extend(js_entries)
+                    js_entries = _get_parser("javascript", strict, not no_cache).parse_files(all_js_files, jobs)
+                    parsed.append(js_entries)
                     progress.update(task, completed=True)
                 except RuntimeError as e:
                     progress.update(task, completed=True)
                     console.print(f"[yellow]Warning: {e}[/yellow]")
 
+        all_log_entries = list(itertools.chain.from_iterable(parsed))
         console.print(f"Extracted {len(all_log_entries)} log statement(s)")
 
         # Step 3: Aggregate and write results
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _spinner() as progress:
             task = progress.add_task("Writing output...", total=None)
 
             # Merge with existing file if requested
-            if merge and output.exists():
-                from leap.core.aggregator import merge_results
+            if merge and ndjson:
+                # NDJSON merges append in place without re-reading the file
+                append_results(all_log_entries, output)
+            else:
+                if merge and output.exists():
+                    from leap.core.aggregator import merge_results
 
-                all_log_entries = merge_results(output, all_log_entries)
+                    all_log_entries = merge_results(output, all_log_entries)
 
-            aggregate_results(all_log_entries, output)
+                aggregate_results(all_log_entries, output, ndjson=ndjson)
             progress.update(task, completed=True)
 
         console.print(f"[bold green]Success![/bold green] Output written to: {output}")
@@ -244,38 +275,88 @@ def extract(
         raise typer.Exit(1) from None
 
 
-def _parse_files(file_paths: list[Path], parser: BaseParser, language_name: str) -> list[RawLogEntry]:
+def _spinner() -> Progress:
+    """
+    Create the spinner used for long-running extract steps.
+
+    Refreshes at 4 Hz, clears itself when done (summaries are printed
+    separately), and is disabled entirely when output is not a terminal.
+
+    Returns:
+        Progress instance to use as a context manager
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=4,
+        transient=True,
+        disable=not console.is_terminal,
+    )
+
+
+# Parser classes by language name (JS and TS share one parser)
+_PARSER_CLASSES: dict[str, type[BaseParser]] = {
+    "python": PythonParser,
+    "go": GoParser,
+    "ruby": RubyParser,
+    "javascript": JSParser,
+}
+
+
+@functools.cache
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
     """
-    Parse files and extract log entries using a given parser.
+    Pick the event loop for the async commands.
+
+    Returns:
+        uvloop's loop factory when uvloop is installed, else None (asyncio's
+        default loop)
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on a fresh event loop.
+
+    NOTE: the loop is chosen through asyncio.Runner's loop_factory rather
+    than a global event loop policy; policies are deprecated since 3.14.
 
     Args:
-        file_paths: List of file paths to parse
-        parser: Parser instance to use
-        language_name: Name of the language (for logging)
+        coro: Coroutine to run
 
     Returns:
-        List of all extracted log entries
+        The coroutine's result
     """
-    all_entries: list[RawLogEntry] = []
+    with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+        return runner.run(coro)
 
-    for file_path in file_paths:
-        try:
-            entries = parser.parse_file(file_path)
-            all_entries.extend(entries)
-        except SyntaxError as e:
-            logger.warning(
-                f"Skipping {language_name} file with syntax errors: {file_path}",
-                extra={"context": {"file": str(file_path), "error": str(e)}},
-            )
-            continue
-        except Exception as e:
-            logger.error(
-                f"Failed to parse {language_name} file: {file_path}",
-                extra={"context": {"file": str(file_path), "error": str(e)}},
-            )
-            continue
 
-    return all_entries
+@functools.cache
+def _get_parser(language: str, strict: bool = False, cache: bool = True) -> BaseParser:
+    """
+    Get the shared parser instance for a language.
+
+    Parsers are stateless between parse_file calls, so one instance per
+    language (and options) is created lazily and reused for the lifetime
+    of the process.
+
+    Args:
+        language: Language name (python, go, ruby, javascript)
+        strict: Raise on extracted entries that fail schema validation
+        cache: Cache parser output on disk
+
+    Returns:
+        Parser instance for the language
+    """
+    cache_dir = default_cache_dir() if cache else None
+    return _PARSER_CLASSES[language](strict=strict, cache_dir=cache_dir)
 
 
 @app.command()
@@ -451,13 +532,17 @@ def analyze(
 
         # Run analysis (async)
         async def run_analysis() -> dict[str, Any]:
-            return await analyzer.analyze_file(
-                str(input_file.resolve()),
-                str(output.resolve()),
-                resume=resume
-            )
+            try:
+                return await analyzer.analyze_file(
+                    str(input_file.resolve()),
+                    str(output.resolve()),
+                    resume=resume
+                )
+            finally:
+                # Close connections inside the running loop
+                await analyzer.close()
 
-        metadata = asyncio.run(run_analysis())
+        metadata = _run_async(run_analysis())
 
         # Display results
         console.print()
@@ -555,6 +640,13 @@ def index(
             help="Qdrant API key (for Qdrant Cloud)",
         ),
     ] = None,
+    qdrant_grpc: Annotated[
+        bool,
+        typer.Option(
+            "--qdrant-grpc",
+            help="Use gRPC (port 6334) instead of HTTP for Qdrant",
+        ),
+    ] = False,
     batch_size: Annotated[
         int,
         typer.Option(
@@ -614,6 +706,9 @@ def index(
         if vector_store == "qdrant":
             console.print(f"Qdrant URL: {qdrant_url}")
 
+        # Deferred: pulls in the embedding model and vector store clients
+        from leap.indexer import IndexerConfig, LogIndexer, VectorStoreType
+
         # Create indexer configuration
         config = IndexerConfig(
             vector_store=VectorStoreType(vector_store),
@@ -621,6 +716,7 @@ def index(
             chromadb_path=chromadb_path,
             qdrant_url=qdrant_url,
             qdrant_api_key=qdrant_api_key,
+            qdrant_prefer_grpc=qdrant_grpc,
             batch_size=batch_size,
             show_progress=True,
         )
@@ -638,14 +734,13 @@ def index(
 
         # Create indexer
         console.print("Loading embedding model...")
-        indexer = LogIndexer(config)
-
-        # Index logs
-        console.print()
-        stats = indexer.index_file(
-            input_path=input_file.resolve(),
-            codebase_name=codebase,
-        )
+        with LogIndexer(config) as indexer:
+            # Index logs
+            console.print()
+            stats = indexer.index_file(
+                input_path=input_file.resolve(),
+                codebase_name=codebase,
+            )
 
         # Display results
         console.print()
@@ -726,6 +821,20 @@ def serve(
             help="Qdrant API key (for Qdrant Cloud)",
         ),
     ] = None,
+    qdrant_grpc: Annotated[
+        bool,
+        typer.Option(
+            "--qdrant-grpc",
+            help="Use gRPC (port 6334) instead of HTTP for Qdrant",
+        ),
+    ] = False,
+    reranker_onnx_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--reranker-onnx-dir",
+            help="Run the reranker as an INT8 ONNX model stored here (exported on first use)",
+        ),
+    ] = None,
     reload: Annotated[
         bool,
         typer.Option(
@@ -750,6 +859,9 @@ def serve(
         # Custom host and port
         leap serve --host localhost --port 9000
 
+        # Quantized ONNX reranker (CPU)
+        leap serve --reranker-onnx-dir .leap_data/reranker-onnx
+
         # Development mode with auto-reload
         leap serve --reload
     """
@@ -759,6 +871,10 @@ def serve(
         console.print(f"Embedding Model: {embedding_model}")
         console.print()
 
+        # Deferred: pulls in FastAPI, the embedding model and vector store clients
+        from leap.indexer import VectorStoreType
+        from leap.search_server import SearchServerConfig, create_app
+
         # Create server configuration
         config = SearchServerConfig(
             host=host,
@@ -768,6 +884,8 @@ def serve(
             chromadb_path=chromadb_path,
             qdrant_url=qdrant_url,
             qdrant_api_key=qdrant_api_key,
+            qdrant_prefer_grpc=qdrant_grpc,
+            reranker_onnx_dir=reranker_onnx_dir,
         )
 
         # Create FastAPI app
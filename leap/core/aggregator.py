@@ -5,19 +5,36 @@ This module aggregates log entries from multiple parsers and generates
 the standardized raw_logs.json output file.
 """
 
-import json
+import re
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
 
-from pydantic import ValidationError
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from leap.schemas import RawLogEntry
 from leap.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Serializes/validates a whole list of entries in one pydantic-core call
+_RAW_LOGS_ADAPTER = TypeAdapter(list[RawLogEntry])
+
+_JSON_ARRAY_START = re.compile(rb"\s*\[")
+
+# Keys every record must carry to be loaded without validation
+_RAW_LOG_FIELDS = frozenset(RawLogEntry.model_fields)
+
+# Entries serialized per pydantic-core call when streaming a JSON array
+_ARRAY_CHUNK_SIZE = 1000
+
 
 def aggregate_results(
-    log_entries: list[RawLogEntry], output_path: Path, validate: bool = True
+    log_entries: list[RawLogEntry],
+    output_path: Path,
+    validate: bool = False,
+    ndjson: bool = False,
 ) -> None:
     """
     Aggregate log entries and write to raw_logs.json.
@@ -25,24 +42,31 @@ def aggregate_results(
     Args:
         log_entries: List of all extracted log entries from all parsers
         output_path: Path where raw_logs.json should be written
-        validate: Whether to validate entries before writing (default: True)
+        validate: Whether to re-check entries before writing (default: False;
+            parsers only return entries that passed RawLogEntry validation).
+            Enable it for entries built with RawLogEntry.model_construct.
+        ndjson: Write newline-delimited JSON (one entry per line) instead of
+            a single JSON array (default: False)
 
     Raises:
-        ValidationError: If validate=True and any entry is invalid
+        ValueError: If validate=True and any entry is invalid
         OSError: If unable to write to output_path
     """
     if validate:
         _validate_entries(log_entries)
 
-    # Convert to JSON-serializable format
-    data = [entry.model_dump(mode="json") for entry in log_entries]
-
     # Write to file
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if ndjson:
+            # NDJSON is streamed entry by entry, so the whole document is
+            # never held in memory as one giant string
+            with output_path.open("wb") as f:
+                _write_ndjson(log_entries, f)
+        else:
+            with output_path.open("wb") as f:
+                _write_json_array(log_entries, f)
 
         logger.info(
             f"Successfully wrote {len(log_entries)} log entries to {output_path}",
@@ -57,35 +81,44 @@ def aggregate_results(
         raise
 
 
-def load_raw_logs(input_path: Path) -> list[RawLogEntry]:
+def load_raw_logs(input_path: Path, trusted: bool = False) -> list[RawLogEntry]:
     """
     Load and validate raw_logs.json file.
 
+    Both formats written by aggregate_results are accepted: a single
+    JSON array or newline-delimited JSON (one entry per line).
+
     This is useful for downstream components (analyzer, indexer) that
     consume the raw_logs.json output.
 
     Args:
         input_path: Path to raw_logs.json file
+        trusted: Skip field validation because the file was written by
+            aggregate_results (default: False). Only JSON syntax and the
+            presence of every field are checked.
 
     Returns:
-        List of validated RawLogEntry objects
+        List of RawLogEntry objects (validated unless trusted)
 
     Raises:
         FileNotFoundError: If input file doesn't exist
-        ValidationError: If file contains invalid entries
-        json.JSONDecodeError: If file is not valid JSON
+        ValidationError: If file is not valid JSON or contains invalid entries
+            (with trusted=True: not valid JSON or missing fields)
     """
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    with input_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    if not isinstance(data, list):
-        raise ValidationError("Expected JSON array at root level")
+    raw = input_path.read_bytes()
 
-    # Parse and validate each entry
-    entries = [RawLogEntry(**item) for item in data]
+    if trusted:
+        entries = _construct_trusted(raw)
+    # Parse and validate in pydantic-core, without intermediate dicts
+    elif _JSON_ARRAY_START.match(raw):
+        entries = _RAW_LOGS_ADAPTER.validate_json(raw)
+    else:
+        entries = [
+            RawLogEntry.model_validate_json(line) for line in raw.splitlines() if line.strip()
+        ]
 
     logger.info(
         f"Loaded {len(entries)} log entries from {input_path}",
@@ -95,6 +128,60 @@ def load_raw_logs(input_path: Path) -> list[RawLogEntry]:
     return entries
 
 
+def append_results(
+    log_entries: list[RawLogEntry], output_path: Path, validate: bool = False
+) -> None:
+    """
+    Append log entries to an existing NDJSON raw_logs file.
+
+    This is the constant-memory merge path for NDJSON output: new entries
+    are appended at the end of the file, so the existing content is never
+    parsed. A file holding a JSON array cannot be appended to in place and
+    is merged the slow way (load, concatenate, rewrite as NDJSON).
+
+    Args:
+        log_entries: New entries to append
+        output_path: Path to the NDJSON file (created if missing)
+        validate: Whether to re-check entries before writing (default: False;
+            see aggregate_results)
+
+    Raises:
+        ValueError: If validate=True and any entry is invalid
+        OSError: If unable to write to output_path
+
+    NOTE: Like merge_results, this performs simple concatenation. Duplicate
+    detection (same file/line) is left to downstream components.
+    """
+    if not output_path.exists() or _is_json_array(output_path):
+        merged = merge_results(output_path, log_entries)
+        aggregate_results(merged, output_path, validate=validate, ndjson=True)
+        return
+
+    if validate:
+        _validate_entries(log_entries)
+
+    try:
+        with output_path.open("r+b") as f:
+            # Make sure the first appended record starts on its own line
+            if f.seek(0, 2) > 0:
+                f.seek(-1, 2)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            _write_ndjson(log_entries, f)
+
+        logger.info(
+            f"Appended {len(log_entries)} log entries to {output_path}",
+            extra={"context": {"output_path": str(output_path), "entry_count": len(log_entries)}},
+        )
+
+    except OSError as e:
+        logger.error(
+            f"Failed to append to output file: {e}",
+            extra={"context": {"output_path": str(output_path), "error": str(e)}},
+        )
+        raise
+
+
 def merge_results(existing_path: Path, new_entries: list[RawLogEntry]) -> list[RawLogEntry]:
     """
     Merge new log entries with existing raw_logs.json.
@@ -110,14 +197,17 @@ def merge_results(existing_path: Path, new_entries: list[RawLogEntry]) -> list[R
         Combined list of all entries (existing + new)
 
     NOTE: This performs simple concatenation. Duplicate detection
-    (same file/line) is left to downstream components.
+    (same file/line) is left to downstream components. The existing file
+    is our own output, so it is loaded as trusted: entries are validated
+    first, and if any value is invalid the entries are rebuilt with
+    model_construct, keeping invalid values rather than rejecting them.
     """
     if not existing_path.exists():
         logger.info("No existing file found, using only new entries")
         return new_entries
 
     try:
-        existing_entries = load_raw_logs(existing_path)
+        existing_entries = load_raw_logs(existing_path, trusted=True)
         merged = existing_entries + new_entries
 
         logger.info(
@@ -133,7 +223,7 @@ def merge_results(existing_path: Path, new_entries: list[RawLogEntry]) -> list[R
 
         return merged
 
-    except (ValidationError, json.JSONDecodeError) as e:
+    except ValidationError as e:
         logger.warning(
             f"Failed to load existing file, using only new entries: {e}",
             extra={"context": {"existing_path": str(existing_path), "error": str(e)}},
@@ -141,6 +231,112 @@ def merge_results(existing_path: Path, new_entries: list[RawLogEntry]) -> list[R
         return new_entries
 
 
+def _construct_trusted(raw: bytes) -> list[RawLogEntry]:
+    """
+    Decode raw_logs content into entries without rejecting invalid field values.
+
+    NOTE: Validating in pydantic-core is faster than model_construct, which
+    runs in Python per record, so valid content takes the validating path;
+    only content with invalid values is rebuilt with model_construct.
+
+    Args:
+        raw: Content of a JSON array or NDJSON file written by aggregate_results
+
+    Returns:
+        The entries, invalid field values kept as they are
+
+    Raises:
+        ValidationError: If the content is not valid JSON or a record is not
+            an object with every RawLogEntry field
+    """
+    try:
+        if _JSON_ARRAY_START.match(raw):
+            return _RAW_LOGS_ADAPTER.validate_json(raw)
+        return [
+            RawLogEntry.model_validate_json(line) for line in raw.splitlines() if line.strip()
+        ]
+    except ValidationError:
+        pass
+
+    try:
+        if _JSON_ARRAY_START.match(raw):
+            records = orjson.loads(raw)
+        else:
+            records = [orjson.loads(line) for line in raw.splitlines() if line.strip()]
+    except orjson.JSONDecodeError:
+        # Let pydantic-core report the syntax error as a ValidationError
+        _RAW_LOGS_ADAPTER.validate_json(raw)
+        raise
+
+    fields = _RAW_LOG_FIELDS
+    if not isinstance(records, list) or not all(
+        isinstance(record, dict) and record.keys() >= fields for record in records
+    ):
+        # Malformed structure: fall back to full validation for the error
+        return _RAW_LOGS_ADAPTER.validate_python(records)
+
+    return [RawLogEntry.model_construct(**record) for record in records]
+
+
+def _write_ndjson(log_entries: Iterable[RawLogEntry], f: Any) -> None:
+    """
+    Stream log entries to a binary file as newline-delimited JSON.
+
+    Args:
+        log_entries: Entries to serialize
+        f: File object opened in binary write/append mode
+    """
+    for entry in log_entries:
+        f.write(orjson.dumps(entry.model_dump(mode="json"), option=orjson.OPT_APPEND_NEWLINE))
+
+
+def _write_json_array(log_entries: list[RawLogEntry], f: Any) -> None:
+    """
+    Stream log entries to a binary file as an indented JSON array.
+
+    Entries are serialized in chunks, so only one chunk's bytes are held in
+    memory at a time. The output is identical to a single dump with indent=2.
+
+    Args:
+        log_entries: Entries to serialize
+        f: File object opened in binary write mode
+    """
+    if not log_entries:
+        f.write(b"[]")
+        return
+
+    f.write(b"[\n")
+    for start in range(0, len(log_entries), _ARRAY_CHUNK_SIZE):
+        if start:
+            f.write(b",\n")
+        chunk = _RAW_LOGS_ADAPTER.dump_json(
+            log_entries[start : start + _ARRAY_CHUNK_SIZE], indent=2
+        )
+        # Drop the chunk's own "[\n" and "\n]"
+        f.write(chunk[2:-2])
+    f.write(b"\n]")
+
+
+def _is_json_array(path: Path) -> bool:
+    """
+    Check whether a file holds a JSON array (as opposed to NDJSON).
+
+    Only the first non-whitespace byte is inspected.
+
+    Args:
+        path: Path to an existing output file
+
+    Returns:
+        True if the file content starts with "["
+    """
+    with path.open("rb") as f:
+        while chunk := f.read(4096):
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1] == b"["
+    return False
+
+
 def _validate_entries(entries: list[RawLogEntry]) -> None:
     """
     Validate a list of log entries.
@@ -149,16 +345,16 @@ def _validate_entries(entries: list[RawLogEntry]) -> None:
         entries: List of entries to validate
 
     Raises:
-        ValidationError: If any entry is invalid
+        ValueError: If any entry is invalid
     """
     for i, entry in enumerate(entries):
         try:
             # Pydantic models are already validated on construction,
             # but we can do additional checks here if needed
             if not entry.file_path:
-                raise ValidationError(f"Entry {i}: file_path is empty")
+                raise ValueError(f"Entry {i}: file_path is empty")
             if entry.line_number <= 0:
-                raise ValidationError(f"Entry {i}: invalid line_number {entry.line_number}")
+                raise ValueError(f"Entry {i}: invalid line_number {entry.line_number}")
         except Exception as e:
             logger.error(
                 f"Validation failed for entry {i}: {e}",
@@ -8,6 +8,11 @@ This module handles:
 4. Support for incremental analysis (changed files only)
 """
 
+import fnmatch
+import os
+import re
+from collections import defaultdict
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Literal
 
@@ -15,6 +20,9 @@ from leap.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Characters that make an exclude pattern a glob rather than a plain name
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
 LanguageType = Literal["python", "go", "ruby", "javascript", "typescript"]
 
 
@@ -41,10 +49,12 @@ def discover_files(
     Args:
         root_path: Root directory to scan
         languages: Set of languages to include (None = all supported languages)
-        exclude_patterns: Set of glob patterns to exclude (e.g., {"*/test/*", "*/vendor/*"})
+        exclude_patterns: Set of directory names or glob patterns (matched against
+            the "/"-separated path relative to root_path) to exclude
+            (e.g., {"fixtures", "*/test/*"})
 
     Returns:
-        Dictionary mapping language to list of file paths
+        Dictionary mapping language to list of file paths (under the resolved root)
 
     Raises:
         FileNotFoundError: If root_path doesn't exist
@@ -74,112 +84,189 @@ def discover_files(
     if exclude_patterns:
         default_excludes.update(exclude_patterns)
 
+    # Plain names are checked with one set lookup per directory; glob
+    # patterns are folded into a single compiled regex
+    exclude_names, exclude_regex = _compile_excludes(default_excludes)
+
+    # Resolve the root once; every discovered path then is a real path too
+    # (directory symlinks are not followed), so callers can compare strings
+    root = os.path.realpath(root_path)
+    root_len = len(os.path.join(root, ""))
+
     # Determine which extensions to look for
     if languages:
         target_extensions = {
-            ext for ext, lang in EXTENSION_TO_LANGUAGE.items() if lang in languages
+            ext: lang for ext, lang in EXTENSION_TO_LANGUAGE.items() if lang in languages
         }
     else:
-        target_extensions = set(EXTENSION_TO_LANGUAGE.keys())
-
-    # Scan directory tree
+        target_extensions = EXTENSION_TO_LANGUAGE
+
+    # Scan directory tree (iterative DFS). Excluded directories are pruned
+    # before they are listed, and DirEntry reports the file type from the
+    # directory read, so regular files cost no extra stat() call. The loop
+    # only handles strings; Path objects are built once at the end.
+    found: defaultdict[LanguageType, list[str]] = defaultdict(list)
+    stack = [root]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in exclude_names:
+                            continue
+                        if exclude_regex and exclude_regex.match(
+                            _relative_posix(entry.path, root_len) + "/"
+                        ):
+                            continue
+                        stack.append(entry.path)
+                        continue
+
+                    # Check if extension matches (inline splitext: as there, a
+                    # leading dot does not start an extension). Extensions are
+                    # almost always lowercase already, so lower() only runs for
+                    # the rest
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot <= 0:
+                        continue
+                    extension = name[dot:]
+                    language = target_extensions.get(extension)
+                    if language is None:
+                        if extension.islower():
+                            continue
+                        language = target_extensions.get(extension.lower())
+                        if language is None:
+                            continue
+                    if not entry.is_file():
+                        continue
+                    if exclude_regex and exclude_regex.match(_relative_posix(entry.path, root_len)):
+                        continue
+
+                    # Add to discovered files
+                    found[language].append(entry.path)
+        except OSError as e:
+            # Unreadable directory (permissions, removed during scan)
+            logger.warning(f"Skipping unreadable directory: {e}")
+
+    # Single pass over the result: build Path objects and per-language counts
     discovered: dict[LanguageType, list[Path]] = {}
-
-    for file_path in root_path.rglob("*"):
-        # Skip if not a file
-        if not file_path.is_file():
-            continue
-
-        # Skip if in excluded directory
-        if _should_exclude(file_path, root_path, default_excludes):
-            continue
-
-        # Check if extension matches
-        extension = file_path.suffix.lower()
-        if extension not in target_extensions:
-            continue
-
-        # Add to discovered files
-        language = EXTENSION_TO_LANGUAGE[extension]
-        if language not in discovered:
-            discovered[language] = []
-
-        discovered[language].append(file_path)
+    counts: dict[LanguageType, int] = {}
+    for language, paths in found.items():
+        discovered[language] = list(map(Path, paths))
+        counts[language] = len(paths)
 
     # Log discovery results
-    total_files = sum(len(files) for files in discovered.values())
     logger.info(
-        f"Discovered {total_files} files across {len(discovered)} languages",
-        extra={"context": {"root_path": str(root_path), "files_by_language": {lang: len(files) for lang, files in discovered.items()}}},
+        f"Discovered {sum(counts.values())} files across {len(discovered)} languages",
+        extra={"context": {"root_path": str(root_path), "files_by_language": counts}},
     )
 
     return discovered
 
 
 def filter_changed_files(
-    all_files: dict[LanguageType, list[Path]], changed_file_paths: list[Path]
+    all_files: dict[LanguageType, list[Path]], changed_file_paths: Iterable[Path]
 ) -> dict[LanguageType, list[Path]]:
     """
     Filter discovered files to only include changed files.
 
     This is used for incremental analysis in CI/CD pipelines.
 
+    NOTE: Changed paths are resolved here; discovered paths are compared as-is
+    (discover_files already returns paths under the resolved root).
+
     Args:
         all_files: All discovered files (from discover_files)
-        changed_file_paths: List of files that have changed (from git diff)
+        changed_file_paths: Files that have changed (from git diff), relative or absolute
 
     Returns:
         Filtered dictionary containing only changed files
     """
-    # Convert changed paths to a set for O(1) lookup
-    changed_set = set(changed_file_paths)
+    # Resolve once and compare strings for O(1) lookup
+    changed_set = frozenset(os.path.realpath(p) for p in changed_file_paths)
 
     filtered: dict[LanguageType, list[Path]] = {}
 
     for language, file_list in all_files.items():
-        changed_in_language = [f for f in file_list if f in changed_set]
+        changed_in_language = [f for f in file_list if os.fspath(f) in changed_set]
         if changed_in_language:
             filtered[language] = changed_in_language
 
     return filtered
 
 
-def detect_language(file_path: Path) -> LanguageType | None:
+def detect_language(file_path: Path | str) -> LanguageType | None:
     """
     Detect the programming language of a file based on its extension.
 
     Args:
-        file_path: Path to the source file
+        file_path: Path (or file name / path string) of the source file
 
     Returns:
         The detected language, or None if not supported
     """
-    extension = file_path.suffix.lower()
-    return EXTENSION_TO_LANGUAGE.get(extension)
+    name = file_path.name if isinstance(file_path, Path) else file_path
+    language = _language_for_name(name)
+    if language is None and not name.islower():
+        # Uppercase extensions (e.g. "SETUP.PY")
+        language = _language_for_name(name.lower())
+    return language
+
+
+def _language_for_name(name: str) -> LanguageType | None:
+    """
+    Map a lowercase file extension to its language.
+
+    NOTE: Must stay in sync with EXTENSION_TO_LANGUAGE. Branches are ordered by
+    how common the extension is; each endswith() is one C call.
+
+    Args:
+        name: File name or path string
+
+    Returns:
+        The language, or None if the extension is not supported
+    """
+    if name.endswith(".py"):
+        return "python"
+    if name.endswith((".ts", ".tsx")):
+        return "typescript"
+    if name.endswith((".js", ".jsx")):
+        return "javascript"
+    if name.endswith(".go"):
+        return "go"
+    if name.endswith(".rb"):
+        return "ruby"
+    return None
+
+
+def _compile_excludes(patterns: set[str]) -> tuple[frozenset[str], re.Pattern[str] | None]:
+    """
+    Split exclude patterns into plain directory names and one glob regex.
+
+    Args:
+        patterns: Directory names and/or glob patterns
+
+    Returns:
+        Tuple of (plain names, compiled regex for all glob patterns or None)
+    """
+    names = frozenset(p for p in patterns if not _GLOB_CHARS.search(p))
+    globs = sorted(patterns - names)
+    if not globs:
+        return names, None
+    return names, re.compile("|".join(fnmatch.translate(p) for p in globs))
 
 
-def _should_exclude(file_path: Path, root_path: Path, exclude_patterns: set[str]) -> bool:
+def _relative_posix(path: str, root_len: int) -> str:
     """
-    Check if a file should be excluded based on exclude patterns.
+    Get a scandir path relative to the scan root, with "/" separators.
 
     Args:
-        file_path: The file to check
-        root_path: The root directory being scanned
-        exclude_patterns: Set of directory names to exclude
+        path: DirEntry.path under the root
+        root_len: Length of the root path including its trailing separator
 
     Returns:
-        True if the file should be excluded, False otherwise
+        Relative path using "/" as separator
     """
-    try:
-        # Get relative path from root
-        relative_path = file_path.relative_to(root_path)
-
-        # Check if any parent directory matches an exclude pattern
-        for part in relative_path.parts:
-            if part in exclude_patterns:
-                return True
-
-        return False
-    except ValueError:
-        # File is not relative to root_path, exclude it
-        return True
+    rel = path[root_len:]
+    return rel if os.sep == "/" else rel.replace(os.sep, "/")
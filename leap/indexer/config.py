@@ -33,8 +33,12 @@ class IndexerConfig(BaseModel):
         chromadb_path: Path to ChromaDB storage (for ChromaDB only)
         qdrant_url: Qdrant server URL (for Qdrant only)
         qdrant_api_key: Qdrant API key (optional, for Qdrant Cloud)
+        qdrant_prefer_grpc: Talk to Qdrant over gRPC (port 6334) instead of HTTP
         batch_size: Batch size for embedding generation
         show_progress: Whether to show progress bar
+        enable_embedding_cache: Cache embeddings between runs in SQLite
+        embedding_cache_path: SQLite file of the embedding cache (None:
+            embedding_cache.sqlite in chromadb_path)
     """
 
     vector_store: VectorStoreType = Field(
@@ -65,6 +69,10 @@ class IndexerConfig(BaseModel):
         default=None,
         description="Qdrant API key (optional, for Qdrant Cloud)",
     )
+    qdrant_prefer_grpc: bool = Field(
+        default=False,
+        description="Use the gRPC transport (port 6334) instead of HTTP for Qdrant",
+    )
 
     # Processing settings
     batch_size: int = Field(
@@ -77,5 +85,13 @@ class IndexerConfig(BaseModel):
         default=True,
         description="Show progress bar during indexing",
     )
+    enable_embedding_cache: bool = Field(
+        default=True,
+        description="Cache embeddings between runs so unchanged logs are not re-embedded",
+    )
+    embedding_cache_path: Path | None = Field(
+        default=None,
+        description="SQLite file of the embedding cache (default: inside chromadb_path)",
+    )
 
     model_config = {"frozen": True}
@@ -0,0 +1,105 @@
+"""Persistent embedding cache for LEAP Indexer.
+
+Embedding dominates indexing time, and re-indexing an updated
+analyzed_logs.json mostly embeds texts that were already embedded in a
+previous run. This module stores embedding vectors in a SQLite file keyed
+by a hash of the model name and the embedded text, so unchanged logs are
+not sent through the model again.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_CHUNK_SIZE = 500
+
+
+class EmbeddingCache:
+    """SQLite-backed cache of embedding vectors.
+
+    Vectors are stored as raw float16 bytes (half the size of float32; the
+    precision loss is negligible for cosine similarity of normalized vectors)
+    and returned as float32.
+
+    Attributes:
+        path: Path to the SQLite database file
+        model_name: Embedding model the cached vectors belong to
+    """
+
+    def __init__(self, path: Path, model_name: str) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+            model_name: Name of the embedding model (part of every key)
+        """
+        self.path = path
+        self.model_name = model_name
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # NOTE: The indexer may run on a watchdog thread (watch mode); access
+        # is still sequential, so the connection can be shared across threads
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _key(self, text: str) -> bytes:
+        """Compute the cache key for a text.
+
+        Args:
+            text: Embedded text
+
+        Returns:
+            128-bit BLAKE2b digest of model name and text
+        """
+        return hashlib.blake2b(
+            f"{self.model_name}\0{text}".encode(), digest_size=16
+        ).digest()
+
+    def get_many(self, texts: list[str]) -> list[np.ndarray | None]:
+        """Look up cached vectors.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            float32 vector per text, or None where the text is not cached
+        """
+        keys = [self._key(text) for text in texts]
+        found: dict[bytes, bytes] = {}
+        for start in range(0, len(keys), _QUERY_CHUNK_SIZE):
+            chunk = keys[start : start + _QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+            )
+
+        return [
+            np.frombuffer(found[key], dtype=np.float16).astype(np.float32) if key in found else None
+            for key in keys
+        ]
+
+    def put_many(self, texts: list[str], vectors: np.ndarray) -> None:
+        """Store vectors for texts (existing entries are replaced).
+
+        Args:
+            texts: Embedded texts
+            vectors: Embeddings, one row per text
+        """
+        rows = [
+            (self._key(text), vector.astype(np.float16).tobytes())
+            for text, vector in zip(texts, vectors, strict=True)
+        ]
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?)", rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -3,10 +3,11 @@
 This module provides embedding generation functionality using various providers.
 """
 
+from typing import Any
+
 from leap.indexer.config import EmbeddingModelType, IndexerConfig
 
 from .base import EmbeddingProvider
-from .sentence_transformers import SentenceTransformersEmbeddings
 
 __all__ = [
     "EmbeddingProvider",
@@ -15,6 +16,19 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Lazily import providers that depend on heavy optional packages.
+
+    NOTE: sentence-transformers pulls in torch, so it is only imported when
+    a provider is actually requested.
+    """
+    if name == "SentenceTransformersEmbeddings":
+        from .sentence_transformers import SentenceTransformersEmbeddings
+
+        return SentenceTransformersEmbeddings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_embedding_provider(config: IndexerConfig) -> EmbeddingProvider:
     """Factory function to create an embedding provider based on configuration.
 
@@ -28,6 +42,10 @@ def get_embedding_provider(config: IndexerConfig) -> EmbeddingProvider:
         ValueError: If the embedding model type is not supported
     """
     if config.embedding_model == EmbeddingModelType.SENTENCE_TRANSFORMERS:
-        return SentenceTransformersEmbeddings(config.embedding_model_name)
+        from .sentence_transformers import SentenceTransformersEmbeddings
+
+        return SentenceTransformersEmbeddings(
+            config.embedding_model_name, batch_size=config.batch_size
+        )
     else:
         raise ValueError(f"Unsupported embedding model: {config.embedding_model}")
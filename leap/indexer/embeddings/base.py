@@ -5,6 +5,8 @@ This module defines the abstract interface that all embedding providers must imp
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers.
@@ -23,14 +25,14 @@ class EmbeddingProvider(ABC):
         pass
 
     @abstractmethod
-    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+    def embed_documents(self, texts: list[str]) -> np.ndarray:
         """Generate embeddings for a list of documents.
 
         Args:
             texts: List of text documents to embed
 
         Returns:
-            List of embedding vectors (one per document)
+            float32 array of shape (len(texts), dimension), one row per document
         """
         pass
 
@@ -3,11 +3,34 @@
 This module implements the embedding provider using the sentence-transformers library.
 """
 
+import functools
+
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 from .base import EmbeddingProvider
 
 
+@functools.lru_cache(maxsize=4)
+def _load_model(model_name: str) -> SentenceTransformer:
+    """Load a Sentence Transformers model once per process.
+
+    On CUDA the weights are converted to FP16, halving memory bandwidth
+    of the encoder.
+
+    Args:
+        model_name: Name of the Sentence Transformers model
+
+    Returns:
+        The loaded (shared) model
+    """
+    model = SentenceTransformer(model_name)
+    if torch.cuda.is_available():
+        model.half()
+    return model
+
+
 class SentenceTransformersEmbeddings(EmbeddingProvider):
     """Embedding provider using Sentence Transformers.
 
@@ -19,28 +42,39 @@ class SentenceTransformersEmbeddings(EmbeddingProvider):
         model_name: Name of the model being used
     """
 
-    def __init__(self, model_name: str) -> None:
+    def __init__(self, model_name: str, batch_size: int = 32) -> None:
         """Initialize the Sentence Transformers provider.
 
         Args:
             model_name: Name of the Sentence Transformers model
                        (e.g., 'paraphrase-multilingual-MiniLM-L12-v2')
+            batch_size: Number of texts encoded per forward pass
         """
         self.model_name = model_name
-        self.model = SentenceTransformer(model_name)
+        self.batch_size = batch_size
+        self.model = _load_model(model_name)
 
-    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+    def embed_documents(self, texts: list[str]) -> np.ndarray:
         """Generate embeddings for a list of documents.
 
         Args:
             texts: List of text documents to embed
 
         Returns:
-            List of embedding vectors (one per document)
+            float32 array of L2-normalized embeddings, one row per document
+
+        NOTE: encode() sorts the texts by length before batching and restores
+        the input order afterwards, so larger inputs pad less per batch.
         """
-        # Convert numpy arrays to lists
-        embeddings = self.model.encode(texts, show_progress_bar=False)
-        return [embedding.tolist() for embedding in embeddings]
+        embeddings: np.ndarray = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        # Kept as an ndarray; vector stores convert at their boundary if needed
+        return embeddings.astype(np.float32, copy=False)
 
     def embed_query(self, text: str) -> list[float]:
         """Generate embedding for a single query.
@@ -49,9 +83,9 @@ class SentenceTransformersEmbeddings(EmbeddingProvider):
             text: Query text to embed
 
         Returns:
-            Embedding vector for the query
+            L2-normalized embedding vector for the query
         """
-        embedding = self.model.encode(text, show_progress_bar=False)
+        embedding = self.model.encode(text, normalize_embeddings=True, show_progress_bar=False)
         result: list[float] = embedding.tolist()
         return result
 
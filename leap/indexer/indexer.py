@@ -4,22 +4,41 @@ This module provides the core indexing functionality to load analyzed logs
 and index them into a vector database for semantic search.
 """
 
+import functools
 import hashlib
-import json
+import mmap
+import os
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import orjson
 from rich.console import Console
 from rich.progress import BarColumn, Progress, TaskID, TextColumn, TimeRemainingColumn
 
 from leap.indexer.config import IndexerConfig
+from leap.indexer.embedding_cache import EmbeddingCache
 from leap.indexer.embeddings import get_embedding_provider
-from leap.indexer.language_detector import Language, detect_language_for_log_entry
+from leap.indexer.language_detector import Language, is_russian_log_entry
 from leap.indexer.vector_stores import Document, get_vector_store
 
 console = Console()
 
+# Embedding batches handed to the encoder per call. SentenceTransformer.encode
+# sorts its input by length before splitting it into forward passes, so a
+# wider window groups similar-length texts and cuts padding tokens.
+_EMBED_WINDOW_BATCHES = 8
+
+# Upper bound on the total text length of one encode() call, so windows of
+# unusually long logs do not run the embedding model out of memory
+_MAX_WINDOW_CHARS = 150_000
+
+# Embedding cache file name inside the storage directory
+_EMBEDDING_CACHE_FILE = "embedding_cache.sqlite"
+
 
 class IndexingStats:
     """Statistics for an indexing operation.
@@ -54,6 +73,8 @@ class LogIndexer:
         config: Indexer configuration
         embeddings: Embedding provider instance
         vector_store: Vector store instance
+        embedding_cache: Persistent embedding cache (None if disabled)
+        dimension: Dimension of the embedding vectors
     """
 
     def __init__(self, config: IndexerConfig) -> None:
@@ -65,6 +86,32 @@ class LogIndexer:
         self.config = config
         self.embeddings = get_embedding_provider(config)
         self.vector_store = get_vector_store(config)
+        self.embedding_cache: EmbeddingCache | None = None
+        if config.enable_embedding_cache:
+            # Next to the local vector data unless configured otherwise
+            cache_path = config.embedding_cache_path or (
+                config.chromadb_path / _EMBEDDING_CACHE_FILE
+            )
+            self.embedding_cache = EmbeddingCache(cache_path, config.embedding_model_name)
+
+    def __enter__(self) -> "LogIndexer":
+        """Use the indexer as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the indexer."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the embedding cache database (later runs embed without it)."""
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
+            self.embedding_cache = None
+
+    @functools.cached_property
+    def dimension(self) -> int:
+        """Dimension of the embedding vectors (queried from the provider once)."""
+        return self.embeddings.get_dimension()
 
     def index_file(
         self,
@@ -91,19 +138,23 @@ class LogIndexer:
         logs = self._load_logs(input_path)
         stats.total_logs = len(logs)
 
-        # Separate logs by language
+        # Separate logs by language (single pass; the bool classifier indexes
+        # the bucket directly, Language members are only used for naming).
+        # Logs of one source file share a language, so detection runs once
+        # per file ("path" of "path:line") and is reused for its other logs.
         ru_logs: list[dict[str, Any]] = []
         en_logs: list[dict[str, Any]] = []
+        bucket_append = (en_logs.append, ru_logs.append)
+        russian_by_file: dict[str, bool] = {}
 
         for log in logs:
-            language = detect_language_for_log_entry(
-                log["log_template"],
-                log.get("analysis"),
-            )
-            if language == Language.RUSSIAN:
-                ru_logs.append(log)
-            else:
-                en_logs.append(log)
+            file_path = log.get("source_file", "").partition(":")[0]
+            russian = russian_by_file.get(file_path) if file_path else None
+            if russian is None:
+                russian = is_russian_log_entry(log["log_template"], log.get("analysis"))
+                if file_path:
+                    russian_by_file[file_path] = russian
+            bucket_append[russian](log)
 
         stats.ru_logs = len(ru_logs)
         stats.en_logs = len(en_logs)
@@ -114,16 +165,17 @@ class LogIndexer:
                 f"✓ Detected {stats.ru_logs} Russian logs, {stats.en_logs} English logs"
             )
 
-        # Index logs by language
-        if ru_logs:
-            collection_name = f"logs_ru_{codebase_name}"
-            self._index_logs(ru_logs, collection_name, Language.RUSSIAN)
-            stats.collections_created.append(collection_name)
-
-        if en_logs:
-            collection_name = f"logs_en_{codebase_name}"
-            self._index_logs(en_logs, collection_name, Language.ENGLISH)
-            stats.collections_created.append(collection_name)
+        # Index logs by language (one collection per non-empty language)
+        collections = [
+            (language_logs, f"logs_{language.value}_{codebase_name}", language)
+            for language_logs, language in (
+                (ru_logs, Language.RUSSIAN),
+                (en_logs, Language.ENGLISH),
+            )
+            if language_logs
+        ]
+        self._index_logs(collections)
+        stats.collections_created.extend(name for _, name, _ in collections)
 
         # Calculate duration
         end_time = datetime.now()
@@ -148,8 +200,7 @@ class LogIndexer:
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
         try:
-            with open(input_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json(input_path)
 
             # Support both array format and object with "logs" key
             if isinstance(data, list):
@@ -163,129 +214,204 @@ class LogIndexer:
                     "Invalid format: expected array or object with 'logs' key"
                 )
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}") from e
 
     def _index_logs(
         self,
-        logs: list[dict[str, Any]],
-        collection_name: str,
-        language: Language,
+        collections: list[tuple[list[dict[str, Any]], str, Language]],
     ) -> None:
-        """Index a list of logs into a collection.
+        """Index logs into their collections.
 
         Args:
-            logs: List of log dictionaries
-            collection_name: Name of the collection
-            language: Language of the logs
+            collections: (logs, collection name, language) per collection
         """
-        # Create collection
-        dimension = self.embeddings.get_dimension()
-        self.vector_store.create_collection(
-            collection_name=collection_name,
-            dimension=dimension,
-            metadata={"language": language.value},
-        )
+        # Create collections
+        for _, collection_name, language in collections:
+            self.vector_store.create_collection(
+                collection_name=collection_name,
+                dimension=self.dimension,
+                metadata={"language": language.value},
+            )
 
-        if self.config.show_progress:
-            console.print(f"✓ Creating collection: {collection_name}")
+            if self.config.show_progress:
+                console.print(f"✓ Creating collection: {collection_name}")
 
         # Process logs in batches
+        progress: Progress | None = None
         if self.config.show_progress:
-            progress: Progress | None = Progress(
+            progress = Progress(
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(),
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TextColumn("•"),
                 TextColumn("{task.completed}/{task.total}"),
                 TimeRemainingColumn(),
+                # Updates arrive once per written window; a slow refresh keeps
+                # terminal rendering off the indexing threads' backs
+                refresh_per_second=2,
             )
-            task: TaskID | None = None
-        else:
-            progress = None
-            task = None
-
-        if progress:
-            task = progress.add_task(
-                f"Indexing {language.value} logs...",
-                total=len(logs),
-            )
+
+        # Two-stage pipeline: the main thread embeds batch k+1 while a single
+        # writer thread inserts batch k, so the vector store write latency is
+        # hidden behind the (dominant) embedding time. At most one write is
+        # in flight, which bounds memory to two batches. All collections go
+        # through the same pipeline, so it does not drain between languages.
+        writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="leap-indexer-writer")
+        pending: Future[None] | None = None
+        pending_task: TaskID | None = None
+        pending_size = 0
 
         try:
             if progress:
                 progress.start()
 
-            for i in range(0, len(logs), self.config.batch_size):
-                batch = logs[i : i + self.config.batch_size]
-                self._index_batch(batch, collection_name)
+            max_count = self.config.batch_size * _EMBED_WINDOW_BATCHES
+            for logs, collection_name, language in collections:
+                task = (
+                    progress.add_task(f"Indexing {language.value} logs...", total=len(logs))
+                    if progress
+                    else None
+                )
 
-                if progress and task is not None:
-                    progress.update(task, advance=len(batch))
+                for batch in _pack_batches(logs, _MAX_WINDOW_CHARS, max_count):
+                    documents, texts = self._prepare_batch(batch)
+                    embeddings = self._embed_batch(texts)
+
+                    if pending is not None:
+                        pending.result()
+                        if progress and pending_task is not None:
+                            progress.update(pending_task, advance=pending_size)
+
+                    pending = writer.submit(
+                        self.vector_store.add_documents,
+                        collection_name=collection_name,
+                        documents=documents,
+                        embeddings=embeddings,
+                    )
+                    pending_task = task
+                    pending_size = len(batch)
+
+            if pending is not None:
+                pending.result()
+                if progress and pending_task is not None:
+                    progress.update(pending_task, advance=pending_size)
 
         finally:
+            writer.shutdown(wait=True)
             if progress:
                 progress.stop()
 
-    def _index_batch(
-        self,
-        logs: list[dict[str, Any]],
-        collection_name: str,
-    ) -> None:
-        """Index a batch of logs.
+    def _embed_batch(self, texts: list[str]) -> np.ndarray:
+        """Embed a batch of texts, reusing vectors from the embedding cache.
+
+        Only texts missing from the cache are sent to the embedding model;
+        their vectors are added to the cache.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings, one row per text (in input order)
+        """
+        if self.embedding_cache is None:
+            return self._embed_uncached(texts)
+
+        vectors = self.embedding_cache.get_many(texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            embedded = self._embed_uncached(missing_texts)
+            self.embedding_cache.put_many(missing_texts, embedded)
+            for i, vector in zip(missing, embedded, strict=True):
+                vectors[i] = vector
+
+        filled = [vector for vector in vectors if vector is not None]
+        assert len(filled) == len(texts)
+        return np.stack(filled).astype(np.float32, copy=False)
+
+    def _embed_uncached(self, texts: list[str]) -> np.ndarray:
+        """Embed a batch of texts, one text at a time if the batch fails.
+
+        A batch that exhausts memory (e.g. CUDA OOM, which is a RuntimeError)
+        is retried item by item, so one oversized window does not abort the
+        whole indexing run.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings, one row per text
+        """
+        try:
+            return self.embeddings.embed_documents(texts)
+        except (RuntimeError, MemoryError) as e:
+            if len(texts) == 1:
+                raise
+            console.print(
+                f"[yellow]Warning: embedding {len(texts)} texts failed ({e}), "
+                "retrying one at a time[/yellow]"
+            )
+            return np.concatenate([self.embeddings.embed_documents([text]) for text in texts])
+
+    def _prepare_batch(
+        self, logs: list[dict[str, Any]]
+    ) -> tuple[list[Document], list[str]]:
+        """Build vector store documents and embedding texts for a batch of logs.
 
         Args:
             logs: List of log dictionaries
-            collection_name: Name of the collection
+
+        Returns:
+            Tuple of (documents, texts to embed), in input order
         """
         # Prepare documents
         documents: list[Document] = []
         texts: list[str] = []
+        # One timestamp per batch: all documents of a batch are written together
+        indexed_at = datetime.now().isoformat()
+
+        # Bound once: this loop runs once per log of the whole input
+        generate_id = self._generate_document_id
+        add_document = documents.append
+        add_text = texts.append
 
         for log in logs:
             # Generate document ID (hash of source_file + log_template)
             source_file = log.get("source_file", "unknown")
             log_template = log.get("log_template", "")
-            doc_id = self._generate_document_id(source_file, log_template)
+            analysis = log.get("analysis", "")
+            doc_id = generate_id(source_file, log_template)
 
             # Combine log_template and analysis for embedding
-            combined_text = log_template
-            if log.get("analysis"):
-                combined_text = f"{log_template}\n{log['analysis']}"
+            combined_text = f"{log_template}\n{analysis}" if analysis else log_template
 
             # Extract metadata
             metadata = {
                 "log_template": log_template,
-                "analysis": log.get("analysis", ""),
+                "analysis": analysis,
                 "severity": log.get("severity", "INFO"),
                 "suggested_action": log.get("suggested_action", ""),
                 "source_file": source_file,
                 "line_number": log.get("line_number", 0),
-                "indexed_at": datetime.now().isoformat(),
+                "indexed_at": indexed_at,
             }
 
             # Parse source_file to extract file_path
-            if ":" in source_file:
-                file_path = source_file.split(":")[0]
+            file_path, sep, _ = source_file.partition(":")
+            if sep:
                 metadata["file_path"] = file_path
 
-            doc = Document(id=doc_id, text=combined_text, metadata=metadata)
-            documents.append(doc)
-            texts.append(combined_text)
+            add_document(Document(id=doc_id, text=combined_text, metadata=metadata))
+            add_text(combined_text)
 
-        # Generate embeddings
-        embeddings = self.embeddings.embed_documents(texts)
-
-        # Add to vector store
-        self.vector_store.add_documents(
-            collection_name=collection_name,
-            documents=documents,
-            embeddings=embeddings,
-        )
+        return documents, texts
 
     def _generate_document_id(self, source_file: str, log_template: str) -> str:
         """Generate a unique document ID.
 
-        Uses SHA256 hash of source_file + log_template.
+        Uses a 128-bit BLAKE2b hash of source_file + log_template (32 hex
+        chars): a dedup key does not need SHA-256, and BLAKE2b is faster.
 
         Args:
             source_file: Source file path
@@ -295,4 +421,55 @@ class LogIndexer:
             Unique document ID
         """
         content = f"{source_file}::{log_template}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _read_json(path: Path) -> Any:
+    """Decode a JSON file straight from a read-only memory map.
+
+    The file content is parsed from the page cache instead of being copied
+    into a bytes object first, so peak memory is the decoded objects only.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        orjson.JSONDecodeError: If the file is empty or not valid JSON
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file; let orjson report it
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _pack_batches(
+    logs: list[dict[str, Any]], max_chars: int, max_count: int
+) -> Iterator[list[dict[str, Any]]]:
+    """Split logs into consecutive batches bounded by count and text length.
+
+    Args:
+        logs: List of log dictionaries
+        max_chars: Maximum total length of log_template + analysis per batch
+        max_count: Maximum number of logs per batch
+
+    Yields:
+        Non-empty batches, in input order (a single log longer than
+        max_chars forms its own batch)
+    """
+    batch: list[dict[str, Any]] = []
+    chars = 0
+    for log in logs:
+        size = len(log.get("log_template", "")) + len(log.get("analysis") or "")
+        if batch and (len(batch) >= max_count or chars + size > max_chars):
+            yield batch
+            batch = []
+            chars = 0
+        batch.append(log)
+        chars += size
+    if batch:
+        yield batch
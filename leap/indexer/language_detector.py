@@ -4,10 +4,9 @@ This module provides functionality to detect the language of log entries
 to enable language-specific indexing (separate collections for Russian and English).
 """
 
+import re
 from enum import Enum
 
-from langdetect import LangDetectException, detect_langs
-
 
 class Language(str, Enum):
     """Supported languages for indexing."""
@@ -16,48 +15,71 @@ class Language(str, Enum):
     ENGLISH = "en"
 
 
-def detect_language(text: str, confidence_threshold: float = 0.7) -> Language:
-    """Detect the language of a text.
+# Cyrillic block (U+0400-U+04FF) and ASCII letters
+_CYRILLIC_RE = re.compile(r"[\u0400-\u04FF]")
+_LATIN_RE = re.compile(r"[A-Za-z]")
+
+
+def is_russian(text: str, cyrillic_threshold: float = 0.3) -> bool:
+    """Check whether a text is Russian (as opposed to English).
 
-    Uses langdetect to analyze the text and determine if it's Russian or English.
-    Falls back to English if detection fails or confidence is low.
+    Only Russian and English have to be told apart, so the decision is the
+    share of Cyrillic letters among all letters. This is a single regex scan
+    per text instead of a probabilistic language model.
+
+    NOTE: Returns a plain bool so hot loops can branch on it without
+    hashing or comparing Language members.
 
     Args:
         text: Text to analyze
-        confidence_threshold: Minimum confidence required to use detection result
+        cyrillic_threshold: Minimum share of Cyrillic letters (0-1) among
+            Cyrillic + Latin letters to classify the text as Russian
 
     Returns:
-        Detected language (Language.RUSSIAN or Language.ENGLISH)
+        True if the text is Russian
     """
     # Handle empty or very short text
     if not text or len(text.strip()) < 3:
-        return Language.ENGLISH
+        return False
+
+    cyrillic = len(_CYRILLIC_RE.findall(text))
+    if not cyrillic:
+        return False
 
-    try:
-        # Detect language with confidence scores
-        langs = detect_langs(text)
+    latin = len(_LATIN_RE.findall(text))
+    return cyrillic / (cyrillic + latin) >= cyrillic_threshold
 
-        # Check if we have results
-        if not langs:
-            return Language.ENGLISH
 
-        # Get the most confident result
-        top_lang = langs[0]
+def detect_language(text: str, cyrillic_threshold: float = 0.3) -> Language:
+    """Detect the language of a text.
 
-        # If Russian is detected with high confidence, return Russian
-        if top_lang.lang == "ru" and top_lang.prob >= confidence_threshold:
-            return Language.RUSSIAN
+    Args:
+        text: Text to analyze
+        cyrillic_threshold: Minimum share of Cyrillic letters (0-1) among
+            Cyrillic + Latin letters to classify the text as Russian
 
-        # If English is detected with high confidence, return English
-        if top_lang.lang == "en" and top_lang.prob >= confidence_threshold:
-            return Language.ENGLISH
+    Returns:
+        Detected language (Language.RUSSIAN or Language.ENGLISH)
+    """
+    return Language.RUSSIAN if is_russian(text, cyrillic_threshold) else Language.ENGLISH
 
-        # Default to English for low confidence or other languages
-        return Language.ENGLISH
 
-    except LangDetectException:
-        # If detection fails, default to English
-        return Language.ENGLISH
+def is_russian_log_entry(log_template: str, analysis: str | None = None) -> bool:
+    """Check whether a log entry is Russian.
+
+    Combines log_template and analysis (if available) for better detection accuracy.
+
+    Args:
+        log_template: The log template text
+        analysis: Optional analysis text from the analyzer
+
+    Returns:
+        True if the log entry is Russian
+    """
+    # Combine template and analysis for better detection
+    if analysis:
+        return is_russian(f"{log_template} {analysis}")
+    return is_russian(log_template)
 
 
 def detect_language_for_log_entry(
@@ -74,9 +96,4 @@ def detect_language_for_log_entry(
     Returns:
         Detected language (Language.RUSSIAN or Language.ENGLISH)
     """
-    # Combine template and analysis for better detection
-    combined_text = log_template
-    if analysis:
-        combined_text = f"{log_template} {analysis}"
-
-    return detect_language(combined_text)
+    return Language.RUSSIAN if is_russian_log_entry(log_template, analysis) else Language.ENGLISH
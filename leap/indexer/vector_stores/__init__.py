@@ -3,10 +3,11 @@
 This module provides vector store functionality using various backends.
 """
 
+from typing import Any
+
 from leap.indexer.config import IndexerConfig, VectorStoreType
 
 from .base import Document, SearchResult, VectorStore
-from .chromadb import ChromaDBVectorStore
 
 __all__ = [
     "VectorStore",
@@ -17,6 +18,19 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Lazily import stores that depend on optional client packages.
+
+    NOTE: chromadb is only imported when the ChromaDB store is requested,
+    like qdrant-client in get_vector_store().
+    """
+    if name == "ChromaDBVectorStore":
+        from .chromadb import ChromaDBVectorStore
+
+        return ChromaDBVectorStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_vector_store(config: IndexerConfig) -> VectorStore:
     """Factory function to create a vector store based on configuration.
 
@@ -30,11 +44,15 @@ def get_vector_store(config: IndexerConfig) -> VectorStore:
         ValueError: If the vector store type is not supported
     """
     if config.vector_store == VectorStoreType.CHROMADB:
+        from .chromadb import ChromaDBVectorStore
+
         return ChromaDBVectorStore(config.chromadb_path)
     elif config.vector_store == VectorStoreType.QDRANT:
         # Import here to avoid dependency issues if qdrant is not installed
         from .qdrant import QdrantVectorStore
 
-        return QdrantVectorStore(config.qdrant_url, config.qdrant_api_key)
+        return QdrantVectorStore(
+            config.qdrant_url, config.qdrant_api_key, prefer_grpc=config.qdrant_prefer_grpc
+        )
     else:
         raise ValueError(f"Unsupported vector store: {config.vector_store}")
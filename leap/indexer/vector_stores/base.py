@@ -6,6 +6,8 @@ This module defines the abstract interface that all vector stores must implement
 from abc import ABC, abstractmethod
 from typing import Any
 
+import numpy as np
+
 
 class Document:
     """A document with text content and metadata.
@@ -17,6 +19,9 @@ class Document:
         metadata: Additional metadata for the document
     """
 
+    # Created once per indexed log: slots drop the per-instance __dict__
+    __slots__ = ("id", "text", "metadata", "embedding")
+
     def __init__(
         self,
         id: str,
@@ -46,6 +51,8 @@ class SearchResult:
         score: Similarity score (higher is better)
     """
 
+    __slots__ = ("document", "score")
+
     def __init__(self, document: Document, score: float) -> None:
         """Initialize a search result.
 
@@ -105,14 +112,14 @@ class VectorStore(ABC):
         self,
         collection_name: str,
         documents: list[Document],
-        embeddings: list[list[float]],
+        embeddings: np.ndarray,
     ) -> None:
         """Add documents to a collection.
 
         Args:
             collection_name: Name of the collection
             documents: List of documents to add
-            embeddings: List of embedding vectors (one per document)
+            embeddings: Array of embedding vectors, shape (len(documents), dimension)
         """
         pass
 
@@ -137,6 +144,32 @@ class VectorStore(ABC):
         """
         pass
 
+    def batch_search(
+        self,
+        collection_name: str,
+        query_embeddings: list[list[float]],
+        top_k: int = 5,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries at once.
+
+        NOTE: The default implementation runs one search() per query; stores
+        with a native batch API override it to use a single request.
+
+        Args:
+            collection_name: Name of the collection
+            query_embeddings: Query embedding vectors
+            top_k: Number of results to return per query
+            filters: Optional metadata filters (applied to every query)
+
+        Returns:
+            Search results per query, in query order
+        """
+        return [
+            self.search(collection_name, query_embedding, top_k, filters)
+            for query_embedding in query_embeddings
+        ]
+
     @abstractmethod
     def get_collection_stats(self, collection_name: str) -> dict[str, Any]:
         """Get statistics about a collection.
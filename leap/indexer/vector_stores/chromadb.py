@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
 from .base import Document, SearchResult, VectorStore
@@ -53,9 +54,9 @@ class ChromaDBVectorStore(VectorStore):
             dimension: Dimension of the embedding vectors
             metadata: Optional metadata for the collection
         """
-        # Delete collection if it exists (recreate)
-        if self.collection_exists(collection_name):
-            self.delete_collection(collection_name)
+        # Delete collection if it exists (recreate). delete_collection
+        # ignores missing collections, so no existence check is needed
+        self.delete_collection(collection_name)
 
         # Create new collection
         self.client.create_collection(
@@ -91,14 +92,15 @@ class ChromaDBVectorStore(VectorStore):
         self,
         collection_name: str,
         documents: list[Document],
-        embeddings: list[list[float]],
+        embeddings: np.ndarray,
     ) -> None:
         """Add documents to a collection.
 
         Args:
             collection_name: Name of the collection
             documents: List of documents to add
-            embeddings: List of embedding vectors (one per document)
+            embeddings: Array of embedding vectors, shape (len(documents), dimension)
+                (passed to ChromaDB as-is, without a list conversion)
 
         Raises:
             ValueError: If collection doesn't exist or documents/embeddings length mismatch
@@ -113,13 +115,19 @@ class ChromaDBVectorStore(VectorStore):
         texts = [doc.text for doc in documents]
         metadatas = [doc.metadata for doc in documents]
 
-        # Add to collection
-        collection.add(
-            ids=ids,
-            embeddings=embeddings,
-            documents=texts,
-            metadatas=metadatas,
-        )
+        # Write in chunks of the client's maximum batch size, so each call is
+        # a single write instead of being split (or rejected) inside ChromaDB.
+        # upsert is idempotent: document IDs are stable hashes, so re-adding
+        # unchanged logs overwrites them instead of failing on duplicates.
+        chunk_size = self.client.get_max_batch_size()
+        for start in range(0, len(ids), chunk_size):
+            end = start + chunk_size
+            collection.upsert(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                documents=texts[start:end],
+                metadatas=metadatas[start:end],
+            )
 
     def search(
         self,
@@ -148,22 +156,36 @@ class ChromaDBVectorStore(VectorStore):
             where=filters,
         )
 
-        # Convert to SearchResult objects
-        search_results = []
-        if results["ids"] and results["ids"][0]:
-            for i in range(len(results["ids"][0])):
-                doc = Document(
-                    id=results["ids"][0][i],
-                    text=results["documents"][0][i] if results["documents"] else "",
-                    metadata=results["metadatas"][0][i] if results["metadatas"] else {},
-                )
-                # ChromaDB returns distances, convert to similarity score (1 - distance)
-                # Distance is L2 distance, normalized to [0, 2]
-                distance = results["distances"][0][i] if results["distances"] else 1.0
-                score = 1.0 - (distance / 2.0)  # Convert to [0, 1] range
-                search_results.append(SearchResult(document=doc, score=score))
-
-        return search_results
+        return _to_search_results(results, 0)
+
+    def batch_search(
+        self,
+        collection_name: str,
+        query_embeddings: list[list[float]],
+        top_k: int = 5,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries with a single ChromaDB query call.
+
+        Args:
+            collection_name: Name of the collection
+            query_embeddings: Query embedding vectors
+            top_k: Number of results to return per query
+            filters: Optional metadata filters (ChromaDB where clause)
+
+        Returns:
+            Search results per query, in query order
+        """
+        if not query_embeddings:
+            return []
+
+        collection = self.client.get_collection(name=collection_name)
+        results = collection.query(
+            query_embeddings=query_embeddings,
+            n_results=top_k,
+            where=filters,
+        )
+        return [_to_search_results(results, i) for i in range(len(query_embeddings))]
 
     def get_collection_stats(self, collection_name: str) -> dict[str, Any]:
         """Get statistics about a collection.
@@ -191,3 +213,35 @@ class ChromaDBVectorStore(VectorStore):
         """
         collections = self.client.list_collections()
         return [c.name for c in collections]
+
+
+def _to_search_results(results: Any, query_index: int) -> list[SearchResult]:
+    """Convert one query's columns of a ChromaDB query result.
+
+    Args:
+        results: Result of collection.query
+        query_index: Index of the query within the call
+
+    Returns:
+        List of search results, sorted by similarity (descending)
+    """
+    if not results["ids"] or not results["ids"][query_index]:
+        return []
+
+    ids = results["ids"][query_index]
+    count = len(ids)
+    texts = results["documents"][query_index] if results["documents"] else [""] * count
+    metadatas = results["metadatas"][query_index] if results["metadatas"] else [{}] * count
+    distances = results["distances"][query_index] if results["distances"] else [1.0] * count
+
+    # ChromaDB returns distances, convert to similarity score (1 - distance)
+    # Distance is L2 distance, normalized to [0, 2]; score is in [0, 1]
+    return [
+        SearchResult(
+            document=Document(id=doc_id, text=text, metadata=metadata),
+            score=1.0 - (distance / 2.0),
+        )
+        for doc_id, text, metadata, distance in zip(
+            ids, texts, metadatas, distances, strict=True
+        )
+    ]
@@ -0,0 +1,136 @@
+"""Query result cache for vector stores.
+
+Search traffic repeats itself: the same query text produces the same
+embedding, and users re-run or page through identical searches. This
+module caches search results for exact repeats of a query so they are
+answered without a round-trip to the vector database.
+"""
+
+import contextlib
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Any
+
+import orjson
+
+from .base import SearchResult
+
+
+class QueryCache:
+    """Thread-safe LRU cache of search results with a TTL.
+
+    Keys cover the collection, the exact query vector, top_k and filters.
+    Every collection has an epoch that is bumped whenever its content
+    changes; the epoch is part of the key, so stale results are never
+    returned after writes (they simply age out of the LRU). Writes bump the
+    epoch both before and after (see writing()), so a search racing the
+    write cannot cache its result under the post-write epoch.
+
+    Attributes:
+        maxsize: Maximum number of cached queries
+        ttl: Seconds a cached result stays valid
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached queries
+            ttl: Seconds a cached result stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[float, list[SearchResult]]] = OrderedDict()
+        self._epochs: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        collection_name: str,
+        query_embedding: list[float],
+        top_k: int,
+        filters: dict[str, Any] | None,
+    ) -> bytes:
+        """Compute the cache key for a query.
+
+        Args:
+            collection_name: Name of the collection
+            query_embedding: Query embedding vector
+            top_k: Number of results requested
+            filters: Optional metadata filters
+
+        Returns:
+            128-bit BLAKE2b digest of the query and the collection epoch
+        """
+        with self._lock:
+            epoch = self._epochs.get(collection_name, 0)
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(orjson.dumps([collection_name, epoch, top_k]))
+        h.update(orjson.dumps(filters, option=orjson.OPT_SORT_KEYS))
+        h.update(orjson.dumps(query_embedding, option=orjson.OPT_SERIALIZE_NUMPY))
+        return h.digest()
+
+    def get(self, key: bytes) -> list[SearchResult] | None:
+        """Look up cached results.
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            Copies of the cached results (callers may rescore them), or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, results = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+
+        return [SearchResult(document=r.document, score=r.score) for r in results]
+
+    def put(self, key: bytes, results: list[SearchResult]) -> None:
+        """Store results for a query.
+
+        Args:
+            key: Cache key from key()
+            results: Search results to cache
+        """
+        snapshot = [SearchResult(document=r.document, score=r.score) for r in results]
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, collection_name: str) -> None:
+        """Invalidate all cached results of a collection.
+
+        Args:
+            collection_name: Name of the collection whose content changed
+        """
+        with self._lock:
+            self._epochs[collection_name] = self._epochs.get(collection_name, 0) + 1
+
+    @contextlib.contextmanager
+    def writing(self, collection_name: str) -> Iterator[None]:
+        """Invalidate a collection around a write to it.
+
+        The epoch is bumped before the write and again once it finished (or
+        failed): results of searches that ran during the write are cached
+        under the intermediate epoch and never returned afterwards.
+
+        Args:
+            collection_name: Name of the collection being written
+        """
+        self.invalidate(collection_name)
+        try:
+            yield
+        finally:
+            self.invalidate(collection_name)
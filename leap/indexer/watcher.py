@@ -26,6 +26,7 @@ class LogFileHandler(FileSystemEventHandler):
         indexer: LogIndexer instance
         debounce_seconds: Seconds to wait before reindexing after change
         last_modified: Timestamp of last modification
+        fingerprint: (size, mtime_ns) of the last indexed file content
     """
 
     def __init__(
@@ -34,6 +35,7 @@ class LogFileHandler(FileSystemEventHandler):
         codebase_name: str,
         indexer: LogIndexer,
         debounce_seconds: float = 2.0,
+        fingerprint: tuple[int, int] | None = None,
     ) -> None:
         """Initialize the file handler.
 
@@ -42,12 +44,14 @@ class LogFileHandler(FileSystemEventHandler):
             codebase_name: Name of the codebase
             indexer: LogIndexer instance
             debounce_seconds: Seconds to wait before reindexing
+            fingerprint: Fingerprint of the already indexed file content
         """
         self.file_path = file_path
         self.codebase_name = codebase_name
         self.indexer = indexer
         self.debounce_seconds = debounce_seconds
         self.last_modified = 0.0
+        self.fingerprint = fingerprint
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification event.
@@ -59,12 +63,40 @@ class LogFileHandler(FileSystemEventHandler):
         if event.src_path != str(self.file_path):
             return
 
+        self._reindex_if_changed()
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle file creation event (file replaced by delete + create).
+
+        Args:
+            event: File system event
+        """
+        self.on_modified(event)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle file move event (editors' atomic save renames a temp file).
+
+        Args:
+            event: File system event
+        """
+        if getattr(event, "dest_path", None) == str(self.file_path):
+            self._reindex_if_changed()
+
+    def _reindex_if_changed(self) -> None:
+        """Reindex the file unless the change is a duplicate event."""
         # Debounce: ignore if modified too recently
         current_time = time.time()
         if current_time - self.last_modified < self.debounce_seconds:
             return
 
+        # Editors and writers emit several events per save; skip the
+        # reindex if the file's size and mtime did not actually change
+        fingerprint = _file_fingerprint(self.file_path)
+        if fingerprint is None or fingerprint == self.fingerprint:
+            return
+
         self.last_modified = current_time
+        self.fingerprint = fingerprint
 
         # Reindex
         console.print()
@@ -90,6 +122,22 @@ class LogFileHandler(FileSystemEventHandler):
             console.print()
 
 
+def _file_fingerprint(file_path: Path) -> tuple[int, int] | None:
+    """Cheap content fingerprint of a file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        (size, mtime_ns), or None if the file does not exist (mid-replace)
+    """
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
 def watch_file(
     file_path: Path,
     codebase_name: str,
@@ -105,55 +153,57 @@ def watch_file(
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    # Create indexer
-    indexer = LogIndexer(config)
-
-    # Initial indexing
-    console.print("[bold blue]LEAP - Watch Mode[/bold blue]")
-    console.print(f"Watching: {file_path}")
-    console.print(f"Codebase: {codebase_name}")
-    console.print()
-    console.print("[blue]Performing initial indexing...[/blue]")
-
-    stats = indexer.index_file(
-        input_path=file_path,
-        codebase_name=codebase_name,
-    )
-
-    console.print()
-    console.print("[bold green]Initial Indexing Complete![/bold green]")
-    console.print(f"  Total logs: {stats.total_logs}")
-    console.print(f"  Russian logs: {stats.ru_logs}")
-    console.print(f"  English logs: {stats.en_logs}")
-    console.print(f"  Duration: {stats.duration_seconds:.1f}s")
-    console.print()
-    console.print("[yellow]Watching for changes... (Press Ctrl+C to stop)[/yellow]")
-    console.print()
-
-    # Setup watcher
-    event_handler = LogFileHandler(
-        file_path=file_path.resolve(),
-        codebase_name=codebase_name,
-        indexer=indexer,
-    )
-
-    observer = Observer()
-    observer.schedule(
-        event_handler,
-        path=str(file_path.parent),
-        recursive=False,
-    )
-
-    # Start watching
-    observer.start()
+    # Create indexer (closed when watching stops)
+    with LogIndexer(config) as indexer:
+        # Initial indexing
+        console.print("[bold blue]LEAP - Watch Mode[/bold blue]")
+        console.print(f"Watching: {file_path}")
+        console.print(f"Codebase: {codebase_name}")
+        console.print()
+        console.print("[blue]Performing initial indexing...[/blue]")
 
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
+        # Taken before indexing, so a write during the initial run is picked up
+        fingerprint = _file_fingerprint(file_path.resolve())
+        stats = indexer.index_file(
+            input_path=file_path,
+            codebase_name=codebase_name,
+        )
+
+        console.print()
+        console.print("[bold green]Initial Indexing Complete![/bold green]")
+        console.print(f"  Total logs: {stats.total_logs}")
+        console.print(f"  Russian logs: {stats.ru_logs}")
+        console.print(f"  English logs: {stats.en_logs}")
+        console.print(f"  Duration: {stats.duration_seconds:.1f}s")
         console.print()
-        console.print("[yellow]Stopping watcher...[/yellow]")
-        observer.stop()
+        console.print("[yellow]Watching for changes... (Press Ctrl+C to stop)[/yellow]")
+        console.print()
+
+        # Setup watcher
+        event_handler = LogFileHandler(
+            file_path=file_path.resolve(),
+            codebase_name=codebase_name,
+            indexer=indexer,
+            fingerprint=fingerprint,
+        )
+
+        observer = Observer()
+        observer.schedule(
+            event_handler,
+            path=str(file_path.parent),
+            recursive=False,
+        )
+
+        # Start watching
+        observer.start()
+
+        try:
+            # Block until interrupted (no periodic wakeups); Ctrl+C interrupts join
+            observer.join()
+        except KeyboardInterrupt:
+            console.print()
+            console.print("[yellow]Stopping watcher...[/yellow]")
+            observer.stop()
 
-    observer.join()
-    console.print("[green]Watcher stopped.[/green]")
+        observer.join()
+        console.print("[green]Watcher stopped.[/green]")
@@ -5,10 +5,35 @@ This module defines the abstract interface that all language-specific parsers
 must implement. This ensures consistency across Python, Go, Ruby, and JS/TS parsers.
 """
 
+import functools
+import itertools
+import sys
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, ClassVar
 
+import orjson
+from pydantic import BaseModel, ValidationError
+
+from leap.parsers.cache import ParseCache
+from leap.parsers.sidecar import SidecarError, SidecarPool
 from leap.schemas import RawLogEntry
+from leap.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Outcome of parsing one file: (entries, error kind ("syntax"/"error") or None, error message or None)
+ParseOutcome = tuple[list[RawLogEntry], str | None, str | None]
+
+
+class _ParserResponse(BaseModel):
+    """One response line of an external parser in server mode."""
+
+    entries: list[RawLogEntry] | None = None
+    error: str | None = None
 
 
 class BaseParser(ABC):
@@ -26,8 +51,49 @@ class BaseParser(ABC):
     - Go: log.*, zerologger.*, etc.
     - Ruby: Rails.logger.*, logger.*, etc.
     - JS/TS: console.*, winston.*, pino.*, etc.
+
+    NOTE: Parsers are the trust boundary for extracted data: every entry is
+    validated. By default entries that fail validation are logged and
+    skipped; pass strict=True to raise instead, e.g. in CI.
+
+    Parsers that list their sources in _PARSER_SOURCES cache their output
+    per file when given a cache_dir (see ParseCache). Parsers backed by an
+    external process set _USES_SIDECARS and implement _start_sidecars.
     """
 
+    # Source files of the parser (empty: output is not cacheable)
+    _PARSER_SOURCES: tuple[Path, ...] = ()
+
+    # Key the cache on file stat instead of content (see ParseCache)
+    _CACHE_BY_STAT: ClassVar[bool] = False
+
+    # Whether files are parsed by external parser processes
+    _USES_SIDECARS: ClassVar[bool] = False
+
+    # External parser processes, shared by all instances of a parser class
+    _SIDECARS: ClassVar[SidecarPool | None] = None
+    _SIDECARS_ERROR: ClassVar[RuntimeError | None] = None
+    _SIDECARS_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, strict: bool = False, cache_dir: Path | None = None) -> None:
+        """
+        Initialize the parser.
+
+        Args:
+            strict: Raise on entries that fail schema validation (instead of
+                skipping them)
+            cache_dir: Directory for cached parser output (None disables caching)
+        """
+        self.strict = strict
+        self.cache: ParseCache | None = None
+        if cache_dir is not None and self._PARSER_SOURCES:
+            self.cache = ParseCache(
+                cache_dir / self.get_language_name(),
+                *self._PARSER_SOURCES,
+                by_stat=self._CACHE_BY_STAT,
+                strict=strict,
+            )
+
     @abstractmethod
     def parse_file(self, file_path: Path) -> list[RawLogEntry]:
         """
@@ -47,6 +113,90 @@ class BaseParser(ABC):
         """
         pass
 
+    def iter_file(self, file_path: Path) -> Iterator[RawLogEntry]:
+        """
+        Parse a single source file, yielding log statements.
+
+        Lets callers stream entries onward instead of holding every file's
+        list. Parsers that find entries incrementally override this to yield
+        them as they are found; by default the file is parsed with parse_file.
+
+        Args:
+            file_path: Absolute path to the source file to parse
+
+        Yields:
+            One entry per log statement
+
+        Raises:
+            The exceptions of parse_file
+        """
+        yield from self.parse_file(file_path)
+
+    def parse_files(self, file_paths: list[Path], workers: int | None = None) -> list[RawLogEntry]:
+        """
+        Parse many source files and extract all log statements.
+
+        Files that fail to parse are logged and skipped (except for invalid
+        entries of a strict parser, which raise). Files are spread
+        across parallel workers where that pays off (see _map_parse).
+
+        Args:
+            file_paths: Paths to the source files to parse
+            workers: Maximum number of parallel workers (default: CPU count;
+                1 parses sequentially)
+
+        Returns:
+            Log entries of all files, in file order
+
+        Raises:
+            RuntimeError: If an external parser cannot be run at all
+            pydantic.ValidationError: If the parser is strict and an entry is invalid
+        """
+        language = self.get_language_name()
+        per_file: list[list[RawLogEntry]] = []
+
+        for file_path, (entries, error_kind, error) in zip(
+            file_paths, self._map_parse(file_paths, workers), strict=True
+        ):
+            if error_kind == "syntax":
+                logger.warning(
+                    f"Skipping {language} file with syntax errors: {file_path}",
+                    extra={"context": {"file": str(file_path), "error": error}},
+                )
+            elif error_kind is not None:
+                logger.error(
+                    f"Failed to parse {language} file: {file_path}",
+                    extra={"context": {"file": str(file_path), "error": error}},
+                )
+            else:
+                per_file.append(entries)
+
+        return list(itertools.chain.from_iterable(per_file))
+
+    def _map_parse(self, file_paths: list[Path], workers: int | None) -> Iterable[ParseOutcome]:
+        """
+        Parse files, capturing errors instead of raising.
+
+        External parsers do their work in child processes, so one thread per
+        pooled process keeps them all busy; in-process parsers run sequentially.
+
+        Args:
+            file_paths: Paths to the source files to parse
+            workers: Maximum number of parallel workers (None: no limit)
+
+        Returns:
+            One outcome per file, in file order
+        """
+        parse_one = functools.partial(_parse_one, self)
+        if not self._USES_SIDECARS or len(file_paths) < 2 or workers == 1:
+            return map(parse_one, file_paths)
+
+        # NOTE: Starting the pool first surfaces missing prerequisites once
+        pool = self._sidecar_pool()
+        threads = min(pool.size, workers or pool.size, len(file_paths))
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(parse_one, file_paths))
+
     @staticmethod
     @abstractmethod
     def get_supported_extensions() -> set[str]:
@@ -69,6 +219,187 @@ class BaseParser(ABC):
         """
         pass
 
+    @classmethod
+    def _start_sidecars(cls) -> SidecarPool:
+        """
+        Check the external parser's prerequisites and create its process pool.
+
+        Only parsers backed by an external process implement this.
+
+        Returns:
+            Pool running the parser in server mode
+
+        Raises:
+            RuntimeError: If the parser cannot be run
+        """
+        raise NotImplementedError(f"{cls.__name__} has no external parser")
+
+    @classmethod
+    def _sidecar_pool(cls) -> SidecarPool:
+        """
+        Get the external parser's process pool, creating it on first use.
+
+        A failure to start (missing runtime, failed build) is remembered for
+        the lifetime of the process instead of being retried for every file.
+
+        Returns:
+            Pool running the parser in server mode
+
+        Raises:
+            RuntimeError: If the parser cannot be run
+        """
+        if cls._SIDECARS is None:
+            with BaseParser._SIDECARS_LOCK:
+                if cls._SIDECARS_ERROR is not None:
+                    raise cls._SIDECARS_ERROR
+                if cls._SIDECARS is None:
+                    try:
+                        cls._SIDECARS = cls._start_sidecars()
+                    except RuntimeError as e:
+                        cls._SIDECARS_ERROR = e
+                        raise
+        return cls._SIDECARS
+
+    def _new_entry(self, **fields: Any) -> RawLogEntry | None:
+        """
+        Build a validated RawLogEntry from parser output.
+
+        Validation runs in pydantic-core and is faster than model_construct,
+        so entries are always validated.
+
+        Args:
+            **fields: RawLogEntry field values
+
+        Returns:
+            The entry, or None if the fields are invalid (logged and skipped)
+
+        Raises:
+            pydantic.ValidationError: If strict and the fields are invalid
+        """
+        try:
+            return RawLogEntry(**fields)
+        except ValidationError as e:
+            if self.strict:
+                raise
+            logger.warning(
+                f"Skipping invalid {fields.get('language')} log entry: "
+                f"{fields.get('file_path')}:{fields.get('line_number')}",
+                extra={"context": {"error": str(e)}},
+            )
+            return None
+
+    def _entry_from_json(self, item: dict[str, Any]) -> RawLogEntry | None:
+        """
+        Build a RawLogEntry from one record of an external parser's JSON output.
+
+        All entries of a file repeat the same file path, language and a handful
+        of log levels. Interning them makes the entries share one string object
+        each instead of holding a decoded copy per entry.
+
+        Args:
+            item: Decoded JSON object with RawLogEntry fields
+
+        Returns:
+            The entry, or None if it is invalid (see _new_entry)
+        """
+        log_level = item["log_level"]
+        return self._new_entry(
+            language=sys.intern(item["language"]),
+            file_path=sys.intern(item["file_path"]),
+            line_number=item["line_number"],
+            log_level=sys.intern(log_level) if log_level is not None else None,
+            log_template=item["log_template"],
+            code_context=item["code_context"],
+        )
+
+    def _entries_from_output(self, output: bytes) -> list[RawLogEntry]:
+        """
+        Decode one response line of an external parser.
+
+        Entries are validated straight from the JSON bytes by pydantic-core.
+        That is faster than decoding to dicts and building each entry in
+        Python, and repeated strings (file path, language, log levels) are
+        shared between entries. If any entry fails validation, the entries
+        are rebuilt one by one and the invalid ones skipped, unless strict.
+
+        Args:
+            output: Raw response line
+
+        Returns:
+            The entries of the file
+
+        Raises:
+            SidecarError: If the parser reported an error or the output is not JSON
+            pydantic.ValidationError: If strict and an entry is invalid
+        """
+        try:
+            response = _ParserResponse.model_validate_json(output)
+        except ValidationError:
+            if self.strict:
+                raise
+            try:
+                data = orjson.loads(output)
+            except orjson.JSONDecodeError as e:
+                raise SidecarError(f"Invalid parser output: {e}") from e
+            if not isinstance(data, dict):
+                raise SidecarError("Invalid parser output: expected a JSON object") from None
+            entries = map(self._entry_from_json, data.get("entries") or [])
+            response = _ParserResponse.model_construct(
+                entries=[entry for entry in entries if entry is not None],
+                error=data.get("error"),
+            )
+
+        if response.error is not None:
+            raise SidecarError(response.error)
+        return response.entries or []
+
+    def _cached_entries(self, file_path: Path) -> tuple[str | None, list[RawLogEntry] | None]:
+        """
+        Look up cached external parser output for a file.
+
+        Args:
+            file_path: Source file to be parsed
+
+        Returns:
+            Tuple of (cache key, or None when caching is disabled; cached
+            entries, or None on a miss)
+        """
+        if self.cache is None:
+            return None, None
+
+        key = self.cache.key(file_path)
+        output = self.cache.get(key)
+        if output is None:
+            return key, None
+        try:
+            return key, self._entries_from_output(output)
+        except (SidecarError, ValidationError):
+            return key, None
+
+    @staticmethod
+    def _output_from_entries(entries: list[RawLogEntry]) -> bytes:
+        """
+        Encode entries in the external parser response format, for caching.
+
+        Args:
+            entries: Entries of one file
+
+        Returns:
+            One response line, as read back by _entries_from_output
+        """
+        return _ParserResponse.model_construct(entries=entries).model_dump_json().encode()
+
+    def _store_cached(self, key: str | None, output: bytes) -> None:
+        """
+        Cache external parser output for a file.
+
+        Args:
+            key: Cache key from _cached_entries (None when caching is disabled)
+            output: Raw response line of the parser
+        """
+        if self.cache is not None and key is not None:
+            self.cache.put(key, output)
+
     def _extract_code_context(
         self, source_lines: list[str], start_line: int, end_line: int
     ) -> str:
@@ -92,3 +423,32 @@ class BaseParser(ABC):
         # Extract the lines and join them
         context_lines = source_lines[start_line:end_line]
         return "\n".join(context_lines)
+
+
+def _parse_one(parser: BaseParser, file_path: Path) -> ParseOutcome:
+    """
+    Parse a single file, capturing errors instead of raising.
+
+    May run in worker processes, so errors are returned (not logged) and
+    reported by the caller.
+
+    Args:
+        parser: Parser instance to use
+        file_path: File to parse
+
+    Returns:
+        Tuple of (entries, error kind ("syntax"/"error") or None, error message or None)
+
+    Raises:
+        pydantic.ValidationError: If the parser is strict and an entry is invalid
+    """
+    try:
+        return parser.parse_file(file_path), None, None
+    except SyntaxError as e:
+        return [], "syntax", str(e)
+    except ValidationError as e:
+        if parser.strict:
+            raise
+        return [], "error", str(e)
+    except Exception as e:
+        return [], "error", str(e)
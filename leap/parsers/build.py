@@ -0,0 +1,70 @@
+"""
+One-time build steps of external parsers.
+
+The Go parser is compiled and the JS/TS parser needs `npm install` before
+first use. Both write into the parser directory, so concurrent LEAP
+processes are serialized on a lock file there, and a stamp file records
+which sources the artifact was built from so later runs skip the step.
+"""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import orjson
+
+from leap.parsers.cache import sources_digest
+from leap.utils.file_lock import file_lock
+
+
+def ensure_built(output: Path, sources: tuple[Path, ...], build: Callable[[], None]) -> None:
+    """
+    Run a build step unless its output is current.
+
+    Processes that wait for the lock re-check the stamp once they hold it,
+    so only the first one builds.
+
+    Args:
+        output: Build artifact (file or directory) next to its sources
+        sources: Files the artifact is built from
+        build: Build step; raises on failure
+    """
+    stamp = output.parent / f".{output.name}.stamp"
+    version = sources_digest(*sources)
+    if _is_current(output, stamp, sources, version):
+        return
+
+    with file_lock(output.parent / ".build.lock"):
+        if _is_current(output, stamp, sources, version):
+            return
+        build()
+        stamp.write_bytes(orjson.dumps({"sources": version, "built_at": time.time()}))
+
+
+def _is_current(output: Path, stamp: Path, sources: tuple[Path, ...], version: str) -> bool:
+    """
+    Check whether a build artifact matches its sources.
+
+    Artifacts built before stamps existed are accepted if they are newer
+    than all of their sources.
+
+    Args:
+        output: Build artifact
+        stamp: Stamp file written after the last build
+        sources: Files the artifact is built from
+        version: Digest of the sources
+
+    Returns:
+        True if the build step can be skipped
+    """
+    if not output.exists():
+        return False
+
+    try:
+        data: object = orjson.loads(stamp.read_bytes())
+    except FileNotFoundError:
+        built_at = output.stat().st_mtime
+        return all(source.stat().st_mtime <= built_at for source in sources)
+    except (OSError, orjson.JSONDecodeError):
+        return False
+    return isinstance(data, dict) and data.get("sources") == version
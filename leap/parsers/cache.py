@@ -0,0 +1,144 @@
+"""
+On-disk cache of parser output.
+
+A parser's output only depends on the file content, its path (which is
+embedded in every entry) and the parser itself, so it is cached on disk under
+a hash of those three and reused across runs. This saves a round-trip to the
+Go, Ruby and JS/TS parser processes, and re-parsing of unchanged Python files
+on incremental runs.
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the default parser cache directory.
+
+    Returns:
+        $XDG_CACHE_HOME/leap/parsers, or ~/.cache/leap/parsers
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "leap" / "parsers"
+
+
+def sources_digest(*sources: Path) -> str:
+    """
+    Hash the source files of a parser.
+
+    Args:
+        *sources: Parser source files
+
+    Returns:
+        Hex digest of their content
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for source in sources:
+        h.update(source.read_bytes())
+    return h.hexdigest()
+
+
+class ParseCache:
+    """
+    Content-addressed store of parser JSON output.
+
+    Entries live in <directory>/<key[:2]>/<key>.json and are written
+    atomically, so concurrent runs (or worker processes) never observe a
+    partially written file.
+
+    Attributes:
+        directory: Cache directory
+        parser_version: Digest of the parser sources and the Python version
+            (plus strict mode); changing either invalidates every entry
+        by_stat: Key on the file's mtime and size instead of its content
+    """
+
+    def __init__(
+        self, directory: Path, *parser_sources: Path, by_stat: bool = False, strict: bool = False
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (created on first write)
+            *parser_sources: Source files of the parser
+            by_stat: Key on (mtime_ns, size) instead of the content, so a hit
+                needs no read of the file; an edit that keeps both is missed
+            strict: Whether the parser rejects invalid entries; lenient output
+                has them filtered out, so it must not be served to strict runs
+        """
+        self.directory = directory
+        self.by_stat = by_stat
+        python_version = f"{sys.version_info[0]}.{sys.version_info[1]}"
+        self.parser_version = f"{sources_digest(*parser_sources)}-{python_version}"
+        if strict:
+            self.parser_version += "-strict"
+
+    def key(self, file_path: Path) -> str:
+        """
+        Compute the cache key for a source file.
+
+        Args:
+            file_path: Source file to be parsed
+
+        Returns:
+            Hex digest of the parser version, file path and file content (or stat)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{self.parser_version}\0{file_path}\0".encode())
+        if self.by_stat:
+            stat = file_path.stat()
+            h.update(f"{stat.st_mtime_ns}\0{stat.st_size}".encode())
+        else:
+            h.update(file_path.read_bytes())
+        return h.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Look up cached parser output.
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            Raw JSON output of the parser, or None on a miss
+        """
+        try:
+            return self._path(key).read_bytes()
+        except OSError:
+            return None
+
+    def put(self, key: str, output: bytes) -> None:
+        """
+        Store parser output.
+
+        Failures are ignored: the cache is only an optimization.
+
+        Args:
+            key: Cache key from key()
+            output: Raw JSON output of the parser
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(output)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+
+    def _path(self, key: str) -> Path:
+        """Return the file path of a cache entry."""
+        return self.directory / key[:2] / f"{key}.json"
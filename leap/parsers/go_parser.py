@@ -5,11 +5,12 @@ This module provides a Python wrapper around the standalone Go parser
 that uses the go/parser and go/ast packages.
 """
 
-import json
 import subprocess
 from pathlib import Path
 
 from leap.parsers.base import BaseParser
+from leap.parsers.build import ensure_built
+from leap.parsers.sidecar import SidecarError, SidecarPool
 from leap.schemas import RawLogEntry
 from leap.utils.logger import get_logger
 
@@ -31,18 +32,29 @@ class GoParser(BaseParser):
     # Path to the Go parser binary
     _PARSER_DIR = Path(__file__).parent / "go_parser"
     _PARSER_BINARY = _PARSER_DIR / "go_parser"
+    _PARSER_SOURCES = (_PARSER_DIR / "main.go", _PARSER_DIR / "go.mod")
+    _USES_SIDECARS = True
 
     @classmethod
     def ensure_parser_built(cls) -> None:
         """
-        Ensure the Go parser binary is built.
+        Ensure the Go parser binary is built from the current sources.
+
+        Concurrent processes build it only once (see ensure_built).
 
         Raises:
             RuntimeError: If the binary cannot be built
         """
-        if cls._PARSER_BINARY.exists():
-            return
+        ensure_built(cls._PARSER_BINARY, cls._PARSER_SOURCES, cls._build_parser)
+
+    @classmethod
+    def _build_parser(cls) -> None:
+        """
+        Build the Go parser binary.
 
+        Raises:
+            RuntimeError: If the binary cannot be built
+        """
         logger.info("Building Go parser binary...")
 
         try:
@@ -64,10 +76,27 @@ class GoParser(BaseParser):
                 "Go compiler not found. Please install Go: https://golang.org/dl/"
             ) from e
 
+    @classmethod
+    def _start_sidecars(cls) -> SidecarPool:
+        """
+        Build the Go parser if needed and create its process pool.
+
+        Returns:
+            Pool running the parser binary in server mode
+
+        Raises:
+            RuntimeError: If the binary cannot be built
+        """
+        cls.ensure_parser_built()
+        return SidecarPool([str(cls._PARSER_BINARY), "--server"])
+
     def parse_file(self, file_path: Path) -> list[RawLogEntry]:
         """
         Parse a Go file and extract all log statements.
 
+        Files are sent to a long-lived parser process, so the binary starts
+        once per run instead of once per file.
+
         Args:
             file_path: Path to the Go source file
 
@@ -81,49 +110,23 @@ class GoParser(BaseParser):
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Ensure parser binary is built
-        self.ensure_parser_built()
+        cache_key, cached = self._cached_entries(file_path)
+        if cached is not None:
+            return cached
 
         try:
-            # Run the Go parser
-            result = subprocess.run(
-                [str(self._PARSER_BINARY), str(file_path)],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            # Parse JSON output
-            data = json.loads(result.stdout)
-
-            # Convert to RawLogEntry objects
-            entries = []
-            for item in data:
-                entry = RawLogEntry(
-                    language=item["language"],
-                    file_path=item["file_path"],
-                    line_number=item["line_number"],
-                    log_level=item["log_level"],
-                    log_template=item["log_template"],
-                    code_context=item["code_context"],
-                )
-                entries.append(entry)
-
-            return entries
-
-        except subprocess.CalledProcessError as e:
+            output = self._sidecar_pool().request(file_path)
+            entries = self._entries_from_output(output)
+        except SidecarError as e:
             logger.error(
-                f"Go parser failed for {file_path}: {e.stderr}",
-                extra={"context": {"file": str(file_path), "error": e.stderr}},
+                f"Go parser failed for {file_path}: {e}",
+                extra={"context": {"file": str(file_path), "error": str(e)}},
             )
             # Don't raise, just return empty list (parser might fail on invalid Go)
             return []
-        except json.JSONDecodeError as e:
-            logger.error(
-                f"Failed to parse Go parser output: {e}",
-                extra={"context": {"file": str(file_path), "output": result.stdout}},
-            )
-            return []
+
+        self._store_cached(cache_key, output)
+        return entries
 
     @staticmethod
     def get_supported_extensions() -> set[str]:
@@ -1,6 +1,7 @@
 package main
 
 import (
+	"bufio"
 	"encoding/json"
 	"fmt"
 	"go/ast"
@@ -20,6 +21,17 @@ type LogEntry struct {
 	CodeContext string  `json:"code_context"`
 }
 
+// request is one line of input in server mode
+type request struct {
+	Path string `json:"path"`
+}
+
+// response is one line of output in server mode
+type response struct {
+	Entries []LogEntry `json:"entries"`
+	Error   string     `json:"error,omitempty"`
+}
+
 // Visitor implements ast.Visitor for finding log calls
 type Visitor struct {
 	fset        *token.FileSet
@@ -30,8 +42,13 @@ type Visitor struct {
 }
 
 func main() {
+	if len(os.Args) == 2 && os.Args[1] == "--server" {
+		serve()
+		return
+	}
+
 	if len(os.Args) < 2 {
-		fmt.Fprintf(os.Stderr, "Usage: %s <go-file>\n", os.Args[0])
+		fmt.Fprintf(os.Stderr, "Usage: %s <go-file> | --server\n", os.Args[0])
 		os.Exit(1)
 	}
 
@@ -54,6 +71,37 @@ func main() {
 	fmt.Println(string(output))
 }
 
+// serve reads one JSON request per line from stdin ({"path": ...}) and writes
+// one JSON response per line ({"entries": [...]} or {"error": ...})
+func serve() {
+	scanner := bufio.NewScanner(os.Stdin)
+	scanner.Buffer(make([]byte, 64*1024), 16*1024*1024)
+	writer := bufio.NewWriter(os.Stdout)
+	encoder := json.NewEncoder(writer)
+
+	for scanner.Scan() {
+		var req request
+		var resp response
+
+		if err := json.Unmarshal(scanner.Bytes(), &req); err != nil {
+			resp.Error = fmt.Sprintf("invalid request: %v", err)
+		} else if entries, err := parseGoFile(req.Path); err != nil {
+			resp.Error = err.Error()
+		} else {
+			resp.Entries = entries
+		}
+
+		// Encode appends the newline that terminates the response
+		if err := encoder.Encode(resp); err != nil {
+			fmt.Fprintf(os.Stderr, "Error marshaling JSON: %v\n", err)
+			os.Exit(1)
+		}
+		if err := writer.Flush(); err != nil {
+			os.Exit(1)
+		}
+	}
+}
+
 func parseGoFile(filePath string) ([]LogEntry, error) {
 	// Read source file
 	sourceBytes, err := os.ReadFile(filePath)
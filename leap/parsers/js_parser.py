@@ -5,11 +5,12 @@ This module provides a Python wrapper around the standalone Node.js parser
 that uses acorn and @typescript-eslint/parser.
 """
 
-import json
 import subprocess
 from pathlib import Path
 
 from leap.parsers.base import BaseParser
+from leap.parsers.build import ensure_built
+from leap.parsers.sidecar import SidecarError, SidecarPool
 from leap.schemas import RawLogEntry
 from leap.utils.logger import get_logger
 
@@ -35,16 +36,34 @@ class JSParser(BaseParser):
     # Path to the JS parser script
     _PARSER_DIR = Path(__file__).parent / "js_parser"
     _PARSER_SCRIPT = _PARSER_DIR / "parser.js"
+    _PARSER_SOURCES = (_PARSER_SCRIPT, _PARSER_DIR / "package.json")
+    _USES_SIDECARS = True
     _DEPENDENCIES_INSTALLED = False
+    _NODE_AVAILABLE: bool | None = None
 
     @classmethod
     def check_node_available(cls) -> bool:
         """
         Check if Node.js is available.
 
+        The result is remembered for the lifetime of the process, so
+        `node --version` runs at most once.
+
         Returns:
             True if Node.js is available, False otherwise
         """
+        if cls._NODE_AVAILABLE is None:
+            cls._NODE_AVAILABLE = cls._probe_node()
+        return cls._NODE_AVAILABLE
+
+    @staticmethod
+    def _probe_node() -> bool:
+        """
+        Run `node --version` and check for Node.js >= 18.
+
+        Returns:
+            True if a suitable Node.js is installed, False otherwise
+        """
         try:
             result = subprocess.run(
                 ["node", "--version"],
@@ -62,7 +81,9 @@ class JSParser(BaseParser):
     @classmethod
     def ensure_dependencies_installed(cls) -> None:
         """
-        Ensure Node.js dependencies are installed.
+        Ensure Node.js dependencies are installed for the current package.json.
+
+        Concurrent processes install them only once (see ensure_built).
 
         Raises:
             RuntimeError: If dependencies cannot be installed
@@ -70,12 +91,21 @@ class JSParser(BaseParser):
         if cls._DEPENDENCIES_INSTALLED:
             return
 
-        # Check if node_modules exists
-        node_modules = cls._PARSER_DIR / "node_modules"
-        if node_modules.exists():
-            cls._DEPENDENCIES_INSTALLED = True
-            return
+        ensure_built(
+            cls._PARSER_DIR / "node_modules",
+            (cls._PARSER_DIR / "package.json",),
+            cls._install_dependencies,
+        )
+        cls._DEPENDENCIES_INSTALLED = True
+
+    @classmethod
+    def _install_dependencies(cls) -> None:
+        """
+        Install Node.js dependencies with npm.
 
+        Raises:
+            RuntimeError: If dependencies cannot be installed
+        """
         logger.info("Installing JavaScript parser dependencies...")
 
         try:
@@ -88,7 +118,6 @@ class JSParser(BaseParser):
                 text=True,
                 timeout=120,
             )
-            cls._DEPENDENCIES_INSTALLED = True
             logger.info("JavaScript parser dependencies installed successfully")
         except subprocess.TimeoutExpired as e:
             raise RuntimeError("npm install timed out") from e
@@ -101,10 +130,31 @@ class JSParser(BaseParser):
                 "npm not found. Please install Node.js: https://nodejs.org/"
             ) from e
 
+    @classmethod
+    def _start_sidecars(cls) -> SidecarPool:
+        """
+        Check Node.js and the parser dependencies and create the process pool.
+
+        Returns:
+            Pool running parser.js in server mode
+
+        Raises:
+            RuntimeError: If Node.js is not available or dependencies cannot be installed
+        """
+        if not cls.check_node_available():
+            raise RuntimeError(
+                "Node.js >= 18 not found. Please install Node.js: https://nodejs.org/"
+            )
+        cls.ensure_dependencies_installed()
+        return SidecarPool(["node", str(cls._PARSER_SCRIPT), "--server"])
+
     def parse_file(self, file_path: Path) -> list[RawLogEntry]:
         """
         Parse a JavaScript/TypeScript file and extract all log statements.
 
+        Files are sent to a long-lived parser.js process, so Node.js starts
+        (and loads the parser modules) once per run instead of once per file.
+
         Args:
             file_path: Path to the JS/TS source file
 
@@ -113,67 +163,35 @@ class JSParser(BaseParser):
 
         Raises:
             FileNotFoundError: If file doesn't exist
-            RuntimeError: If Node.js is not available or dependencies cannot be installed
+            RuntimeError: If Node.js is not available, dependencies cannot be
+                installed or the parser process dies
         """
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Check if Node.js is available
-        if not self.check_node_available():
-            raise RuntimeError(
-                "Node.js >= 18 not found. Please install Node.js: https://nodejs.org/"
-            )
-
-        # Ensure dependencies are installed
-        self.ensure_dependencies_installed()
+        cache_key, cached = self._cached_entries(file_path)
+        if cached is not None:
+            return cached
 
         try:
-            # Run the Node.js parser
-            result = subprocess.run(
-                ["node", str(self._PARSER_SCRIPT), str(file_path)],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=30,
-            )
-
-            # Parse JSON output
-            data = json.loads(result.stdout)
-
-            # Convert to RawLogEntry objects
-            entries = []
-            for item in data:
-                entry = RawLogEntry(
-                    language=item["language"],
-                    file_path=item["file_path"],
-                    line_number=item["line_number"],
-                    log_level=item["log_level"],
-                    log_template=item["log_template"],
-                    code_context=item["code_context"],
-                )
-                entries.append(entry)
-
-            return entries
-
+            output = self._sidecar_pool().request(file_path, timeout=30)
+            entries = self._entries_from_output(output)
         except subprocess.TimeoutExpired:
             logger.error(
                 f"JavaScript parser timed out for {file_path}",
                 extra={"context": {"file": str(file_path)}},
             )
             return []
-        except subprocess.CalledProcessError as e:
+        except SidecarError as e:
             logger.error(
-                f"JavaScript parser failed for {file_path}: {e.stderr}",
-                extra={"context": {"file": str(file_path), "error": e.stderr}},
+                f"JavaScript parser failed for {file_path}: {e}",
+                extra={"context": {"file": str(file_path), "error": str(e)}},
             )
             # Don't raise, just return empty list (parser might fail on invalid JS/TS)
             return []
-        except json.JSONDecodeError as e:
-            logger.error(
-                f"Failed to parse JavaScript parser output: {e}",
-                extra={"context": {"file": str(file_path), "output": result.stdout}},
-            )
-            return []
+
+        self._store_cached(cache_key, output)
+        return entries
 
     @staticmethod
     def get_supported_extensions() -> set[str]:
@@ -2,6 +2,7 @@
 
 const fs = require('fs');
 const path = require('path');
+const readline = require('readline');
 const acorn = require('acorn');
 const walk = require('acorn-walk');
 const { parse: tsParse } = require('@typescript-eslint/typescript-estree');
@@ -330,12 +331,51 @@ class JSLogParser {
   }
 }
 
+/**
+ * Parse one file and return its log entries
+ */
+function parseFile(filePath) {
+  const source = fs.readFileSync(filePath, 'utf-8');
+  const ext = path.extname(filePath).toLowerCase();
+  const isTypeScript = ext === '.ts' || ext === '.tsx';
+
+  const parser = new JSLogParser(source, filePath, isTypeScript);
+  return parser.parse();
+}
+
+/**
+ * Server mode: read one JSON request per line from stdin ({"path": ...})
+ * and write one JSON response per line ({"entries": [...]} or {"error": ...})
+ */
+async function serve() {
+  const rl = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+
+  for await (const line of rl) {
+    if (!line.trim()) {
+      continue;
+    }
+
+    let response;
+    try {
+      response = { entries: parseFile(JSON.parse(line).path) };
+    } catch (error) {
+      response = { error: error.message };
+    }
+    process.stdout.write(JSON.stringify(response) + '\n');
+  }
+}
+
 /**
  * Main execution
  */
 async function main() {
+  if (process.argv[2] === '--server') {
+    await serve();
+    return;
+  }
+
   if (process.argv.length < 3) {
-    console.error(`Usage: ${process.argv[1]} <js/ts-file>`);
+    console.error(`Usage: ${process.argv[1]} <js/ts-file> | --server`);
     process.exit(1);
   }
 
@@ -347,12 +387,7 @@ async function main() {
   }
 
   try {
-    const source = fs.readFileSync(filePath, 'utf-8');
-    const ext = path.extname(filePath).toLowerCase();
-    const isTypeScript = ext === '.ts' || ext === '.tsx';
-
-    const parser = new JSLogParser(source, filePath, isTypeScript);
-    const entries = parser.parse();
+    const entries = parseFile(filePath);
 
     // Output as JSON
     console.log(JSON.stringify(entries, null, 2));
@@ -10,11 +10,37 @@ and extract logging statements. It handles various logging patterns:
 """
 
 import ast
+import bisect
+import functools
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
-from leap.parsers.base import BaseParser
+from leap.parsers.base import BaseParser, ParseOutcome, _parse_one
 from leap.schemas import RawLogEntry
 
+# Below this many files, worker start-up costs more than parallel parsing saves
+_PARALLEL_PARSE_MIN_FILES = 64
+
+# Common logger names and logging module functions
+_LOGGER_NAMES = frozenset({"logging", "logger", "log", "_logger", "_log"})
+
+# Mapping of logging function names to log levels
+_LOG_LEVELS = MappingProxyType(
+    {
+        "debug": "debug",
+        "info": "info",
+        "warning": "warn",
+        "warn": "warn",
+        "error": "error",
+        "critical": "fatal",
+        "fatal": "fatal",
+        "exception": "error",  # exception is error-level with traceback
+    }
+)
+
 
 class PythonParser(BaseParser):
     """
@@ -27,26 +53,9 @@ class PythonParser(BaseParser):
     - Complex attribute chains (e.g., app.logger.info)
     """
 
-    # Common logger names and logging module functions
-    LOGGER_NAMES = {
-        "logging",
-        "logger",
-        "log",
-        "_logger",
-        "_log",
-    }
-
-    # Mapping of logging function names to log levels
-    LOG_LEVELS = {
-        "debug": "debug",
-        "info": "info",
-        "warning": "warn",
-        "warn": "warn",
-        "error": "error",
-        "critical": "fatal",
-        "fatal": "fatal",
-        "exception": "error",  # exception is error-level with traceback
-    }
+    # Unchanged files are served from the cache after a single stat
+    _PARSER_SOURCES = (Path(__file__),)
+    _CACHE_BY_STAT = True
 
     def parse_file(self, file_path: Path) -> list[RawLogEntry]:
         """
@@ -62,13 +71,84 @@ class PythonParser(BaseParser):
             FileNotFoundError: If file doesn't exist
             SyntaxError: If file contains invalid Python syntax
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # A missing file fails on the cache lookup or the read, no separate stat
+        try:
+            cache_key, cached = self._cached_entries(file_path)
+            if cached is not None:
+                return cached
+            source = file_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+
+        entries = self.parse_source(source, file_path)
+        if cache_key is not None:
+            self._store_cached(cache_key, self._output_from_entries(entries))
+        return entries
+
+    def iter_file(self, file_path: Path) -> Iterator[RawLogEntry]:
+        """
+        Parse a Python file, yielding log statements as they are found.
+
+        With a cache the file's entries are collected (to be stored) and
+        yielded afterwards, as by the base implementation.
+
+        Args:
+            file_path: Path to the Python source file
+
+        Yields:
+            One entry per log statement
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            SyntaxError: If file contains invalid Python syntax
+        """
+        if self.cache is not None:
+            yield from self.parse_file(file_path)
+            return
+
+        try:
+            source = file_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        yield from self.iter_source(source, file_path)
+
+    def parse_source(self, source: bytes | str, file_path: Path | str) -> list[RawLogEntry]:
+        """
+        Extract all log statements from already loaded Python source.
+
+        Args:
+            source: Source code (bytes are decoded as UTF-8)
+            file_path: Path reported in the entries and in syntax errors
+
+        Returns:
+            List of RawLogEntry objects for each log statement found
+
+        Raises:
+            SyntaxError: If the source contains invalid Python syntax
+            UnicodeDecodeError: If bytes are not valid UTF-8
+        """
+        return list(self.iter_source(source, file_path))
+
+    def iter_source(self, source: bytes | str, file_path: Path | str) -> Iterator[RawLogEntry]:
+        """
+        Extract log statements from already loaded Python source as they are found.
+
+        The source is parsed on the first next(), so errors surface there.
 
-        # Read the source code
-        source_code = file_path.read_text(encoding="utf-8")
+        Args:
+            source: Source code (bytes are decoded as UTF-8)
+            file_path: Path reported in the entries and in syntax errors
+
+        Yields:
+            One entry per log statement
+
+        Raises:
+            SyntaxError: If the source contains invalid Python syntax
+            UnicodeDecodeError: If bytes are not valid UTF-8
+        """
+        source_code = source.decode("utf-8") if isinstance(source, bytes) else source
         if not source_code.strip():
-            return []
+            return
 
         # Parse into AST
         try:
@@ -76,14 +156,43 @@ class PythonParser(BaseParser):
         except SyntaxError as e:
             raise SyntaxError(f"Invalid Python syntax in {file_path}: {e}") from e
 
-        # Split source into lines for context extraction
-        source_lines = source_code.splitlines()
+        # Most files have no (or few) log calls: skip the walk entirely, or
+        # prune statements that cannot contain one
+        candidate_lines = _candidate_lines(
+            source if isinstance(source, bytes) else source_code.encode(errors="surrogatepass")
+        )
+        if candidate_lines == []:
+            return
+
+        # Walk the AST and yield log entries
+        visitor = LogCallVisitor(file_path, source_code, self._new_entry, candidate_lines)
+        yield from visitor.iter_entries(tree)
+
+    def _map_parse(self, file_paths: list[Path], workers: int | None) -> Iterable[ParseOutcome]:
+        """
+        Parse files, capturing errors instead of raising.
+
+        Parsing is CPU-bound and holds the GIL, so large batches of files are
+        spread across worker processes.
 
-        # Walk the AST and collect log entries
-        visitor = LogCallVisitor(file_path, source_lines)
-        visitor.visit(tree)
+        Args:
+            file_paths: Paths to the source files to parse
+            workers: Number of worker processes (None: CPU count)
 
-        return visitor.log_entries
+        Returns:
+            One outcome per file, in file order
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(file_paths) < _PARALLEL_PARSE_MIN_FILES:
+            return super()._map_parse(file_paths, workers)
+
+        # About four chunks per worker: few enough to keep IPC overhead low,
+        # enough to even out files of very different sizes
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(functools.partial(_parse_one, self), file_paths, chunksize=chunksize)
+            )
 
     @staticmethod
     def get_supported_extensions() -> set[str]:
@@ -104,76 +213,126 @@ class LogCallVisitor(ast.NodeVisitor):
     that match logging patterns (e.g., logger.info(), logging.error(), etc.).
     """
 
-    # Common logger names and logging module functions
-    LOGGER_NAMES = {
-        "logging",
-        "logger",
-        "log",
-        "_logger",
-        "_log",
-    }
-
-    # Mapping of logging function names to log levels
-    LOG_LEVELS = {
-        "debug": "debug",
-        "info": "info",
-        "warning": "warn",
-        "warn": "warn",
-        "error": "error",
-        "critical": "fatal",
-        "fatal": "fatal",
-        "exception": "error",  # exception is error-level with traceback
-    }
-
-    def __init__(self, file_path: Path, source_lines: list[str]) -> None:
+    def __init__(
+        self,
+        file_path: Path | str,
+        source_code: str,
+        new_entry: Callable[..., RawLogEntry | None] = RawLogEntry,
+        candidate_lines: list[int] | None = None,
+    ) -> None:
         """
         Initialize the visitor.
 
         Args:
             file_path: Path to the source file being parsed
-            source_lines: List of source code lines (for context extraction)
+            source_code: Source code (for context extraction)
+            new_entry: Factory for log entries (the parser's _new_entry);
+                entries it returns None for are skipped
+            candidate_lines: Sorted line numbers that mention a log method;
+                statements spanning none of them are skipped (None visits all)
         """
         self.file_path = file_path
-        self.source_lines = source_lines
+        # Shared by every entry of this file
+        self.file_path_str = str(file_path)
+        self.source_code = source_code
+        # Code blocks by (start_line, end_line); every log call of a function
+        # shares the function as context
+        self._code_blocks: dict[tuple[int, int], str] = {}
+        self.new_entry = new_entry
         self.log_entries: list[RawLogEntry] = []
         self.current_function: ast.FunctionDef | ast.AsyncFunctionDef | None = None
         self.current_class: ast.ClassDef | None = None
+        self.candidate_lines = candidate_lines
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Visit function definition to track context."""
-        old_function = self.current_function
-        self.current_function = node
-        self.generic_visit(node)
-        self.current_function = old_function
+    @functools.cached_property
+    def source_lines(self) -> list[str]:
+        """
+        Source code lines, split on the first context extraction.
 
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Visit async function definition to track context."""
-        old_function = self.current_function
-        self.current_function = node
-        self.generic_visit(node)
-        self.current_function = old_function
+        NOTE: Candidate lines often turn out not to hold a log call (e.g. an
+        "error" variable), so files without entries are never split. A newline
+        offset index built in Python costs more than the C-level splitlines(),
+        so context blocks are still joined from lines (and memoized).
+        """
+        return self.source_code.splitlines()
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Visit class definition to track context."""
-        old_class = self.current_class
-        self.current_class = node
-        self.generic_visit(node)
-        self.current_class = old_class
+    def visit(self, node: ast.AST) -> None:
+        """
+        Collect the logging calls under a node into log_entries.
 
-    def visit_Call(self, node: ast.Call) -> None:
+        Args:
+            node: Root node (usually the module)
         """
-        Visit function call nodes to identify logging calls.
+        self.log_entries.extend(self.iter_entries(node))
 
-        This method checks if a function call is a logging call by analyzing
-        the call's attribute chain (e.g., logger.info, self.log.error, etc.).
+    def iter_entries(self, node: ast.AST) -> Iterator[RawLogEntry]:
         """
-        if self._is_logging_call(node):
-            log_entry = self._extract_log_entry(node)
-            if log_entry:
-                self.log_entries.append(log_entry)
+        Yield the logging calls under a node as they are found.
 
-        # Continue visiting child nodes
-        self.generic_visit(node)
+        NOTE: The tree is walked with an explicit stack rather than NodeVisitor's
+        visit_* dispatch, which costs a string concatenation and attribute lookup
+        per node. Each stack item carries its enclosing function and class, and
+        children are pushed in reverse so calls are found in source order of the
+        recursive walk. Statements that cannot contain a log call are skipped.
+
+        Args:
+            node: Root node (usually the module)
+
+        Yields:
+            One entry per logging call
+        """
+        candidate_lines = self.candidate_lines
+        outer_function, outer_class = self.current_function, self.current_class
+        stack: list[
+            tuple[ast.AST, ast.FunctionDef | ast.AsyncFunctionDef | None, ast.ClassDef | None]
+        ] = [(node, outer_function, outer_class)]
+
+        try:
+            while stack:
+                node, function, cls = stack.pop()
+
+                if isinstance(node, ast.Call):
+                    if self._is_logging_call(node):
+                        self.current_function, self.current_class = function, cls
+                        log_entry = self._extract_log_entry(node)
+                        if log_entry:
+                            yield log_entry
+                elif isinstance(node, ast.stmt):
+                    if candidate_lines is not None and not self._spans_candidate(node):
+                        continue
+                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        function = node
+                    elif isinstance(node, ast.ClassDef):
+                        cls = node
+
+                for name in reversed(node._fields):
+                    value = getattr(node, name, None)
+                    if isinstance(value, list):
+                        for item in reversed(value):
+                            if isinstance(item, ast.AST):
+                                stack.append((item, function, cls))
+                    elif isinstance(value, ast.AST):
+                        stack.append((value, function, cls))
+        finally:
+            self.current_function, self.current_class = outer_function, outer_class
+
+    def _spans_candidate(self, node: ast.stmt) -> bool:
+        """
+        Check whether a statement spans a line that mentions a log method.
+
+        Args:
+            node: Statement node (decorators count as part of it)
+
+        Returns:
+            True if the statement may contain a log call
+        """
+        decorators = getattr(node, "decorator_list", None)
+        start = decorators[0].lineno if decorators else node.lineno
+        end = node.end_lineno or start
+
+        lines = self.candidate_lines or []
+        i = bisect.bisect_left(lines, start)
+        return i < len(lines) and lines[i] <= end
 
     def _is_logging_call(self, node: ast.Call) -> bool:
         """
@@ -196,10 +355,13 @@ class LogCallVisitor(ast.NodeVisitor):
         # Case 1: Direct call like logging.info()
         if isinstance(func, ast.Attribute):
             # Get the method name (e.g., "info", "error")
-            method_name = func.attr.lower()
+            method_name = func.attr
 
-            # Check if it's a known log level
-            if method_name not in self.LOG_LEVELS:
+            # Check if it's a known log level; names are nearly always
+            # lowercase already, so only other names pay for lower()
+            if method_name not in _LOG_LEVELS and (
+                method_name.islower() or method_name.lower() not in _LOG_LEVELS
+            ):
                 return False
 
             # Check if the object is a logger (e.g., logging, logger, self.log)
@@ -222,20 +384,18 @@ class LogCallVisitor(ast.NodeVisitor):
         Returns:
             True if this represents a logger object
         """
-        # Case 1: Simple name (e.g., "logger", "logging")
-        if isinstance(node, ast.Name):
-            return node.id.lower() in self.LOGGER_NAMES
+        logger_names = _LOGGER_NAMES
 
-        # Case 2: Attribute access (e.g., "self.logger", "app.log")
-        if isinstance(node, ast.Attribute):
-            attr_name = node.attr.lower()
-            # Check if the attribute name is a logger name
-            if attr_name in self.LOGGER_NAMES:
+        # Attribute chains are left-leaning (a.b.c is Attribute(Attribute(a, b), c)),
+        # so walk them in a loop: any attribute named like a logger matches
+        # (e.g., "self.logger", "app.log")
+        while isinstance(node, ast.Attribute):
+            if _in_lowercase_set(node.attr, logger_names):
                 return True
-            # Recursively check the base object
-            return self._is_logger_object(node.value)
+            node = node.value
 
-        return False
+        # The chain ends in a simple name (e.g., "logger", "logging")
+        return isinstance(node, ast.Name) and _in_lowercase_set(node.id, logger_names)
 
     def _extract_log_entry(self, node: ast.Call) -> RawLogEntry | None:
         """
@@ -252,7 +412,7 @@ class LogCallVisitor(ast.NodeVisitor):
             return None
 
         method_name = node.func.attr.lower()
-        log_level = self.LOG_LEVELS.get(method_name)
+        log_level = _LOG_LEVELS.get(method_name)
 
         # Get line number
         line_number = node.lineno
@@ -265,9 +425,9 @@ class LogCallVisitor(ast.NodeVisitor):
         # Extract code context (the surrounding function or block)
         code_context = self._extract_context_for_node(node)
 
-        return RawLogEntry(
+        return self.new_entry(
             language="python",
-            file_path=str(self.file_path),
+            file_path=self.file_path_str,
             line_number=line_number,
             log_level=log_level,
             log_template=log_template,
@@ -296,8 +456,11 @@ class LogCallVisitor(ast.NodeVisitor):
         # The first argument is typically the message
         msg_node = node.args[0]
 
-        # Convert the AST node back to source code
-        return ast.unparse(msg_node)
+        # Convert the AST node back to source code; plain strings and simple
+        # f-strings are rendered directly, ast.unparse builds an _Unparser
+        # visitor per call
+        template = _render_simple_message(msg_node)
+        return template if template is not None else ast.unparse(msg_node)
 
     def _extract_context_for_node(self, node: ast.Call) -> str:
         """
@@ -332,6 +495,9 @@ class LogCallVisitor(ast.NodeVisitor):
         """
         Extract a block of code from source lines.
 
+        Blocks are memoized, so log-dense functions join their lines once and
+        all their entries share one context string.
+
         Args:
             start_line: Starting line (0-indexed)
             end_line: Ending line (0-indexed, exclusive)
@@ -342,4 +508,156 @@ class LogCallVisitor(ast.NodeVisitor):
         if start_line < 0 or end_line > len(self.source_lines):
             return ""
 
-        return "\n".join(self.source_lines[start_line:end_line])
+        key = (start_line, end_line)
+        block = self._code_blocks.get(key)
+        if block is None:
+            block = self._code_blocks[key] = "\n".join(self.source_lines[start_line:end_line])
+        return block
+
+
+# Log method and logger names, searched for in the lowercased source
+# (_is_logging_call and _is_logger_object match them case-insensitively)
+_LOG_METHOD_NAMES = tuple(name.encode() for name in _LOG_LEVELS)
+_LOGGER_NAME_BYTES = tuple(name.encode() for name in _LOGGER_NAMES)
+
+# Bytes that continue an ASCII identifier ("ValueError" is no candidate)
+_IDENTIFIER_BYTES = frozenset(
+    b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_"
+)
+
+
+def _candidate_lines(source: bytes) -> list[int] | None:
+    """
+    Find the lines that mention a log method name.
+
+    A log call's method name is an identifier in the source, so statements
+    spanning none of these lines cannot contain a log call. Its receiver
+    must also name a logger somewhere in its attribute chain (see
+    _is_logger_object), so a file without any logger-like identifier has no
+    candidates at all.
+
+    NOTE: One bytes.find pass per name over the lowercased bytes is several
+    times faster than a case-insensitive regex alternation, which tries every
+    position in Python's regex engine.
+
+    Args:
+        source: UTF-8 encoded Python source code
+
+    Returns:
+        Sorted 1-indexed line numbers as counted by ast, or None when lines
+        cannot be counted reliably (bare carriage-return line endings)
+    """
+    lowered = source.lower()
+    if next(_identifier_offsets(lowered, _LOGGER_NAME_BYTES), None) is None:
+        return []
+
+    if b"\r" in source and source.count(b"\r") != source.count(b"\r\n"):
+        return None
+
+    lines: list[int] = []
+    line = 1
+    pos = 0
+    for offset in sorted(_identifier_offsets(lowered, _LOG_METHOD_NAMES)):
+        line += source.count(b"\n", pos, offset)
+        pos = offset
+        if not lines or lines[-1] != line:
+            lines.append(line)
+    return lines
+
+
+def _identifier_offsets(lowered: bytes, names: tuple[bytes, ...]) -> Iterator[int]:
+    """
+    Find whole-identifier occurrences of names.
+
+    Args:
+        lowered: Lowercased source code
+        names: Lowercase names to look for
+
+    Yields:
+        Offset of each occurrence, name by name
+    """
+    size = len(lowered)
+    find = lowered.find
+    for name in names:
+        end = len(name)
+        i = find(name)
+        while i != -1:
+            if (i == 0 or lowered[i - 1] not in _IDENTIFIER_BYTES) and (
+                i + end >= size or lowered[i + end] not in _IDENTIFIER_BYTES
+            ):
+                yield i
+            i = find(name, i + end)
+
+
+def _in_lowercase_set(name: str, names: frozenset[str]) -> bool:
+    """Case-insensitive membership in a set of lowercase names, lowering only if needed."""
+    return name in names or (not name.islower() and name.lower() in names)
+
+
+def _render_simple_message(node: ast.expr) -> str | None:
+    """
+    Render a plain string or simple f-string exactly as ast.unparse would.
+
+    Handles string constants and f-strings interpolating names or attribute
+    chains without conversion or format spec, as long as no quoting or
+    escaping is involved.
+
+    Args:
+        node: Message argument of a log call
+
+    Returns:
+        Source text of the node, or None if ast.unparse is needed
+    """
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, str) and node.kind is None and _is_plain_text(value):
+            # Same quote choice as ast.unparse: single unless the text has one
+            return repr(value)
+        return None
+
+    if not isinstance(node, ast.JoinedStr):
+        return None
+
+    parts: list[str] = []
+    for part in node.values:
+        if isinstance(part, ast.Constant) and isinstance(part.value, str):
+            if not _is_plain_text(part.value) or "'" in part.value:
+                return None
+            parts.append(part.value.replace("{", "{{").replace("}", "}}"))
+        elif (
+            isinstance(part, ast.FormattedValue)
+            and part.conversion == -1
+            and part.format_spec is None
+        ):
+            name = _dotted_name(part.value)
+            if name is None:
+                return None
+            parts.append(f"{{{name}}}")
+        else:
+            return None
+    return f"f'{''.join(parts)}'"
+
+
+def _is_plain_text(value: str) -> bool:
+    """Check whether a string literal needs no escapes and fits one quote type."""
+    return value.isprintable() and "\\" not in value and not ("'" in value and '"' in value)
+
+
+def _dotted_name(node: ast.expr) -> str | None:
+    """
+    Render a name or attribute chain (e.g. self.user.id).
+
+    Args:
+        node: Expression node
+
+    Returns:
+        The dotted name, or None for any other expression
+    """
+    attrs: list[str] = []
+    while isinstance(node, ast.Attribute):
+        attrs.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    attrs.append(node.id)
+    return ".".join(reversed(attrs))
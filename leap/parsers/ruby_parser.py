@@ -5,16 +5,28 @@ This module provides a Python wrapper around the standalone Ruby parser
 that uses the Ripper module.
 """
 
-import json
+import itertools
 import subprocess
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from leap.parsers.base import BaseParser
+from pydantic import ValidationError
+
+from leap.parsers.base import BaseParser, ParseOutcome, _parse_one
+from leap.parsers.sidecar import SidecarError, SidecarPool
 from leap.schemas import RawLogEntry
 from leap.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds to wait for parser.rb to answer a file (or a batch of files)
+_PARSE_TIMEOUT = 30
+
+# Files per pipelined batch: enough to hide the round-trip per file, few
+# enough to spread a run across the process pool
+_MAX_BATCH_SIZE = 32
+
 
 class RubyParser(BaseParser):
     """
@@ -31,15 +43,33 @@ class RubyParser(BaseParser):
 
     # Path to the Ruby parser script
     _PARSER_SCRIPT = Path(__file__).parent / "ruby_parser" / "parser.rb"
+    _PARSER_SOURCES = (_PARSER_SCRIPT,)
+    _USES_SIDECARS = True
+    _RUBY_AVAILABLE: bool | None = None
 
     @classmethod
     def check_ruby_available(cls) -> bool:
         """
         Check if Ruby is available.
 
+        The result is remembered for the lifetime of the process, so
+        `ruby --version` runs at most once.
+
         Returns:
             True if Ruby is available, False otherwise
         """
+        if cls._RUBY_AVAILABLE is None:
+            cls._RUBY_AVAILABLE = cls._probe_ruby()
+        return cls._RUBY_AVAILABLE
+
+    @staticmethod
+    def _probe_ruby() -> bool:
+        """
+        Run `ruby --version`.
+
+        Returns:
+            True if Ruby is installed, False otherwise
+        """
         try:
             subprocess.run(
                 ["ruby", "--version"],
@@ -51,10 +81,30 @@ class RubyParser(BaseParser):
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
             return False
 
+    @classmethod
+    def _start_sidecars(cls) -> SidecarPool:
+        """
+        Check that Ruby is available and create the parser process pool.
+
+        Returns:
+            Pool running parser.rb in server mode
+
+        Raises:
+            RuntimeError: If Ruby is not available
+        """
+        if not cls.check_ruby_available():
+            raise RuntimeError(
+                "Ruby interpreter not found. Please install Ruby: https://www.ruby-lang.org/"
+            )
+        return SidecarPool(["ruby", str(cls._PARSER_SCRIPT), "--server"])
+
     def parse_file(self, file_path: Path) -> list[RawLogEntry]:
         """
         Parse a Ruby file and extract all log statements.
 
+        Files are sent to a long-lived parser.rb process, so the Ruby
+        interpreter starts once per run instead of once per file.
+
         Args:
             file_path: Path to the Ruby source file
 
@@ -63,65 +113,132 @@ class RubyParser(BaseParser):
 
         Raises:
             FileNotFoundError: If file doesn't exist
-            RuntimeError: If Ruby is not available
+            RuntimeError: If Ruby is not available or the parser process dies
         """
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Check if Ruby is available
-        if not self.check_ruby_available():
-            raise RuntimeError(
-                "Ruby interpreter not found. Please install Ruby: https://www.ruby-lang.org/"
-            )
+        cache_key, cached = self._cached_entries(file_path)
+        if cached is not None:
+            return cached
 
         try:
-            # Run the Ruby parser
-            result = subprocess.run(
-                ["ruby", str(self._PARSER_SCRIPT), str(file_path)],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=30,
-            )
-
-            # Parse JSON output
-            data = json.loads(result.stdout)
-
-            # Convert to RawLogEntry objects
-            entries = []
-            for item in data:
-                entry = RawLogEntry(
-                    language=item["language"],
-                    file_path=item["file_path"],
-                    line_number=item["line_number"],
-                    log_level=item["log_level"],
-                    log_template=item["log_template"],
-                    code_context=item["code_context"],
-                )
-                entries.append(entry)
-
-            return entries
-
+            output = self._sidecar_pool().request(file_path, timeout=_PARSE_TIMEOUT)
         except subprocess.TimeoutExpired:
             logger.error(
                 f"Ruby parser timed out for {file_path}",
                 extra={"context": {"file": str(file_path)}},
             )
             return []
-        except subprocess.CalledProcessError as e:
-            logger.error(
-                f"Ruby parser failed for {file_path}: {e.stderr}",
-                extra={"context": {"file": str(file_path), "error": e.stderr}},
+
+        return self._entries_from_response(file_path, cache_key, output)
+
+    def _map_parse(self, file_paths: list[Path], workers: int | None) -> Iterable[ParseOutcome]:
+        """
+        Parse files in pipelined batches, capturing errors instead of raising.
+
+        Each batch is sent to one parser.rb process without waiting for a
+        response per file (see SidecarPool.request_many); batches are spread
+        across the process pool.
+
+        Args:
+            file_paths: Paths to the source files to parse
+            workers: Maximum number of parallel workers (None: pool size)
+
+        Returns:
+            One outcome per file, in file order
+        """
+        if len(file_paths) < 2:
+            return super()._map_parse(file_paths, workers)
+
+        pool = self._sidecar_pool()
+        threads = min(pool.size, workers or pool.size)
+        batch_size = min(_MAX_BATCH_SIZE, -(-len(file_paths) // threads))
+        batches = [file_paths[i : i + batch_size] for i in range(0, len(file_paths), batch_size)]
+        with ThreadPoolExecutor(max_workers=min(threads, len(batches))) as executor:
+            return list(itertools.chain.from_iterable(executor.map(self._parse_batch, batches)))
+
+    def _parse_batch(self, file_paths: list[Path]) -> list[ParseOutcome]:
+        """
+        Parse a batch of files on one parser process, capturing errors.
+
+        Missing and cached files are answered without the process. If the
+        process dies or times out, the batch is retried file by file so only
+        the offending file fails.
+
+        Args:
+            file_paths: Files to parse
+
+        Returns:
+            One outcome per file, in file order
+
+        Raises:
+            pydantic.ValidationError: If the parser is strict and an entry is invalid
+        """
+        outcomes: list[ParseOutcome] = []
+        pending: list[tuple[int, str | None]] = []
+        for i, file_path in enumerate(file_paths):
+            if file_path.exists():
+                cache_key, cached = self._cached_entries(file_path)
+                if cached is None:
+                    pending.append((i, cache_key))
+                    outcomes.append(([], None, None))
+                    continue
+                outcomes.append((cached, None, None))
+            else:
+                outcomes.append(_parse_one(self, file_path))
+
+        if not pending:
+            return outcomes
+
+        try:
+            outputs = self._sidecar_pool().request_many(
+                [file_paths[i] for i, _ in pending], timeout=_PARSE_TIMEOUT
             )
-            # Don't raise, just return empty list (parser might fail on invalid Ruby)
-            return []
-        except json.JSONDecodeError as e:
+        except (subprocess.TimeoutExpired, RuntimeError):
+            for i, _ in pending:
+                outcomes[i] = _parse_one(self, file_paths[i])
+            return outcomes
+
+        for (i, cache_key), output in zip(pending, outputs, strict=True):
+            try:
+                entries = self._entries_from_response(file_paths[i], cache_key, output)
+                outcomes[i] = (entries, None, None)
+            except ValidationError as e:
+                if self.strict:
+                    raise
+                outcomes[i] = ([], "error", str(e))
+            except Exception as e:
+                outcomes[i] = ([], "error", str(e))
+        return outcomes
+
+    def _entries_from_response(
+        self, file_path: Path, cache_key: str | None, output: bytes
+    ) -> list[RawLogEntry]:
+        """
+        Decode parser.rb's response for a file and cache it.
+
+        Args:
+            file_path: File the response is for
+            cache_key: Cache key of the file (None: caching disabled)
+            output: Raw response line
+
+        Returns:
+            The file's entries (empty if parser.rb reported an error)
+        """
+        try:
+            entries = self._entries_from_output(output)
+        except SidecarError as e:
             logger.error(
-                f"Failed to parse Ruby parser output: {e}",
-                extra={"context": {"file": str(file_path), "output": result.stdout}},
+                f"Ruby parser failed for {file_path}: {e}",
+                extra={"context": {"file": str(file_path), "error": str(e)}},
             )
+            # Don't raise, just return empty list (parser might fail on invalid Ruby)
             return []
 
+        self._store_cached(cache_key, output)
+        return entries
+
     @staticmethod
     def get_supported_extensions() -> set[str]:
         """Return supported file extensions for Ruby."""
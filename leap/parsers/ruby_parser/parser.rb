@@ -110,9 +110,37 @@ class RubyLogParser
   end
 end
 
+# Parse one file and return its log entries as hashes
+def parse_file(file_path)
+  RubyLogParser.new(File.read(file_path), file_path).parse.map(&:to_h)
+end
+
+# Server mode: read one JSON request per line from stdin ({"path": ...})
+# and write one JSON response per line ({"entries": [...]} or {"error": ...})
+def serve
+  $stdout.sync = true
+
+  $stdin.each_line do |line|
+    next if line.strip.empty?
+
+    response =
+      begin
+        { entries: parse_file(JSON.parse(line).fetch('path')) }
+      rescue StandardError => e
+        { error: e.message }
+      end
+    $stdout.puts(JSON.generate(response))
+  end
+end
+
 # Main execution
+if ARGV.first == '--server'
+  serve
+  exit 0
+end
+
 if ARGV.length < 1
-  warn "Usage: #{$PROGRAM_NAME} <ruby-file>"
+  warn "Usage: #{$PROGRAM_NAME} <ruby-file> | --server"
   exit 1
 end
 
@@ -124,13 +152,9 @@ unless File.exist?(file_path)
 end
 
 begin
-  source = File.read(file_path)
-
-  parser = RubyLogParser.new(source, file_path)
-  entries = parser.parse
+  output = parse_file(file_path)
 
   # Output as JSON
-  output = entries.map(&:to_h)
   puts JSON.pretty_generate(output)
 rescue => e
   warn "Error parsing file: #{e.message}"
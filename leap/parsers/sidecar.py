@@ -0,0 +1,284 @@
+"""
+Long-lived external parser processes.
+
+Starting a Go, Node.js or Ruby runtime costs far more than parsing a typical
+source file. Instead of running the parser once per file, each parser is
+started once in server mode and fed one request per file over a pipe:
+
+    request:  {"path": "<file>"}\\n
+    response: {"entries": [...]}\\n   or   {"error": "<message>"}\\n
+
+Responses come in request order, so requests can be pipelined.
+"""
+
+import atexit
+import os
+import queue
+import subprocess
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+import orjson
+
+# Read responses in chunks of the Linux pipe capacity; the default 8 KiB
+# buffer needs several times more read calls for large files' responses
+_PIPE_BUFFER_SIZE = 1 << 16
+
+# Requests written ahead of reading their responses; staying within the
+# smallest common pipe capacity (macOS) means the write never blocks, even
+# while the parser is blocked writing responses
+_PIPELINE_MAX_BYTES = 1 << 14
+
+
+class SidecarError(RuntimeError):
+    """Raised when a parser process reports that it failed to parse a file."""
+
+
+class ParserSidecar:
+    """
+    One parser process speaking newline-delimited JSON over stdin/stdout.
+
+    The process is started on the first request and restarted if it exits.
+    Requests must not be issued concurrently (see SidecarPool).
+
+    Attributes:
+        command: Command starting the parser in server mode
+    """
+
+    def __init__(self, command: list[str]) -> None:
+        """
+        Initialize the sidecar (the process is started lazily).
+
+        Args:
+            command: Command starting the parser in server mode
+        """
+        self.command = command
+        self._process: subprocess.Popen[bytes] | None = None
+
+    def request(self, file_path: Path, timeout: float | None = None) -> bytes:
+        """
+        Parse one file.
+
+        Args:
+            file_path: File to parse
+            timeout: Seconds to wait for the response (None waits forever)
+
+        Returns:
+            The raw response line; decoding it is left to the caller
+
+        Raises:
+            subprocess.TimeoutExpired: If no response arrives in time (the
+                process is killed and restarted on the next request)
+            RuntimeError: If the process exits unexpectedly
+        """
+        return self.request_many([file_path], timeout)[0]
+
+    def request_many(self, file_paths: list[Path], timeout: float | None = None) -> list[bytes]:
+        """
+        Parse several files, pipelining the requests.
+
+        Requests are written ahead of reading the responses (up to
+        _PIPELINE_MAX_BYTES at a time), so the parser works through them
+        without waiting for a round-trip per file.
+
+        Args:
+            file_paths: Files to parse
+            timeout: Seconds to wait for all responses (None waits forever)
+
+        Returns:
+            The raw response lines, in request order
+
+        Raises:
+            subprocess.TimeoutExpired: If the responses do not arrive in time
+                (the process is killed and restarted on the next request)
+            RuntimeError: If the process exits unexpectedly
+        """
+        process = self._start()
+        stdin, stdout = self._pipes(process)
+
+        expired = threading.Event()
+        timer = None
+        if timeout is not None:
+
+            def kill() -> None:
+                expired.set()
+                process.kill()
+
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+
+        responses: list[bytes] = []
+        try:
+            for batch in _pipeline_batches(file_paths):
+                stdin.write(b"".join(batch))
+                stdin.flush()
+                for _ in batch:
+                    line = stdout.readline()
+                    if not line:
+                        break
+                    responses.append(line)
+        except OSError:
+            pass
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+        if len(responses) < len(file_paths):
+            self.close()
+            if expired.is_set():
+                raise subprocess.TimeoutExpired(self.command, timeout or 0)
+            raise RuntimeError(f"Parser process exited unexpectedly: {' '.join(self.command)}")
+        return responses
+
+    def close(self) -> None:
+        """Stop the process (it exits on end of input)."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        for pipe in (process.stdin, process.stdout):
+            if pipe is not None:
+                try:
+                    pipe.close()
+                except OSError:
+                    pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def _start(self) -> "subprocess.Popen[bytes]":
+        """Return the running process, starting it if needed."""
+        if self._process is None or self._process.poll() is not None:
+            # NOTE: stderr is discarded; per-file errors are reported in-band
+            self._process = subprocess.Popen(
+                self.command,
+                bufsize=_PIPE_BUFFER_SIZE,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    @staticmethod
+    def _pipes(process: "subprocess.Popen[bytes]") -> tuple[IO[bytes], IO[bytes]]:
+        """Return the (stdin, stdout) pipes of a process."""
+        assert process.stdin is not None and process.stdout is not None
+        return process.stdin, process.stdout
+
+
+class SidecarPool:
+    """
+    Thread-safe pool of parser processes.
+
+    Processes are started on demand, so sequential callers only ever start
+    one; concurrent callers get up to `size` processes.
+
+    Attributes:
+        command: Command starting the parser in server mode
+        size: Maximum number of processes
+    """
+
+    def __init__(self, command: list[str], size: int | None = None) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            command: Command starting the parser in server mode
+            size: Maximum number of processes (defaults to the CPU count)
+        """
+        self.command = command
+        self.size = size or os.cpu_count() or 1
+        self._idle: queue.LifoQueue[ParserSidecar] = queue.LifoQueue()
+        self._all: list[ParserSidecar] = []
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def request(self, file_path: Path, timeout: float | None = None) -> bytes:
+        """
+        Parse one file on an idle process.
+
+        Args:
+            file_path: File to parse
+            timeout: Seconds to wait for the response (None waits forever)
+
+        Returns:
+            The raw response line
+
+        Raises:
+            subprocess.TimeoutExpired: If no response arrives in time
+            RuntimeError: If the process exits unexpectedly
+        """
+        sidecar = self._acquire()
+        try:
+            return sidecar.request(file_path, timeout)
+        finally:
+            self._idle.put(sidecar)
+
+    def request_many(self, file_paths: list[Path], timeout: float | None = None) -> list[bytes]:
+        """
+        Parse several files on one idle process, pipelining the requests.
+
+        Args:
+            file_paths: Files to parse
+            timeout: Seconds to wait for all responses (None waits forever)
+
+        Returns:
+            The raw response lines, in request order
+
+        Raises:
+            subprocess.TimeoutExpired: If the responses do not arrive in time
+            RuntimeError: If the process exits unexpectedly
+        """
+        sidecar = self._acquire()
+        try:
+            return sidecar.request_many(file_paths, timeout)
+        finally:
+            self._idle.put(sidecar)
+
+    def close(self) -> None:
+        """Stop all processes."""
+        with self._lock:
+            for sidecar in self._all:
+                sidecar.close()
+
+    def _acquire(self) -> ParserSidecar:
+        """Take an idle process, starting a new one while below the size limit."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._all) < self.size:
+                sidecar = ParserSidecar(self.command)
+                self._all.append(sidecar)
+                return sidecar
+
+        return self._idle.get()
+
+
+def _pipeline_batches(file_paths: list[Path]) -> Iterator[list[bytes]]:
+    """
+    Encode requests and group them into batches of at most _PIPELINE_MAX_BYTES.
+
+    Args:
+        file_paths: Files to parse
+
+    Yields:
+        Request lines of one batch (a single oversized request is its own batch)
+    """
+    batch: list[bytes] = []
+    size = 0
+    for file_path in file_paths:
+        line = orjson.dumps({"path": str(file_path)}) + b"\n"
+        if batch and size + len(line) > _PIPELINE_MAX_BYTES:
+            yield batch
+            batch, size = [], 0
+        batch.append(line)
+        size += len(line)
+    if batch:
+        yield batch
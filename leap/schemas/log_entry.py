@@ -5,9 +5,10 @@ This module defines the standardized format for extracted log statements
 as specified in TechnicalSpecification.md section 5.1.
 """
 
+import sys
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class RawLogEntry(BaseModel):
@@ -42,6 +43,18 @@ class RawLogEntry(BaseModel):
         str_strip_whitespace=False,  # Preserve code formatting
     )
 
+    @field_validator("file_path")
+    @classmethod
+    def intern_file_path(cls, v: str) -> str:
+        """
+        Share one string object per path across the entries of a file.
+
+        NOTE: Language and log level need no interning: literals validate to
+        the literal's own object, and pydantic-core's JSON string cache already
+        shares short strings. Paths are often longer than it caches (64 chars).
+        """
+        return sys.intern(v)
+
 
 class AnalyzedLogEntry(BaseModel):
     """
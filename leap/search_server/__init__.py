@@ -4,10 +4,24 @@ This module provides a FastAPI-based search server for semantic search
 across analyzed logs.
 """
 
+from typing import Any
+
 from .config import SearchServerConfig
-from .main import create_app
 
 __all__ = [
     "SearchServerConfig",
     "create_app",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the FastAPI application.
+
+    NOTE: create_app pulls in FastAPI, the vector stores and the models, so
+    it is only imported when requested.
+    """
+    if name == "create_app":
+        from .main import create_app
+
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
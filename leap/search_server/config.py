@@ -20,9 +20,12 @@ class SearchServerConfig(BaseModel):
         vector_store: Type of vector store to use
         embedding_model_name: Name of the embedding model
         reranker_model_name: Name of the reranker model
+        reranker_onnx_dir: Directory of the INT8 ONNX export of the reranker
+            (None runs the PyTorch model)
         chromadb_path: Path to ChromaDB storage (for ChromaDB only)
         qdrant_url: Qdrant server URL (for Qdrant only)
         qdrant_api_key: Qdrant API key (optional, for Qdrant Cloud)
+        qdrant_prefer_grpc: Talk to Qdrant over gRPC (port 6334) instead of HTTP
         enable_hybrid_search: Enable hybrid search (BM25 + Vector)
         enable_reranking: Enable reranking with cross-encoder
         default_top_k: Default number of results to return
@@ -50,6 +53,10 @@ class SearchServerConfig(BaseModel):
         default="jinaai/jina-reranker-v2-base-multilingual",
         description="Name of the reranker model",
     )
+    reranker_onnx_dir: Path | None = Field(
+        default=None,
+        description="Run the reranker as an INT8 ONNX model stored here (exported if missing)",
+    )
 
     # ChromaDB settings
     chromadb_path: Path = Field(
@@ -66,6 +73,10 @@ class SearchServerConfig(BaseModel):
         default=None,
         description="Qdrant API key (optional, for Qdrant Cloud)",
     )
+    qdrant_prefer_grpc: bool = Field(
+        default=False,
+        description="Use the gRPC transport (port 6334) instead of HTTP for Qdrant",
+    )
 
     # Search settings
     enable_hybrid_search: bool = Field(
@@ -77,6 +77,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         chromadb_path=state.config.chromadb_path,
         qdrant_url=state.config.qdrant_url,
         qdrant_api_key=state.config.qdrant_api_key,
+        qdrant_prefer_grpc=state.config.qdrant_prefer_grpc,
         show_progress=False,
     )
 
@@ -91,7 +92,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     if state.config.enable_reranking:
         print(f"Loading reranker model: {state.config.reranker_model_name}...")
-        state.reranker = Reranker(state.config.reranker_model_name)
+        state.reranker = Reranker(
+            state.config.reranker_model_name,
+            onnx_dir=state.config.reranker_onnx_dir,
+        )
         print("✓ Reranker model loaded")
 
     state.models_loaded = True
@@ -181,16 +185,18 @@ def create_app(config: SearchServerConfig) -> FastAPI:
 
             from leap.indexer.vector_stores import SearchResult
 
+            # Get more results for hybrid search and reranking
+            initial_top_k = request.top_k * 4 if state.config.enable_hybrid_search or state.config.enable_reranking else request.top_k
+            filters = _convert_filters(request.filters)
+
             all_results: list[SearchResult] = []
             for collection_name in collections:
                 try:
-                    # Get more results for hybrid search and reranking
-                    initial_top_k = request.top_k * 4 if state.config.enable_hybrid_search or state.config.enable_reranking else request.top_k
                     results = state.vector_store.search(
                         collection_name=collection_name,
                         query_embedding=query_embedding,
                         top_k=initial_top_k,
-                        filters=_convert_filters(request.filters),
+                        filters=filters,
                     )
                     all_results.extend(results)
                 except Exception as e:
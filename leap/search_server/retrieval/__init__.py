@@ -3,10 +3,23 @@
 This module provides hybrid search and re-ranking functionality.
 """
 
-from .hybrid_search import HybridSearcher
+from typing import Any
+
 from .reranker import Reranker
 
 __all__ = [
     "HybridSearcher",
     "Reranker",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import retrievers that depend on optional packages.
+
+    NOTE: rank-bm25 is only imported when the hybrid searcher is requested.
+    """
+    if name == "HybridSearcher":
+        from .hybrid_search import HybridSearcher
+
+        return HybridSearcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
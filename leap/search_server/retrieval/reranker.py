@@ -2,9 +2,59 @@
 
 This module provides re-ranking functionality using a cross-encoder model
 to improve search result relevance.
+
+The model runs either in PyTorch (sentence-transformers CrossEncoder) or,
+when an ONNX directory is configured, as an INT8-quantized ONNX Runtime
+session. The ONNX model is exported and quantized on first use.
 """
 
-from sentence_transformers import CrossEncoder
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sentence_transformers import CrossEncoder
+
+# File written by ORTQuantizer for the exported model.onnx
+_ONNX_MODEL_FILE = "model_quantized.onnx"
+
+# Query-document pairs scored per forward pass (CrossEncoder.predict's default)
+_BATCH_SIZE = 32
+
+# Batches are padded to a multiple of this many tokens, bounding the number
+# of distinct input shapes and keeping them aligned for GPU kernels
+_PAD_MULTIPLE = 16
+
+
+def export_onnx_int8(model_name: str, output_dir: Path) -> Path:
+    """Export a cross-encoder to ONNX and quantize it to INT8.
+
+    Weights are quantized ahead of time and activations dynamically, using
+    the AVX-512 VNNI configuration (which falls back to plain AVX2/AVX-512
+    kernels on CPUs without VNNI).
+
+    Args:
+        model_name: Name of the cross-encoder model
+        output_dir: Directory receiving the quantized model and its tokenizer
+
+    Returns:
+        Path of the quantized ONNX model
+    """
+    # Deferred: optimum is only needed for the one-time export
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+    quantizer = ORTQuantizer.from_pretrained(model)
+    quantizer.quantize(
+        save_dir=output_dir,
+        quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False),
+    )
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(output_dir)
+    return output_dir / _ONNX_MODEL_FILE
 
 
 class Reranker:
@@ -14,19 +64,69 @@ class Reranker:
     to re-score query-document pairs and improve ranking.
 
     Attributes:
-        model: The loaded CrossEncoder model
+        model: The loaded CrossEncoder model (None with the ONNX backend)
+        session: ONNX Runtime session of the quantized model (None with PyTorch)
+        tokenizer: Tokenizer of the model
+        max_length: Maximum tokens per pair (None uses the tokenizer's limit)
         model_name: Name of the model being used
     """
 
-    def __init__(self, model_name: str) -> None:
+    def __init__(self, model_name: str, onnx_dir: Path | None = None) -> None:
         """Initialize the reranker.
 
+        On CUDA devices with bfloat16 support the PyTorch weights are cast
+        to bfloat16.
+
         Args:
             model_name: Name of the cross-encoder model
                        (e.g., 'jinaai/jina-reranker-v2-base-multilingual')
+            onnx_dir: Directory of the INT8 ONNX export of the model; exported
+                there if missing. None runs the PyTorch model instead.
+
+        Raises:
+            ValueError: If the model does not output exactly one score per pair
+                (or, with ONNX, configures an activation other than sigmoid
+                or identity)
         """
         self.model_name = model_name
-        self.model = CrossEncoder(model_name)
+        self.model: CrossEncoder | None = None
+        self.session: Any = None
+
+        if onnx_dir is None:
+            # Deferred, like onnxruntime below: the scoring code imports
+            # without the model packages (sentence_transformers is imported
+            # as a module so it does not shadow the CrossEncoder annotation)
+            import sentence_transformers
+            import torch
+
+            self.model = sentence_transformers.CrossEncoder(model_name)
+            _check_num_labels(model_name, self.model.model.config.num_labels)
+            if torch.cuda.is_available() and torch.cuda.is_bf16_supported():
+                # Halves weight and activation bandwidth; logits are upcast in _forward
+                self.model.model.to(dtype=torch.bfloat16)
+            self.tokenizer = self.model.tokenizer
+            self.max_length = self.model.max_length
+            # The activation CrossEncoder.predict applies (sigmoid unless the
+            # model configures another); activation_fn since v4
+            activation = getattr(self.model, "activation_fn", None)
+            if activation is None:
+                activation = self.model.default_activation_function
+            self._torch_activation = activation
+            return
+
+        # Deferred: onnxruntime is only installed for the ONNX backend
+        import onnxruntime as ort
+        from transformers import AutoConfig, AutoTokenizer
+
+        onnx_path = onnx_dir / _ONNX_MODEL_FILE
+        if not onnx_path.exists():
+            onnx_path = export_onnx_int8(model_name, onnx_dir)
+        config = AutoConfig.from_pretrained(onnx_dir)
+        _check_num_labels(model_name, config.num_labels)
+        self._numpy_activation = _onnx_activation(model_name, config)
+        self.session = ort.InferenceSession(str(onnx_path), providers=["CPUExecutionProvider"])
+        self.tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+        self.max_length = None
 
     def rerank(
         self,
@@ -48,11 +148,7 @@ class Reranker:
         if not documents:
             return []
 
-        # Create query-document pairs
-        pairs = [(query, doc) for doc in documents]
-
-        # Get scores from cross-encoder
-        scores = self.model.predict(pairs)
+        scores = self._predict(query, documents)
 
         # Create (index, score) tuples and sort by score
         indexed_scores = list(enumerate(scores))
@@ -63,3 +159,115 @@ class Reranker:
             return indexed_scores[:top_k]
 
         return indexed_scores
+
+    def _predict(self, query: str, documents: list[str]) -> list[float]:
+        """Score query-document pairs with the cross-encoder.
+
+        All pairs are tokenized in one call, then sorted by length so each
+        batch only pads to its own longest pair (rounded up to
+        _PAD_MULTIPLE); the scores are returned in input order.
+
+        Args:
+            query: Search query
+            documents: List of document texts
+
+        Returns:
+            Relevance score of each document, in input order
+        """
+        features = self.tokenizer(
+            [query] * len(documents),
+            documents,
+            truncation=True,
+            max_length=self.max_length,
+        )
+        order = np.argsort([len(ids) for ids in features["input_ids"]], kind="stable")
+        tensor_type = "np" if self.session is not None else "pt"
+
+        scores = np.empty(len(documents), dtype=np.float32)
+        for start in range(0, len(documents), _BATCH_SIZE):
+            indices = order[start : start + _BATCH_SIZE]
+            batch = self.tokenizer.pad(
+                {name: [value[i] for i in indices] for name, value in features.items()},
+                pad_to_multiple_of=_PAD_MULTIPLE,
+                return_tensors=tensor_type,
+            )
+            scores[indices] = self._forward(batch)
+
+        return scores.tolist()
+
+    def _forward(self, batch: dict[str, Any]) -> np.ndarray:
+        """Score one batch of encoded pairs.
+
+        Args:
+            batch: Tokenizer output (numpy arrays for ONNX, tensors for PyTorch)
+
+        Returns:
+            The model's activated score of each pair
+        """
+        if self.session is not None:
+            input_names = [i.name for i in self.session.get_inputs()]
+            logits = self.session.run(None, {name: batch[name] for name in input_names})[0]
+            onnx_scores: np.ndarray = self._numpy_activation(logits[:, 0])
+            return onnx_scores
+
+        import torch
+
+        assert self.model is not None
+        device = self.model.model.device
+        with torch.inference_mode():
+            output = self.model.model(**{name: value.to(device) for name, value in batch.items()})
+            activated = self._torch_activation(output.logits.float())
+        torch_scores: np.ndarray = activated[:, 0].cpu().numpy()
+        return torch_scores
+
+
+def _check_num_labels(model_name: str, num_labels: int) -> None:
+    """Ensure a cross-encoder outputs a single relevance score per pair.
+
+    Args:
+        model_name: Name of the cross-encoder model (for the error message)
+        num_labels: Number of outputs of the classification head
+
+    Raises:
+        ValueError: If the model has more than one label
+    """
+    if num_labels != 1:
+        raise ValueError(
+            f"Reranker model {model_name} has {num_labels} labels; "
+            "only single-score cross-encoders are supported"
+        )
+
+
+def _onnx_activation(model_name: str, config: Any) -> Callable[[np.ndarray], np.ndarray]:
+    """Pick the activation CrossEncoder.predict would apply, for the ONNX backend.
+
+    Args:
+        model_name: Name of the cross-encoder model (for the error message)
+        config: Transformers config of the exported model
+
+    Returns:
+        Numpy activation: sigmoid by default, or identity if configured
+
+    Raises:
+        ValueError: If the model configures another activation
+    """
+    st_config = getattr(config, "sentence_transformers", None) or {}
+    name = st_config.get("activation_fn") or getattr(
+        config, "sbert_ce_default_activation_function", None
+    )
+    if name is None or name.endswith(".Sigmoid"):
+        return _sigmoid
+    if name.endswith(".Identity"):
+        return _identity
+    raise ValueError(f"Unsupported activation for the ONNX reranker {model_name}: {name}")
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    """Map logits to (0, 1) as CrossEncoder.predict does for single-label models."""
+    result: np.ndarray = 1.0 / (1.0 + np.exp(-x))
+    return result
+
+
+def _identity(x: np.ndarray) -> np.ndarray:
+    """Return raw logits, for models configured without an activation."""
+    return x
@@ -2,6 +2,8 @@
 Utility functions for LEAP.
 """
 
+from .async_utils import semaphore_gather
+from .file_lock import file_lock
 from .logger import get_logger
 
-__all__ = ["get_logger"]
+__all__ = ["file_lock", "get_logger", "semaphore_gather"]
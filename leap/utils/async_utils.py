@@ -0,0 +1,50 @@
+"""
+Async helpers for LEAP.
+
+This module provides concurrency primitives shared by the async parts of
+the pipeline (e.g., the analyzer's parallel LLM requests).
+"""
+
+import asyncio
+from collections.abc import Awaitable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+async def semaphore_gather(
+    limit: int,
+    *aws: Awaitable[T],
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Run awaitables concurrently with at most `limit` of them in flight.
+
+    Works like asyncio.gather, but every awaitable must acquire a shared
+    semaphore first. This keeps large fan-outs (thousands of HTTP requests)
+    from exhausting connection pools or memory.
+
+    Args:
+        limit: Maximum number of awaitables running at the same time
+        *aws: Awaitables to run
+        return_exceptions: Passed through to asyncio.gather
+
+    Returns:
+        Results in the same order as the input awaitables
+
+    Raises:
+        ValueError: If limit is less than 1
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be >= 1, got {limit}")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run_with_limit(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(run_with_limit(aw) for aw in aws),
+        return_exceptions=return_exceptions,
+    )
@@ -0,0 +1,137 @@
+"""
+Unit tests for result aggregation.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from leap.core import aggregate_results, append_results, load_raw_logs, merge_results
+from leap.schemas import RawLogEntry
+
+
+def _make_entry(line_number: int, template: str = '"User logged in"') -> RawLogEntry:
+    """Build a valid log entry for tests."""
+    return RawLogEntry(
+        language="python",
+        file_path="src/app.py",
+        line_number=line_number,
+        log_level="info",
+        log_template=template,
+        code_context=f"logger.info({template})",
+    )
+
+
+class TestAggregateResults:
+    """Test suite for aggregate_results/load_raw_logs."""
+
+    @pytest.fixture
+    def entries(self) -> list[RawLogEntry]:
+        """Create a few log entries, including non-ASCII text."""
+        return [_make_entry(1), _make_entry(2, '"Пользователь не найден"')]
+
+    def test_json_array_roundtrip(self, tmp_path: Path, entries: list[RawLogEntry]) -> None:
+        """Test that the default output is a JSON array that loads back."""
+        output = tmp_path / "raw_logs.json"
+        aggregate_results(entries, output)
+
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert isinstance(data, list)
+        assert len(data) == 2
+        assert load_raw_logs(output) == entries
+
+    def test_ndjson_roundtrip(self, tmp_path: Path, entries: list[RawLogEntry]) -> None:
+        """Test that NDJSON output has one entry per line and loads back."""
+        output = tmp_path / "raw_logs.ndjson"
+        aggregate_results(entries, output, ndjson=True)
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["log_template"] == '"Пользователь не найден"'
+        assert load_raw_logs(output) == entries
+
+    def test_append_ndjson(self, tmp_path: Path, entries: list[RawLogEntry]) -> None:
+        """Test that appending to NDJSON output keeps existing entries."""
+        output = tmp_path / "raw_logs.ndjson"
+        aggregate_results(entries[:1], output, ndjson=True)
+        append_results(entries[1:], output)
+
+        assert load_raw_logs(output) == entries
+
+    def test_append_converts_json_array(
+        self, tmp_path: Path, entries: list[RawLogEntry]
+    ) -> None:
+        """Test that appending to a JSON array file rewrites it as NDJSON."""
+        output = tmp_path / "raw_logs.json"
+        aggregate_results(entries[:1], output)
+        append_results(entries[1:], output)
+
+        assert len(output.read_text(encoding="utf-8").splitlines()) == 2
+        assert load_raw_logs(output) == entries
+
+    def test_json_array_streamed_in_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that chunked array output matches a single indented dump."""
+        monkeypatch.setattr("leap.core.aggregator._ARRAY_CHUNK_SIZE", 2)
+        entries = [_make_entry(i) for i in range(1, 6)]
+        output = tmp_path / "raw_logs.json"
+        aggregate_results(entries, output)
+
+        expected = json.dumps(
+            [e.model_dump(mode="json") for e in entries], ensure_ascii=False, indent=2
+        )
+        assert output.read_text(encoding="utf-8") == expected
+
+    def test_validate_rejects_unvalidated_entry(self, tmp_path: Path) -> None:
+        """Test that validate=True re-checks entries built without validation."""
+        bad = RawLogEntry.model_construct(**{**_make_entry(1).model_dump(), "line_number": 0})
+
+        with pytest.raises(ValueError, match="line_number"):
+            aggregate_results([bad], tmp_path / "raw_logs.json", validate=True)
+
+    def test_merge_loads_existing_output(
+        self, tmp_path: Path, entries: list[RawLogEntry]
+    ) -> None:
+        """Test that merging reads back our own output, array or NDJSON."""
+        for name, ndjson in (("raw_logs.json", False), ("raw_logs.ndjson", True)):
+            output = tmp_path / name
+            aggregate_results(entries[:1], output, ndjson=ndjson)
+
+            assert merge_results(output, entries[1:]) == entries
+
+    @pytest.mark.parametrize("ndjson", [False, True])
+    def test_trusted_load_keeps_invalid_values(self, tmp_path: Path, ndjson: bool) -> None:
+        """Test that trusted loading keeps entries with invalid field values as written."""
+        bad = RawLogEntry.model_construct(**{**_make_entry(1).model_dump(), "line_number": 0})
+        output = tmp_path / "raw_logs.json"
+        aggregate_results([_make_entry(2), bad], output, ndjson=ndjson)
+
+        assert [e.line_number for e in load_raw_logs(output, trusted=True)] == [2, 0]
+        with pytest.raises(ValidationError):
+            load_raw_logs(output)
+
+    def test_trusted_load_falls_back_to_validation(self, tmp_path: Path) -> None:
+        """Test that records missing fields are still rejected when trusted."""
+        output = tmp_path / "raw_logs.json"
+        output.write_text(json.dumps([{"language": "python", "line_number": 1}]))
+
+        with pytest.raises(ValidationError):
+            load_raw_logs(output, trusted=True)
+        assert merge_results(output, []) == []
+
+    def test_load_shares_file_paths(self, tmp_path: Path) -> None:
+        """Test that entries loaded from one file share a single path string."""
+        long_path = "src/" + "nested_package/" * 8 + "module.py"
+        entries = [
+            RawLogEntry(**{**_make_entry(i).model_dump(), "file_path": long_path})
+            for i in (1, 2)
+        ]
+        output = tmp_path / "raw_logs.json"
+        aggregate_results(entries, output)
+
+        first, second = load_raw_logs(output)
+
+        assert first.file_path is second.file_path
@@ -0,0 +1,163 @@
+"""Unit tests for the analyzer checkpoint log and resume."""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from leap.analyzer import AnalyzerConfig, LogAnalyzer, batch_processor
+from leap.analyzer.checkpoint import AnalysisCheckpoint
+from leap.analyzer.providers import CompletionResponse, LLMProvider
+
+
+class Interrupted(BaseException):
+    """Simulates a hard stop that process_batch does not swallow."""
+
+
+class FakeProvider(LLMProvider):
+    """Provider returning a fixed analysis and counting calls."""
+
+    def __init__(self, fail_after: int | None = None):
+        self.calls = 0
+        self.fail_after = fail_after
+
+    async def complete(self, prompt: str, model: str, **kwargs: Any) -> CompletionResponse:
+        self.calls += 1
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise Interrupted
+        return CompletionResponse(text='{"analysis": "ok", "severity": "INFO"}')
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def _write_input(path: Path, count: int) -> None:
+    """Write a raw_logs.json with distinct entries."""
+    entries = [
+        {
+            "language": "python",
+            "file_path": "app.py",
+            "line_number": i,
+            "log_level": "info",
+            "log_template": f'"event {i}"',
+            "code_context": f'logger.info("event {i}")',
+        }
+        for i in range(count)
+    ]
+    path.write_text(json.dumps(entries), encoding="utf-8")
+
+
+class TestAnalysisCheckpoint:
+    """Test AnalysisCheckpoint persistence."""
+
+    def test_append_and_load(self, tmp_path: Path) -> None:
+        """Test that appended records are read back on load."""
+        path = tmp_path / "out.partial.ndjson"
+        checkpoint = AnalysisCheckpoint(path, size=4)
+        checkpoint.open()
+        checkpoint.append(3, {"source_file": "a.py:1"}, {"total_tokens": 5})
+        checkpoint.append(0, {"source_file": "a.py:2"}, {"total_tokens": 9})
+        checkpoint.close()
+
+        loaded = AnalysisCheckpoint(path, size=4)
+        loaded.load()
+
+        assert 3 in loaded and 0 in loaded and 1 not in loaded
+        assert loaded.results[0] == {"source_file": "a.py:2"}
+        assert loaded.token_usage == {"total_tokens": 9}
+
+    def test_load_skips_truncated_record(self, tmp_path: Path) -> None:
+        """Test that a partially written last line is ignored."""
+        path = tmp_path / "out.partial.ndjson"
+        path.write_bytes(b'{"idx": 0, "result": {}}\n{"idx": 1, "res')
+
+        checkpoint = AnalysisCheckpoint(path, size=4)
+        checkpoint.load()
+
+        assert len(checkpoint) == 1
+
+    def test_out_of_range_index_not_contained(self, tmp_path: Path) -> None:
+        """Test that indices beyond the input size are never reported done."""
+        path = tmp_path / "out.partial.ndjson"
+        path.write_bytes(b'{"idx": 9, "result": {}}\n')
+
+        checkpoint = AnalysisCheckpoint(path, size=4)
+        checkpoint.load()
+
+        assert 9 not in checkpoint
+        assert not any(i in checkpoint for i in range(4))
+
+
+class TestAnalyzerResume:
+    """Test resuming analyze_file from the checkpoint log."""
+
+    @pytest.fixture
+    def analyzer(self) -> LogAnalyzer:
+        """Create an analyzer with a fake provider."""
+        analyzer = LogAnalyzer(AnalyzerConfig(
+            provider="ollama", model="test", api_base="http://localhost:11434", concurrency=1
+        ))
+        analyzer.provider = FakeProvider()
+        return analyzer
+
+    def test_resume_skips_completed_entries(self, tmp_path: Path, analyzer: LogAnalyzer) -> None:
+        """Test that an interrupted run continues where it stopped."""
+        input_path = tmp_path / "raw_logs.json"
+        output_path = tmp_path / "analyzed_logs.json"
+        _write_input(input_path, 5)
+
+        analyzer.provider = FakeProvider(fail_after=2)
+        with pytest.raises(Interrupted):
+            asyncio.run(analyzer.analyze_file(str(input_path), str(output_path)))
+
+        checkpoint_path = tmp_path / "analyzed_logs.partial.ndjson"
+        assert len(checkpoint_path.read_bytes().splitlines()) == 2
+
+        provider = FakeProvider()
+        analyzer.provider = provider
+        asyncio.run(analyzer.analyze_file(str(input_path), str(output_path), resume=True))
+
+        assert provider.calls == 3
+        assert not checkpoint_path.exists()
+        results = json.loads(output_path.read_text(encoding="utf-8"))["analyzed_logs"]
+        assert [r["source_file"] for r in results] == [f"app.py:{i}" for i in range(5)]
+
+    def test_duplicate_entries_analyzed_once(self, tmp_path: Path, analyzer: LogAnalyzer) -> None:
+        """Test that identical entries share one provider call but keep their location."""
+        input_path = tmp_path / "raw_logs.json"
+        output_path = tmp_path / "analyzed_logs.json"
+        entry = {"language": "python", "log_template": '"retry"', "code_context": "x"}
+        input_path.write_text(
+            json.dumps([{**entry, "file_path": "a.py", "line_number": i} for i in range(3)]),
+            encoding="utf-8",
+        )
+
+        provider = FakeProvider()
+        analyzer.provider = provider
+        asyncio.run(analyzer.analyze_file(str(input_path), str(output_path)))
+
+        assert provider.calls == 1
+        results = json.loads(output_path.read_text(encoding="utf-8"))["analyzed_logs"]
+        assert [r["source_file"] for r in results] == ["a.py:0", "a.py:1", "a.py:2"]
+
+    def test_progress_counts_entries(
+        self, analyzer: LogAnalyzer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that progress totals count entries, not deduplicated requests."""
+        trackers: list[batch_processor.ProgressTracker] = []
+
+        class RecordingTracker(batch_processor.ProgressTracker):
+            def __init__(self, total: int, show_progress: bool = True):
+                super().__init__(total, show_progress=False)
+                trackers.append(self)
+
+        monkeypatch.setattr(batch_processor, "ProgressTracker", RecordingTracker)
+        entry = {"language": "python", "log_template": '"retry"', "code_context": "x"}
+        entries = [{**entry, "file_path": "a.py", "line_number": i} for i in range(3)]
+        entries.append({**entry, "log_template": '"done"', "file_path": "a.py", "line_number": 9})
+
+        asyncio.run(analyzer.analyze_batch(entries))
+
+        assert [(t.total, t.completed) for t in trackers] == [(4, 4)]
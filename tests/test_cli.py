@@ -0,0 +1,22 @@
+"""
+Unit tests for the command-line interface.
+"""
+
+import subprocess
+import sys
+
+
+class TestCliImports:
+    """Test that the CLI stays cheap to import."""
+
+    def test_heavy_modules_not_imported(self) -> None:
+        """Test that importing the CLI does not load the indexer or search server."""
+        code = (
+            "import sys, leap.cli; "
+            "print(','.join(m for m in ('leap.indexer', 'leap.search_server') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == ""
@@ -0,0 +1,105 @@
+"""
+Unit tests for file discovery.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from leap.core import detect_language, discover_files, filter_changed_files
+from leap.core.discovery import EXTENSION_TO_LANGUAGE
+
+
+class TestDiscoverFiles:
+    """Test suite for discover_files/filter_changed_files."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        """Create a small source tree with excluded directories."""
+        files = [
+            "app.py",
+            "pkg/models.py",
+            "pkg/deep/util.PY",
+            "web/index.js",
+            "web/types.ts",
+            "svc/main.go",
+            "README.md",
+            "node_modules/lib/index.js",
+            ".git/hooks/pre-commit.py",
+            "pkg/__pycache__/models.py",
+            "vendor/dep/dep.go",
+        ]
+        for name in files:
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+        return tmp_path
+
+    def test_discovers_by_language(self, repo: Path) -> None:
+        """Test that files are grouped by language and excluded dirs are skipped."""
+        discovered = discover_files(repo)
+
+        found = {lang: sorted(p.relative_to(repo).as_posix() for p in paths)
+                 for lang, paths in discovered.items()}
+        assert found == {
+            "python": ["app.py", "pkg/deep/util.PY", "pkg/models.py"],
+            "javascript": ["web/index.js"],
+            "typescript": ["web/types.ts"],
+            "go": ["svc/main.go"],
+        }
+
+    def test_language_filter(self, repo: Path) -> None:
+        """Test that only requested languages are returned."""
+        discovered = discover_files(repo, languages={"go"})
+
+        assert list(discovered) == ["go"]
+
+    def test_custom_exclude(self, repo: Path) -> None:
+        """Test that extra exclude names prune whole directories."""
+        discovered = discover_files(repo, exclude_patterns={"pkg"})
+
+        assert [p.name for p in discovered["python"]] == ["app.py"]
+
+    def test_glob_exclude(self, repo: Path) -> None:
+        """Test that glob patterns match paths relative to the root."""
+        discovered = discover_files(repo, exclude_patterns={"*/deep/*", "web/*.ts"})
+
+        assert sorted(p.name for p in discovered["python"]) == ["app.py", "models.py"]
+        assert "typescript" not in discovered
+        assert [p.name for p in discovered["javascript"]] == ["index.js"]
+
+    def test_filter_changed_files(self, repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that relative changed paths are resolved and matched."""
+        discovered = discover_files(repo)
+        monkeypatch.chdir(repo)
+
+        filtered = filter_changed_files(discovered, [Path("pkg/models.py"), Path("missing.py")])
+
+        assert filtered == {"python": [repo.resolve() / "pkg" / "models.py"]}
+
+
+class TestDetectLanguage:
+    """Test suite for detect_language."""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("app.py", "python"),
+            ("index.tsx", "typescript"),
+            ("types.ts", "typescript"),
+            ("App.JSX", "javascript"),
+            ("main.go", "go"),
+            ("model.rb", "ruby"),
+            ("README.md", None),
+            ("Makefile", None),
+        ],
+    )
+    def test_detect_language(self, name: str, expected: str | None) -> None:
+        """Test detection from Path objects and plain strings."""
+        assert detect_language(Path("src") / name) == expected
+        assert detect_language(name) == expected
+
+    def test_matches_extension_table(self) -> None:
+        """Test that every mapped extension is detected consistently."""
+        for ext, language in EXTENSION_TO_LANGUAGE.items():
+            assert detect_language(f"file{ext}") == language
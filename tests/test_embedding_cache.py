@@ -0,0 +1,69 @@
+"""
+Unit tests for the persistent embedding cache.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from leap.indexer.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Test suite for EmbeddingCache."""
+
+    def test_roundtrip_and_misses(self, tmp_path: Path) -> None:
+        """Test that stored vectors come back as float32 and unknown texts miss."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite", "model-a")
+        vectors = np.array([[0.1, 0.2, 0.3], [1.0, -1.0, 0.5]], dtype=np.float32)
+        cache.put_many(["first", "second"], vectors)
+
+        found = cache.get_many(["second", "missing", "first"])
+
+        assert found[1] is None
+        assert found[0] is not None and found[0].dtype == np.float32
+        np.testing.assert_allclose(found[0], vectors[1], rtol=1e-3)
+        np.testing.assert_allclose(found[2], vectors[0], rtol=1e-3)  # type: ignore[arg-type]
+        cache.close()
+
+    def test_stored_as_float16(self, tmp_path: Path) -> None:
+        """Test that vectors are stored at half precision and persist across opens."""
+        path = tmp_path / "cache.sqlite"
+        cache = EmbeddingCache(path, "model-a")
+        cache.put_many(["text"], np.array([[1 / 3, 2 / 3]], dtype=np.float32))
+        (blob,) = cache._conn.execute("SELECT vector FROM embeddings").fetchone()
+        cache.close()
+
+        assert len(blob) == 2 * np.dtype(np.float16).itemsize
+
+        reopened = EmbeddingCache(path, "model-a")
+        (vector,) = reopened.get_many(["text"])
+        assert vector is not None
+        assert vector.tolist() == np.array([1 / 3, 2 / 3], dtype=np.float16).astype(
+            np.float32
+        ).tolist()
+        reopened.close()
+
+    def test_keyed_by_model(self, tmp_path: Path) -> None:
+        """Test that vectors of another model are not returned."""
+        path = tmp_path / "cache.sqlite"
+        cache = EmbeddingCache(path, "model-a")
+        cache.put_many(["text"], np.ones((1, 4), dtype=np.float32))
+        cache.close()
+
+        other = EmbeddingCache(path, "model-b")
+        assert other.get_many(["text"]) == [None]
+        other.close()
+
+    def test_many_keys(self, tmp_path: Path) -> None:
+        """Test lookups larger than one SQLite parameter chunk."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite", "model-a")
+        texts = [f"log {i}" for i in range(1200)]
+        cache.put_many(texts, np.arange(1200, dtype=np.float32).reshape(-1, 1))
+
+        found = cache.get_many(texts)
+
+        assert [float(v[0]) for v in found if v is not None] == [
+            float(np.float16(i)) for i in range(1200)
+        ]
+        cache.close()
@@ -0,0 +1,116 @@
+"""
+Unit tests for external parser output decoding and caching.
+"""
+
+import subprocess
+from pathlib import Path
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from leap.parsers import RubyParser
+from leap.parsers.cache import ParseCache
+from leap.parsers.sidecar import SidecarError
+
+
+def _record(file_path: Path) -> dict[str, object]:
+    """Build one record as emitted by an external parser."""
+    return {
+        "language": "ruby",
+        "file_path": str(file_path),
+        "line_number": 3,
+        "log_level": "info",
+        "log_template": '"hello"',
+        "code_context": 'logger.info("hello")',
+    }
+
+
+class TestParseCache:
+    """Test suite for ParseCache."""
+
+    @pytest.fixture
+    def parser_source(self, tmp_path: Path) -> Path:
+        """Create a stand-in parser script."""
+        path = tmp_path / "parser.rb"
+        path.write_text("# v1")
+        return path
+
+    def test_roundtrip(self, tmp_path: Path, parser_source: Path) -> None:
+        """Test that stored output is returned for the same key."""
+        cache = ParseCache(tmp_path / "cache", parser_source)
+        source = tmp_path / "app.rb"
+        source.write_text("logger.info('hello')")
+        key = cache.key(source)
+
+        assert cache.get(key) is None
+        cache.put(key, orjson.dumps({"entries": [_record(source)]}))
+        assert orjson.loads(cache.get(key) or b"") == {"entries": [_record(source)]}
+
+    def test_key_covers_content_path_and_parser(
+        self, tmp_path: Path, parser_source: Path
+    ) -> None:
+        """Test that editing the file, moving it or changing the parser or mode changes the key."""
+        source = tmp_path / "app.rb"
+        source.write_text("logger.info('hello')")
+        key = ParseCache(tmp_path, parser_source).key(source)
+
+        other = tmp_path / "copy.rb"
+        other.write_text("logger.info('hello')")
+        assert ParseCache(tmp_path, parser_source).key(other) != key
+
+        source.write_text("logger.info('bye')")
+        assert ParseCache(tmp_path, parser_source).key(source) != key
+
+        source.write_text("logger.info('hello')")
+        assert ParseCache(tmp_path, parser_source, strict=True).key(source) != key
+
+        parser_source.write_text("# v2")
+        assert ParseCache(tmp_path, parser_source).key(source) != key
+
+    def test_hit_skips_subprocess(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a cached file is parsed without running the external parser."""
+        source = tmp_path / "app.rb"
+        source.write_text("logger.info('hello')")
+        parser = RubyParser(cache_dir=tmp_path / "cache")
+        assert parser.cache is not None
+        parser.cache.put(parser.cache.key(source), orjson.dumps({"entries": [_record(source)]}))
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("external parser was run")
+
+        monkeypatch.setattr(subprocess, "run", fail)
+        monkeypatch.setattr(subprocess, "Popen", fail)
+        entries = parser.parse_file(source)
+
+        assert [(e.file_path, e.line_number) for e in entries] == [(str(source), 3)]
+
+
+class TestEntriesFromOutput:
+    """Test suite for decoding external parser responses."""
+
+    def test_decodes_entries(self, tmp_path: Path) -> None:
+        """Test that entries are built straight from the response bytes."""
+        output = orjson.dumps({"entries": [_record(tmp_path / "a.rb")] * 2})
+
+        entries = RubyParser()._entries_from_output(output)
+
+        assert [e.line_number for e in entries] == [3, 3]
+        assert entries[0].file_path is entries[1].file_path
+
+    def test_error_response(self) -> None:
+        """Test that errors reported by the parser are raised."""
+        with pytest.raises(SidecarError, match="syntax error"):
+            RubyParser()._entries_from_output(b'{"entries": null, "error": "syntax error"}')
+
+    def test_invalid_entry_skipped_unless_strict(self, tmp_path: Path) -> None:
+        """Test that entries failing validation are skipped leniently, rejected when strict."""
+        valid = _record(tmp_path / "a.rb")
+        output = orjson.dumps({"entries": [{**valid, "code_context": ""}, valid]})
+
+        entries = RubyParser()._entries_from_output(output)
+        assert [e.code_context for e in entries] == [valid["code_context"]]
+        with pytest.raises(ValidationError):
+            RubyParser(strict=True)._entries_from_output(output)
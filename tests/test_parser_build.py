@@ -0,0 +1,81 @@
+"""
+Unit tests for external parser build steps.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from leap.parsers.build import ensure_built
+
+
+class TestEnsureBuilt:
+    """Test suite for ensure_built."""
+
+    @pytest.fixture
+    def source(self, tmp_path: Path) -> Path:
+        """Create a parser source file."""
+        path = tmp_path / "main.go"
+        path.write_text("package main")
+        return path
+
+    def _builder(self, output: Path, calls: list[int]) -> Callable[[], None]:
+        """Create a build step that writes the output and counts its runs."""
+
+        def build() -> None:
+            calls.append(1)
+            time.sleep(0.05)
+            output.write_text("binary")
+
+        return build
+
+    def test_builds_once_until_sources_change(self, tmp_path: Path, source: Path) -> None:
+        """Test that the stamp skips rebuilds until a source changes."""
+        output = tmp_path / "go_parser"
+        calls: list[int] = []
+        build = self._builder(output, calls)
+
+        ensure_built(output, (source,), build)
+        ensure_built(output, (source,), build)
+        assert len(calls) == 1
+
+        source.write_text("package main // changed")
+        ensure_built(output, (source,), build)
+        assert len(calls) == 2
+
+    def test_concurrent_callers_build_once(self, tmp_path: Path, source: Path) -> None:
+        """Test that callers waiting on the lock do not build again."""
+        output = tmp_path / "go_parser"
+        calls: list[int] = []
+        build = self._builder(output, calls)
+
+        threads = [
+            threading.Thread(target=ensure_built, args=(output, (source,), build))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+
+    def test_unstamped_output_checked_by_mtime(self, tmp_path: Path, source: Path) -> None:
+        """Test that artifacts built before stamps existed are kept unless stale."""
+        output = tmp_path / "go_parser"
+        output.write_text("binary")
+        calls: list[int] = []
+        build = self._builder(output, calls)
+
+        os.utime(source, (0, 0))
+        ensure_built(output, (source,), build)
+        assert calls == []
+
+        os.utime(output, (0, 0))
+        os.utime(source, (100, 100))
+        ensure_built(output, (source,), build)
+        assert calls == [1]
@@ -2,12 +2,14 @@
 Unit tests for the Python AST parser.
 """
 
+import ast
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from leap.parsers import PythonParser
+from leap.parsers.python_parser import LogCallVisitor
 from leap.schemas import RawLogEntry
 
 
@@ -266,3 +268,190 @@ def broken_function(
     def test_language_name(self) -> None:
         """Test that parser returns correct language name."""
         assert PythonParser.get_language_name() == "python"
+
+    def test_strict_mode_matches_default(self, parser: PythonParser) -> None:
+        """Test that validated (strict) and unvalidated entries are identical."""
+        code = '''
+import logging
+
+def handler():
+    logging.warning("Disk almost full")
+'''
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write(code)
+            f.flush()
+            temp_path = Path(f.name)
+
+        try:
+            entries = parser.parse_file(temp_path)
+            strict_entries = PythonParser(strict=True).parse_file(temp_path)
+
+            assert entries == strict_entries
+            assert all(isinstance(e, RawLogEntry) for e in entries)
+
+        finally:
+            temp_path.unlink()
+
+    def test_parse_source_bytes(self, parser: PythonParser) -> None:
+        """Test parsing source that is already in memory."""
+        source = b'import logging\nlogging.error("Connection lost")\n'
+
+        entries = parser.parse_source(source, "svc/net.py")
+
+        assert len(entries) == 1
+        assert entries[0].file_path == "svc/net.py"
+        assert entries[0].line_number == 2
+        assert entries[0].log_level == "error"
+
+    @pytest.mark.parametrize(("min_parallel", "workers"), [(64, None), (2, None), (2, 2), (2, 1)])
+    def test_parse_files_skips_failures(
+        self,
+        parser: PythonParser,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        min_parallel: int,
+        workers: int | None,
+    ) -> None:
+        """Test that batches keep file order and skip unparsable files, serially or in workers."""
+        monkeypatch.setattr("leap.parsers.python_parser._PARALLEL_PARSE_MIN_FILES", min_parallel)
+        paths = []
+        for i, body in enumerate(['logging.info("a")', "def broken(:", 'logging.warning("b")']):
+            path = tmp_path / f"mod{i}.py"
+            path.write_text(f"import logging\n{body}\n")
+            paths.append(path)
+
+        entries = parser.parse_files([*paths, tmp_path / "missing.py"], workers)
+
+        assert [(Path(e.file_path).name, e.log_level) for e in entries] == [
+            ("mod0.py", "info"),
+            ("mod2.py", "warn"),
+        ]
+
+    def test_function_context_shared(self, parser: PythonParser) -> None:
+        """Test that log calls in one function share a single context string."""
+        source = (
+            "import logging\n"
+            "def handler():\n"
+            "    logging.info('start')\n"
+            "    logging.info('done')\n"
+        )
+
+        first, second = parser.parse_source(source, "svc/handler.py")
+
+        assert first.code_context == source.split("\n", 1)[1].rstrip("\n")
+        assert first.code_context is second.code_context
+
+    def test_cache_skips_unchanged_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that unchanged files are served from the cache and edits are reparsed."""
+        source = tmp_path / "app.py"
+        source.write_text("import logging\nlogging.info('a')\n")
+        parser = PythonParser(cache_dir=tmp_path / "cache")
+        first = parser.parse_file(source)
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("file was reparsed")
+
+        with monkeypatch.context() as m:
+            m.setattr(PythonParser, "parse_source", fail)
+            assert parser.parse_file(source) == first
+
+        source.write_text("import logging\nlogging.error('changed')\n")
+        assert [e.log_level for e in parser.parse_file(source)] == ["error"]
+
+    @pytest.mark.parametrize(
+        ("call", "is_log"),
+        [
+            ("logger.info('x')", True),
+            ("self.log.warning('x')", True),
+            ("app.services.audit._logger.error('x')", True),
+            ("LOGGING.info('x')", True),
+            ("app.services.audit.info('x')", False),
+            ("get_logger().info('x')", False),
+        ],
+    )
+    def test_logger_attribute_chains(self, parser: PythonParser, call: str, is_log: bool) -> None:
+        """Test logger detection along attribute chains of any depth."""
+        entries = parser.parse_source(call, "svc/chain.py")
+
+        assert len(entries) == int(is_log)
+
+    def test_prunes_only_statements_without_log_calls(self, parser: PythonParser) -> None:
+        """Test that log calls are found wherever they are nested, and skipped code is not."""
+        source = (
+            "import logging\n"
+            "def unrelated():\n"
+            "    return 1\n"
+            "@hook(lambda: logging.debug('decorated'))\n"
+            "class Service:\n"
+            "    def run(self):\n"
+            "        for item in self.items:\n"
+            "            if item:\n"
+            "                logging.info(\n"
+            "                    'nested %s', item\n"
+            "                )\n"
+        )
+
+        entries = parser.parse_source(source, "svc/service.py")
+
+        assert sorted((e.log_level, e.line_number) for e in entries) == [("debug", 4), ("info", 9)]
+        for newline in ("\r\n", "\r"):
+            assert len(parser.parse_source(source.replace("\n", newline), "svc/service.py")) == 2
+        assert parser.parse_source("def unrelated():\n    return 1\n", "svc/plain.py") == []
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            '"User logged in"',
+            "\"it's done\"",
+            "u'legacy'",
+            "'tab\\there'",
+            "f'User {user.id} not found'",
+            "f\"{{literal}} {count} items\"",
+            "f'{value!r}'",
+            "f'{elapsed:.2f}s'",
+            "'User %s' % uid",
+            "'User {}'.format(uid)",
+        ],
+    )
+    def test_template_matches_unparse(self, parser: PythonParser, message: str) -> None:
+        """Test that templates are rendered exactly as ast.unparse renders the message."""
+        (entry,) = parser.parse_source(f"logger.info({message})", "svc/msg.py")
+
+        assert entry.log_template == ast.unparse(ast.parse(message, mode="eval").body)
+
+    def test_candidate_scan_matches_whole_names(self, parser: PythonParser) -> None:
+        """Test that the log-name pre-scan is case-insensitive but skips longer identifiers."""
+        source = "import logging\nraise ValueError(informal)\nlogging.ERROR('upper')\n"
+
+        entries = parser.parse_source(source.encode(), "svc/scan.py")
+
+        assert [(e.log_level, e.line_number) for e in entries] == [("error", 3)]
+
+    def test_iter_file_streams_entries(self, parser: PythonParser, tmp_path: Path) -> None:
+        """Test that iter_file yields the same entries as parse_file, one at a time."""
+        source = tmp_path / "app.py"
+        source.write_text("import logging\nlogging.info('a')\nlogging.error('b')\n")
+
+        entries = parser.iter_file(source)
+
+        assert next(entries).log_level == "info"
+        assert [next(entries), *entries] == parser.parse_file(source)[1:]
+        with pytest.raises(FileNotFoundError):
+            next(parser.iter_file(tmp_path / "missing.py"))
+
+    def test_skips_files_without_logger_names(
+        self, parser: PythonParser, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that files naming no logger are not walked, but inherited loggers are found."""
+        inherited = "class Job(Base):\n    def run(self):\n        self.logger.info('run')\n"
+        assert len(parser.parse_source(inherited, "svc/job.py")) == 1
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("tree was walked")
+
+        monkeypatch.setattr(LogCallVisitor, "iter_entries", fail)
+        assert parser.parse_source("def f(x):\n    x.error('boom')\n", "svc/f.py") == []
+        with pytest.raises(SyntaxError):
+            parser.parse_source("def f(:\n    x.error('boom')\n", "svc/f.py")
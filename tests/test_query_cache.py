@@ -0,0 +1,84 @@
+"""
+Unit tests for the vector store query cache.
+"""
+
+import pytest
+
+from leap.indexer.vector_stores.base import Document, SearchResult
+from leap.indexer.vector_stores.query_cache import QueryCache
+
+
+def _results(text: str) -> list[SearchResult]:
+    """Build a single search result for tests."""
+    return [SearchResult(document=Document(id=text, text=text, metadata={}), score=0.5)]
+
+
+class TestQueryCache:
+    """Test suite for QueryCache."""
+
+    def test_hit_returns_copies(self) -> None:
+        """Test that a repeated query hits and callers may rescore the results."""
+        cache = QueryCache()
+        key = cache.key("logs", [0.1, 0.2], 5, {"level": "error"})
+        cache.put(key, _results("a"))
+
+        hit = cache.get(cache.key("logs", [0.1, 0.2], 5, {"level": "error"}))
+        assert hit is not None and hit[0].document.id == "a"
+        hit[0].score = 1.0
+        assert cache.get(key)[0].score == 0.5  # type: ignore[index]
+
+        assert cache.get(cache.key("logs", [0.1, 0.2], 3, {"level": "error"})) is None
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used query is evicted first."""
+        cache = QueryCache(maxsize=2)
+        keys = [cache.key("logs", [float(i)], 5, None) for i in range(3)]
+        cache.put(keys[0], _results("a"))
+        cache.put(keys[1], _results("b"))
+        assert cache.get(keys[0]) is not None
+
+        cache.put(keys[2], _results("c"))
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+
+    def test_ttl_expiry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that results expire after the TTL."""
+        now = [100.0]
+        monkeypatch.setattr("time.monotonic", lambda: now[0])
+        cache = QueryCache(ttl=10.0)
+        key = cache.key("logs", [0.1], 5, None)
+        cache.put(key, _results("a"))
+
+        now[0] = 109.0
+        assert cache.get(key) is not None
+        now[0] = 111.0
+        assert cache.get(key) is None
+
+    def test_write_invalidates_collection(self) -> None:
+        """Test that results cached before or during a write are not served after it."""
+        cache = QueryCache()
+        before = cache.key("logs", [0.1], 5, None)
+        cache.put(before, _results("old"))
+        other = cache.key("other", [0.1], 5, None)
+        cache.put(other, _results("other"))
+
+        with cache.writing("logs"):
+            during = cache.key("logs", [0.1], 5, None)
+            cache.put(during, _results("racing"))
+
+        after = cache.key("logs", [0.1], 5, None)
+        assert after not in (before, during)
+        assert cache.get(after) is None
+        assert cache.get(other) is not None
+
+    def test_failed_write_invalidates(self) -> None:
+        """Test that the epoch is bumped after a write even if it fails."""
+        cache = QueryCache()
+        with pytest.raises(RuntimeError), cache.writing("logs"):
+            during = cache.key("logs", [0.1], 5, None)
+            cache.put(during, _results("racing"))
+            raise RuntimeError("upload failed")
+
+        assert cache.key("logs", [0.1], 5, None) != during
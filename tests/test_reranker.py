@@ -0,0 +1,85 @@
+"""
+Unit tests for reranker batching.
+"""
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from leap.search_server.retrieval import reranker
+from leap.search_server.retrieval.reranker import Reranker
+
+
+class StubTokenizer:
+    """Tokenizer with one token per word, each token being the document's index."""
+
+    def __init__(self, documents: list[str]) -> None:
+        self.documents = documents
+        self.calls = 0
+
+    def __call__(
+        self, queries: list[str], documents: list[str], truncation: bool, max_length: int | None
+    ) -> dict[str, list[list[int]]]:
+        self.calls += 1
+        input_ids = [[self.documents.index(doc) + 1] * len(doc.split()) for doc in documents]
+        return {"input_ids": input_ids, "attention_mask": [[1] * len(ids) for ids in input_ids]}
+
+    def pad(
+        self, features: dict[str, list[list[int]]], pad_to_multiple_of: int, return_tensors: str
+    ) -> dict[str, np.ndarray]:
+        longest = max(len(ids) for ids in features["input_ids"])
+        width = -(-longest // pad_to_multiple_of) * pad_to_multiple_of
+        return {
+            name: np.array([ids + [0] * (width - len(ids)) for ids in value])
+            for name, value in features.items()
+        }
+
+
+class TestRerankerBatches:
+    """Test suite for Reranker._predict batching."""
+
+    @pytest.fixture
+    def documents(self) -> list[str]:
+        """Documents of varying length, out of length order."""
+        lengths = (30, 2, 17, 2, 40, 9, 1)
+        return [" ".join(["w"] * n) + f" d{i}" for i, n in enumerate(lengths)]
+
+    def test_scores_in_input_order(
+        self, documents: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that scores follow the input order after length-sorted batching."""
+        monkeypatch.setattr(reranker, "_BATCH_SIZE", 3)
+        batches: list[dict[str, Any]] = []
+
+        def forward(batch: dict[str, Any]) -> np.ndarray:
+            batches.append(batch)
+            # Score each pair with its document's index (first token)
+            return batch["input_ids"][:, 0].astype(np.float32)
+
+        model = Reranker.__new__(Reranker)
+        model.session = object()
+        model.max_length = None
+        model.tokenizer = StubTokenizer(documents)
+        model._forward = forward  # type: ignore[method-assign]
+
+        scores = model._predict("query", documents)
+
+        assert scores == [float(i + 1) for i in range(len(documents))]
+        assert model.tokenizer.calls == 1
+        assert [len(batch["input_ids"]) for batch in batches] == [3, 3, 1]
+        assert all(batch["input_ids"].shape[1] % 16 == 0 for batch in batches)
+        lengths = [int((batch["attention_mask"]).sum(axis=1).max()) for batch in batches]
+        assert lengths == sorted(lengths)
+
+        ranked = model.rerank("query", documents, top_k=2)
+        assert [index for index, _ in ranked] == [6, 5]
+
+    def test_empty_documents(self) -> None:
+        """Test that no documents rank to an empty list without scoring."""
+        assert Reranker.__new__(Reranker).rerank("query", []) == []
+
+    def test_rejects_multi_label_models(self) -> None:
+        """Test that models with more than one output are refused."""
+        with pytest.raises(ValueError, match="3 labels"):
+            reranker._check_num_labels("model", 3)
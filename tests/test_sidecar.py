@@ -0,0 +1,211 @@
+"""
+Unit tests for long-lived external parser processes.
+"""
+
+import subprocess
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from leap.parsers import RubyParser
+from leap.parsers.sidecar import ParserSidecar, SidecarPool
+
+# Stand-in parser: echoes the path back as one entry, fails on "bad" paths,
+# emits an invalid entry for "invalid" paths, exits on "crash" paths and
+# never answers "hang" paths
+_SERVER = """
+import json, os, sys, time
+for line in sys.stdin:
+    path = json.loads(line)["path"]
+    if path.endswith("crash"):
+        sys.exit(1)
+    if path.endswith("hang"):
+        time.sleep(60)
+    if path.endswith("bad"):
+        response = {"error": "syntax error"}
+    else:
+        response = {"entries": [{
+            "language": "ruby", "file_path": path, "line_number": 1, "log_level": "info",
+            "log_template": "'x'", "code_context": "" if path.endswith("invalid") else "x",
+            "pid": os.getpid(),
+        }]}
+    print(json.dumps(response), flush=True)
+"""
+
+_COMMAND = [sys.executable, "-c", _SERVER]
+
+
+def _entry(output: bytes) -> dict[str, Any]:
+    """Decode the single entry of a stand-in response."""
+    return orjson.loads(output)["entries"][0]
+
+
+class TestParserSidecar:
+    """Test suite for ParserSidecar."""
+
+    @pytest.fixture
+    def sidecar(self) -> Iterator[ParserSidecar]:
+        """Create a sidecar running the stand-in parser."""
+        sidecar = ParserSidecar(_COMMAND)
+        yield sidecar
+        sidecar.close()
+
+    def test_reuses_process(self, sidecar: ParserSidecar) -> None:
+        """Test that consecutive requests are answered by the same process."""
+        first = _entry(sidecar.request(Path("a.rb")))
+        second = _entry(sidecar.request(Path("b.rb")))
+
+        assert [first["file_path"], second["file_path"]] == ["a.rb", "b.rb"]
+        assert first["pid"] == second["pid"]
+
+    def test_error_response(self, sidecar: ParserSidecar) -> None:
+        """Test that in-band errors are passed through and the process keeps serving."""
+        assert orjson.loads(sidecar.request(Path("file.bad"))) == {"error": "syntax error"}
+
+        assert _entry(sidecar.request(Path("a.rb")))["file_path"] == "a.rb"
+
+    def test_restarts_after_exit(self, sidecar: ParserSidecar) -> None:
+        """Test that a dead process is reported and replaced on the next request."""
+        pid = _entry(sidecar.request(Path("a.rb")))["pid"]
+        with pytest.raises(RuntimeError, match="exited unexpectedly"):
+            sidecar.request(Path("file.crash"))
+
+        assert _entry(sidecar.request(Path("a.rb")))["pid"] != pid
+
+    def test_request_many_pipelines(self, sidecar: ParserSidecar) -> None:
+        """Test that pipelined requests beyond one write batch are answered in order."""
+        paths = [Path(f"{'dir/' * 20}{i}.rb") for i in range(300)]
+
+        entries = [_entry(output) for output in sidecar.request_many(paths)]
+
+        assert [e["file_path"] for e in entries] == [str(p) for p in paths]
+        assert len({e["pid"] for e in entries}) == 1
+
+    def test_request_many_exit(self, sidecar: ParserSidecar) -> None:
+        """Test that a process dying mid-batch fails the batch and is replaced."""
+        with pytest.raises(RuntimeError, match="exited unexpectedly"):
+            sidecar.request_many([Path("a.rb"), Path("file.crash"), Path("b.rb")])
+
+        assert _entry(sidecar.request(Path("b.rb")))["file_path"] == "b.rb"
+
+    def test_timeout(self, sidecar: ParserSidecar) -> None:
+        """Test that a hung process is killed after the timeout."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            sidecar.request(Path("file.hang"), timeout=0.5)
+
+        assert _entry(sidecar.request(Path("a.rb")))["file_path"] == "a.rb"
+
+
+class TestSidecarPool:
+    """Test suite for SidecarPool."""
+
+    def test_sequential_use_starts_one_process(self) -> None:
+        """Test that a sequential caller never starts a second process."""
+        pool = SidecarPool(_COMMAND, size=4)
+        pids = {_entry(pool.request(Path(f"{i}.rb")))["pid"] for i in range(5)}
+        pool.close()
+
+        assert len(pids) == 1
+
+    def test_concurrent_requests(self) -> None:
+        """Test that concurrent callers are answered correctly."""
+        pool = SidecarPool(_COMMAND, size=2)
+        results: dict[int, str] = {}
+
+        def parse(i: int) -> None:
+            results[i] = _entry(pool.request(Path(f"{i}.rb")))["file_path"]
+
+        threads = [threading.Thread(target=parse, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        pool.close()
+
+        assert results == {i: f"{i}.rb" for i in range(8)}
+
+
+class TestSidecarStartup:
+    """Test suite for starting parser process pools."""
+
+    def test_start_failure_remembered(self) -> None:
+        """Test that a parser that cannot start is not retried for every file."""
+
+        class BrokenParser(RubyParser):
+            starts = 0
+
+            @classmethod
+            def _start_sidecars(cls) -> SidecarPool:
+                cls.starts += 1
+                raise RuntimeError("runtime not found")
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError, match="runtime not found"):
+                BrokenParser._sidecar_pool()
+
+        assert BrokenParser.starts == 1
+
+    def test_runtime_probe_runs_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the Ruby availability check is memoized."""
+        calls: list[int] = []
+
+        def probe() -> bool:
+            calls.append(1)
+            return True
+
+        monkeypatch.setattr(RubyParser, "_RUBY_AVAILABLE", None)
+        monkeypatch.setattr(RubyParser, "_probe_ruby", staticmethod(probe))
+
+        assert RubyParser.check_ruby_available()
+        assert RubyParser.check_ruby_available()
+        assert calls == [1]
+
+
+class TestRubyBatches:
+    """Test suite for RubyParser's pipelined batches."""
+
+    class StandInParser(RubyParser):
+        """RubyParser running the stand-in parser."""
+
+        @classmethod
+        def _start_sidecars(cls) -> SidecarPool:
+            return SidecarPool(_COMMAND, size=2)
+
+    @pytest.fixture
+    def parser(self) -> Iterator[RubyParser]:
+        """Create a parser whose processes are stopped afterwards."""
+        yield self.StandInParser()
+        if self.StandInParser._SIDECARS is not None:
+            self.StandInParser._SIDECARS.close()
+
+    @pytest.mark.parametrize("workers", [1, None])
+    def test_failures_are_isolated(
+        self, parser: RubyParser, tmp_path: Path, workers: int | None
+    ) -> None:
+        """Test that a crashing or missing file fails alone, in file order."""
+        names = ["a.rb", "file.crash", "b.rb", "missing.rb", "file.bad", "c.rb"]
+        for name in names:
+            if name != "missing.rb":
+                (tmp_path / name).write_text("logger.info('x')")
+
+        entries = parser.parse_files([tmp_path / name for name in names], workers)
+
+        assert [Path(e.file_path).name for e in entries] == ["a.rb", "b.rb", "c.rb"]
+
+    def test_strict_fails_on_invalid_entry(self, parser: RubyParser, tmp_path: Path) -> None:
+        """Test that an invalid entry is skipped leniently but fails a strict run."""
+        paths = [tmp_path / "a.rb", tmp_path / "file.invalid"]
+        for path in paths:
+            path.write_text("logger.info('x')")
+
+        entries = parser.parse_files(paths)
+
+        assert [Path(e.file_path).name for e in entries] == ["a.rb"]
+        with pytest.raises(ValidationError):
+            self.StandInParser(strict=True).parse_files(paths)